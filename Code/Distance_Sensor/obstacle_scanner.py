@@ -12,11 +12,21 @@ import tkinter as tk
 from tkinter import ttk, filedialog
 from easygopigo3 import EasyGoPiGo3
 import math
-import time
 from threading import Thread
 import configparser
 import os
 from PIL import ImageGrab
+from radar_projection import polar_to_screen, PointPool, CENTER_X, CENTER_Y
+from occupancy_grid import OccupancyGrid
+from servo_motion import ServoMotion
+from sweep_scheduler import SweepScheduler, SWEEP_MODES
+from scan_log import ScanLogWriter
+from odometry import Odometry
+
+# Every reading is appended to this binary log, see scan_log.py
+SCAN_LOG_FILE = 'obstacle_scans.bin'
+# Interleaved sweeps can read half degrees, one scan point for each
+SLOTS_PER_DEGREE = 2
 
 
 class ObstacleScanner(tk.Tk):
@@ -30,6 +40,8 @@ class ObstacleScanner(tk.Tk):
         self.gpg = EasyGoPiGo3()
         self.distance_sensor = self.gpg.init_distance_sensor("AD1")
         self.servo2 = self.gpg.init_servo("SERVO2")
+        # Wait only as long as each servo move needs
+        self.servo_motion = ServoMotion(self.servo2)
 
         # Load configuration
         self.config = configparser.ConfigParser()
@@ -38,14 +50,24 @@ class ObstacleScanner(tk.Tk):
 
         # Scanner settings
         self.scanning = False
+        self.calibrating = False
         self.scan_data = {}
         # Maximum distance to display (in cm)
         self.max_distance = 300
+        # Map that accumulates every sweep
+        self.grid = OccupancyGrid(max_range=self.max_distance)
+        # Wheel encoder pose, so readings land in the right place
+        # on the map if the robot moves between sweeps
+        self.odometry = Odometry(self.gpg, start=self.grid.pose)
+        self.odometry.start()
 
         # Create canvas for visualization
         self.canvas = tk.Canvas(self, width=860, height=600, bg='black')
         self.canvas.grid(row=0, column=0, pady=10, padx=10)
 
+        # Reusable scan point items, one for each possible servo angle
+        self.point_pool = PointPool(self.canvas, 180 * SLOTS_PER_DEGREE + 1)
+
         # Create all control panels at the bottom
         self.create_bottom_controls()
 
@@ -59,8 +81,8 @@ class ObstacleScanner(tk.Tk):
         self.canvas.delete("background")
 
         # Define the radar's center point.
-        center_x = 430
-        center_y = 550
+        center_x = CENTER_X
+        center_y = CENTER_Y
 
         # Draw concentric circles to represent distance from the center.
         # Increment by 50 cm.
@@ -127,33 +149,38 @@ class ObstacleScanner(tk.Tk):
                 tags="background"  # Tag for grouping.
             )
 
+        # Keep scan points on top of the redrawn background
+        self.canvas.tag_raise("scan_point")
+
 # --------------------------- PLOT POINT --------------------------------- #
     def plot_point(self, angle, distance):
         """Plot a point on the radar display"""
-        if distance > self.max_distance:
-            distance = self.max_distance
-
-        # Define radar's center point
-        center_x = 430
-        center_y = 550
-
-        radius = distance * 1.6
-
-        display_angle = angle - self.center_pos + 90
-        x = center_x + radius * math.cos(math.radians(display_angle))
-        y = center_y - radius * math.sin(math.radians(display_angle))
-
-        point_size = 5
-        self.canvas.create_oval(
-            x - point_size, y - point_size,
-            x + point_size, y + point_size,
-            fill='red', outline='red',
-            tags="scan_point"
-        )
+        self.scan_data[angle] = distance
+        # Only the point for this angle moves, one canvas call
+        x, y = polar_to_screen(
+            [angle], [distance], self.center_pos, self.max_distance)
+        self.point_pool.place([self.slot(angle)], x, y)
 
         # Uncomment for debugging
         self.lbl_plot_points.configure(
-            text=f"Distance: {distance}cm Angle: {angle}°")
+            text=f"Distance: {min(distance, self.max_distance)}cm Angle: {angle}°")
+
+# ---------------------------- PLOT SCAN --------------------------------- #
+    def plot_scan(self):
+        """Project all scan data in one call and move the pooled points
+        Only needed when the whole display changes, like a new center"""
+        if not self.scan_data:
+            return
+        angles = list(self.scan_data.keys())
+        distances = list(self.scan_data.values())
+        x, y = polar_to_screen(
+            angles, distances, self.center_pos, self.max_distance)
+        # One pool item for each servo angle
+        self.point_pool.place([self.slot(angle) for angle in angles], x, y)
+
+    def slot(self, angle):
+        """Pool item number for a servo angle"""
+        return round(angle * SLOTS_PER_DEGREE)
 
 # ------------------------ CALCULATE SCAN RANGE -------------------------- #
     def calculate_scan_range(self):
@@ -177,13 +204,44 @@ class ObstacleScanner(tk.Tk):
                 self.range_label.config(
                     text=f"Range: {self.left_limit}° (L) to {self.right_limit}° (R)")
                 self.draw_radar_background()
+                self.plot_scan()
+                self.create_sweep()
         except ValueError:
             self.center_spinbox.set(self.center_pos)
 
     def test_center_position(self):
         """Move servo to center position for testing"""
-        self.servo2.rotate_servo(self.center_pos)
-        time.sleep(1)
+        self.servo_motion.move(self.center_pos)
+
+# ------------------------- CALIBRATE SERVO ------------------------------ #
+    def calibrate_servo(self):
+        """Start measuring the servo slew rate on the scan thread,
+        calibrating sleeps for a few seconds"""
+        if self.scanning or self.calibrating:
+            return
+        self.calibrating = True
+        self.lbl_plot_points.configure(text="Calibrating servo...")
+        self.scan_thread = Thread(target=self.run_calibration)
+        self.scan_thread.daemon = True
+        self.scan_thread.start()
+
+    def run_calibration(self):
+        """Measure the servo slew rate and save it to the config file"""
+        try:
+            slew_rate = self.servo_motion.calibrate(
+                self.distance_sensor, self.right_limit, self.left_limit)
+            if slew_rate is None:
+                self.lbl_plot_points.configure(
+                    text="Calibration failed: point the sensor at a varied "
+                    "scene")
+            else:
+                self.servo_motion.save_config(self.config)
+                self.save_config()
+                self.lbl_plot_points.configure(
+                    text=f"Servo slew rate: {slew_rate:.0f}°/s")
+            self.servo_motion.move(self.center_pos)
+        finally:
+            self.calibrating = False
 
 # ----------------------- UPDATE RESOLUTION ------------------------------ #
     def update_resolution(self):
@@ -195,36 +253,47 @@ class ObstacleScanner(tk.Tk):
                 self.config.set('Servo', 'scan_resolution',
                                 str(self.scan_resolution))
                 self.save_config()
+                self.create_sweep()
         except ValueError:
             self.resolution_spinbox.set(self.scan_resolution)
 
+# ------------------------ UPDATE SWEEP MODE ----------------------------- #
+    def update_sweep_mode(self, event=None):
+        """Update the sweep mode"""
+        self.sweep_mode = self.mode_combobox.get()
+        self.config.set('Servo', 'sweep_mode', self.sweep_mode)
+        self.save_config()
+        self.create_sweep()
+
+# --------------------------- CREATE SWEEP ------------------------------- #
+    def create_sweep(self):
+        """Create the sweep scheduler from the current settings"""
+        self.sweep = SweepScheduler(
+            self.left_limit, self.right_limit, self.scan_resolution,
+            self.sweep_mode, self.center_pos, self.focus_width)
+
 # ----------------------------- SCAN ------------------------------------- #
     def scan(self):
         """Perform the scanning operation"""
-        while self.scanning:
-            # Scan from left to right
-            for angle in range(self.left_limit, self.right_limit - 1, -self.scan_resolution):
-                if not self.scanning:
-                    break
-                self.servo2.rotate_servo(angle)
-                time.sleep(0.1)
-                distance = self.distance_sensor.read_mm() / 10
-                self.scan_data[angle] = distance
-                self.plot_point(angle, distance)
-
-            # Scan from right to left
-            for angle in range(self.right_limit, self.left_limit + 1, self.scan_resolution):
-                if not self.scanning:
-                    break
-                self.servo2.rotate_servo(angle)
-                time.sleep(0.1)
-                distance = self.distance_sensor.read_mm() / 10
-                self.scan_data[angle] = distance
-                self.plot_point(angle, distance)
+        with ScanLogWriter(SCAN_LOG_FILE) as scan_log:
+            while self.scanning:
+                # Each pass alternates direction, see sweep_scheduler.py
+                for angle in self.sweep.next_pass():
+                    if not self.scanning:
+                        break
+                    self.servo_motion.move(angle)
+                    distance_mm = self.distance_sensor.read_mm()
+                    self.grid.set_pose(*self.odometry.pose[1:])
+                    scan_log.write(angle, distance_mm, self.grid.pose)
+                    distance = distance_mm / 10
+                    self.grid.update(angle, distance, self.center_pos)
+                    self.plot_point(angle, distance)
 
 # -------------------------- TOGGLE SCAN --------------------------------- #
     def toggle_scan(self):
         """Start or stop the scanning process"""
+        if self.calibrating:
+            return
         if not self.scanning:
             self.scanning = True
             self.start_button.config(text="Stop Scan")
@@ -238,8 +307,9 @@ class ObstacleScanner(tk.Tk):
 # --------------------------- CLEAR SCAN --------------------------------- #
     def clear_scan(self):
         """Clear all scan points from the display"""
-        self.canvas.delete("scan_point")
+        self.point_pool.clear()
         self.scan_data = {}
+        self.grid.clear()
 
 # -------------------------- LOAD CONFIG --------------------------------- #
     def load_config(self):
@@ -251,12 +321,23 @@ class ObstacleScanner(tk.Tk):
             self.config.add_section('Servo')
             self.config.set('Servo', 'center_position', '90')
             self.config.set('Servo', 'scan_resolution', '2')
+            self.config.set('Servo', 'sweep_mode', 'serpentine')
+            self.config.set('Servo', 'focus_width', '30')
             self.save_config()
 
         self.center_pos = self.config.getint('Servo', 'center_position')
         self.servo2.rotate_servo(self.center_pos)
         self.scan_resolution = self.config.getint('Servo', 'scan_resolution')
+        # Older config files don't have the sweep settings
+        self.sweep_mode = self.config.get(
+            'Servo', 'sweep_mode', fallback='serpentine')
+        if self.sweep_mode not in SWEEP_MODES:
+            self.sweep_mode = 'serpentine'
+        self.focus_width = self.config.getint(
+            'Servo', 'focus_width', fallback=30)
+        self.servo_motion.load_config(self.config)
         self.calculate_scan_range()
+        self.create_sweep()
 
 # -------------------------- SAVE CONFIG --------------------------------- #
     def save_config(self):
@@ -333,6 +414,12 @@ class ObstacleScanner(tk.Tk):
             command=self.test_center_position
         ).grid(row=0, column=2, padx=2)
 
+        ttk.Button(
+            center_frame,
+            text="Calibrate",
+            command=self.calibrate_servo
+        ).grid(row=0, column=3, padx=2)
+
         # Resolution Control
         res_frame = ttk.Frame(config_frame)
         res_frame.grid(row=1, column=0, pady=2, sticky="w")
@@ -349,6 +436,22 @@ class ObstacleScanner(tk.Tk):
         self.resolution_spinbox.set(self.scan_resolution)
         self.resolution_spinbox.grid(row=0, column=1, padx=2)
 
+        # Sweep Mode Control
+        mode_frame = ttk.Frame(config_frame)
+        mode_frame.grid(row=3, column=0, pady=2, sticky="w")
+
+        ttk.Label(mode_frame, text="Sweep:").grid(
+            row=0, column=0, padx=2, sticky="w")
+        self.mode_combobox = ttk.Combobox(
+            mode_frame,
+            values=SWEEP_MODES,
+            width=10,
+            state="readonly"
+        )
+        self.mode_combobox.set(self.sweep_mode)
+        self.mode_combobox.bind("<<ComboboxSelected>>", self.update_sweep_mode)
+        self.mode_combobox.grid(row=0, column=1, padx=2)
+
         # Range Display
         self.range_label = ttk.Label(
             config_frame,
@@ -383,6 +486,7 @@ class ObstacleScanner(tk.Tk):
         """Clean up when the window is closed"""
         self.servo2.rotate_servo(self.center_pos)
         self.scanning = False
+        self.odometry.stop()
         self.servo2.reset_servo()
         self.destroy()
 
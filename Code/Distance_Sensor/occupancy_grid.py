@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    occupancy_grid.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Persistent occupancy grid built from distance sensor sweeps
+    Each cell holds the log-odds that it is occupied
+    Every beam marks the cells it passes through as free
+    and the cell it hits as occupied, only those cells are updated
+"""
+import numpy as np
+
+# Log-odds added to a cell for each hit or pass through
+L_OCCUPIED = 0.85
+L_FREE = -0.4
+# Clamp so cells can still change their mind later
+L_MAX = 3.5
+# Cells beyond this log-odds are displayed as occupied or free
+L_THRESHOLD = 0.3
+
+
+class OccupancyGrid:
+    """Log-odds occupancy grid stored in a NumPy array"""
+
+    def __init__(self, width_cm=300, height_cm=300, resolution_cm=1,
+                 max_range=300):
+        self.resolution = resolution_cm
+        self.cols = int(round(width_cm / resolution_cm))
+        self.rows = int(round(height_cm / resolution_cm))
+        # Readings at or past max_range are treated as "no obstacle"
+        self.max_range = max_range
+
+        # Row 0 is the bottom of the map (y = 0)
+        self.log_odds = np.zeros((self.rows, self.cols), dtype=np.float32)
+
+        # Default robot pose: bottom center facing up the map
+        # (x cm, y cm, heading degrees)
+        self.pose = (width_cm / 2, 0.0, 90.0)
+
+# ------------------------------ SET POSE -------------------------------- #
+    def set_pose(self, x, y, heading):
+        """Set the robot pose used for the following readings"""
+        self.pose = (x, y, heading)
+
+# ------------------------------- UPDATE --------------------------------- #
+    def update(self, angle, distance, forward=90):
+        """Add one reading, servo angle in degrees and distance in cm"""
+        x0, y0, heading = self.pose
+        # Servo angles above forward point to the left of the robot
+        beam = np.radians(heading + angle - forward)
+
+        hit = 0 < distance < self.max_range
+        length = min(distance, self.max_range) if distance > 0 else 0
+
+        # Sample the beam every half cell so no cell is skipped
+        step = self.resolution / 2
+        steps = np.arange(0.0, length + step, step)
+        xs = x0 + steps * np.cos(beam)
+        ys = y0 + steps * np.sin(beam)
+
+        cols = np.floor(xs / self.resolution).astype(np.intp)
+        rows = np.floor(ys / self.resolution).astype(np.intp)
+        inside = ((cols >= 0) & (cols < self.cols) &
+                  (rows >= 0) & (rows < self.rows))
+        cells = np.unique(rows[inside] * self.cols + cols[inside])
+
+        flat = self.log_odds.reshape(-1)
+        if hit and inside[-1]:
+            end = rows[-1] * self.cols + cols[-1]
+            free = cells[cells != end]
+            flat[end] = min(flat[end] + L_OCCUPIED, L_MAX)
+        else:
+            free = cells
+
+        flat[free] = np.maximum(flat[free] + L_FREE, -L_MAX)
+
+# ----------------------------- UPDATE SCAN ------------------------------ #
+    def update_scan(self, readings, forward=90):
+        """Add a list of {'angle': a, 'distance': d} scan results"""
+        for reading in readings:
+            self.update(reading['angle'], reading['distance'], forward)
+
+# ---------------------------- PROBABILITY ------------------------------- #
+    def probability(self):
+        """Return the occupancy probability of every cell"""
+        return 1 - 1 / (1 + np.exp(self.log_odds))
+
+# ------------------------------- CLEAR ---------------------------------- #
+    def clear(self):
+        """Forget everything, all cells return to unknown"""
+        self.log_odds.fill(0)
+
+# ------------------------------ TO CHARS -------------------------------- #
+    def to_chars(self, width, height, occupied='*', free='.', unknown=' '):
+        """Downsample the grid to a width x height list of character rows
+        Top row is the far end of the map, the robot is at the bottom"""
+        row_starts = np.linspace(0, self.rows, height, endpoint=False)
+        col_starts = np.linspace(0, self.cols, width, endpoint=False)
+        row_starts = row_starts.astype(np.intp)
+        col_starts = col_starts.astype(np.intp)
+
+        # Strongest evidence in each block wins
+        high = np.maximum.reduceat(
+            np.maximum.reduceat(self.log_odds, row_starts, axis=0),
+            col_starts, axis=1)
+        low = np.minimum.reduceat(
+            np.minimum.reduceat(self.log_odds, row_starts, axis=0),
+            col_starts, axis=1)
+
+        chars = np.full((height, width), unknown, dtype='<U1')
+        chars[low < -L_THRESHOLD] = free
+        chars[high > L_THRESHOLD] = occupied
+
+        # Flip so that the bottom of the map prints last
+        return [list(row) for row in chars[::-1]]
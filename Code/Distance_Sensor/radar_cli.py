@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 # Import required libraries
 from easygopigo3 import EasyGoPiGo3
-from time import sleep
 # Import math library for trigonometric calculations
 from math import cos, sin, radians
+# Import the occupancy grid shared with the other radar displays
+from occupancy_grid import OccupancyGrid
+# Import the servo motion model for adaptive settle times
+from servo_motion import load_servo_motion, save_servo_motion
+# Import the binary scan log writer
+from scan_log import ScanLogWriter
 LEFT = 20
 RIGHT = 170
 FORWARD = 85
@@ -25,19 +30,32 @@ class DistanceScanner:
         # These are the angles (in degrees) where the servo will take measurements
         self.scan_range = range(LEFT, RIGHT, LEFT)
 
-        # Time to wait after moving servo (in seconds)
-        # This gives the servo time to reach its position
-        self.servo_delay = 0.1
+        # Wait after moving the servo only as long as the move needs
+        # Small steps settle much faster than a full swing
+        self.servo_motion = load_servo_motion(self.servo2)
 
         # Create an empty list to store scan results
         self.scan_results = []
 
+        # Map that keeps every scan, not just the last one
+        self.grid = OccupancyGrid()
+
+        # Every reading is also appended to a binary log file
+        self.scan_log = ScanLogWriter('radar_scans.bin')
+
     def move_servo(self, angle):
         """Move servo to specified angle and wait for it to reach position"""
-        # Tell the servo motor to move to the specified angle
-        self.servo2.rotate_servo(angle)
-        # Wait for the servo to reach its position
-        sleep(self.servo_delay)
+        # Move the servo and wait for it to reach its position
+        self.servo_motion.move(angle)
+
+    def calibrate_servo(self):
+        """Measure the servo slew rate and save it for the next run"""
+        slew_rate = self.servo_motion.calibrate(self.distance_sensor)
+        if slew_rate is None:
+            print("Calibration failed: point the sensor at a varied scene")
+        else:
+            save_servo_motion(self.servo_motion)
+            print(f"Servo slew rate: {slew_rate:.0f} degrees per second")
 
     def take_measurement(self):
         """Take a distance measurement and return it in centimeters"""
@@ -65,9 +83,16 @@ class DistanceScanner:
                 'distance': distance
             })
 
+            # Add the reading to the occupancy grid and the log file
+            self.grid.update(angle, distance, FORWARD)
+            self.scan_log.write(angle, distance * 10, self.grid.pose)
+
             # Print the current measurement
             print(f"Angle: {angle}°, Distance: {distance:.1f}cm")
 
+        # Save this scan to the log file
+        self.scan_log.flush()
+
         # After scanning, return servo to center position (90 degrees)
         self.move_servo(90)
 
@@ -141,7 +166,24 @@ class DistanceScanner:
         print("Maximum visualization range: 200cm")
         print("'+' marks show 50cm, 100cm, 150cm, and 200cm distances")
 
+    def print_grid_visualization(self):
+        """Print the occupancy grid built from all scans so far"""
+        width = 41
+        height = 21
+        grid = self.grid.to_chars(width, height)
+        # Place robot marker 'R' at center bottom
+        grid[height - 1][width // 2] = 'R'
+
+        print("\nOccupancy Grid (all scans):")
+        print("'*' occupied, '.' free, blank not seen yet\n")
+        border = '+' + '-' * width + '+'
+        print(border)
+        for row in grid:
+            print('|' + ''.join(row) + '|')
+        print(border)
+
     def reset(self):
+        self.scan_log.close()
         self.servo2.disable_servo()
         self.gpg.reset_all()
 
@@ -154,11 +196,19 @@ def main():
         # Main program loop
         while True:
             # Wait for user to press Enter
-            input("Press Enter to perform a scan (Ctrl+C to exit)...")
+            choice = input(
+                "Press Enter to perform a scan, c to calibrate the servo "
+                "(Ctrl+C to exit)...")
+            # Measure the servo speed once, it is saved for next time
+            if choice.strip().lower() == 'c':
+                scanner.calibrate_servo()
+                continue
             # Perform scan and get results
             scanner.perform_scan()
             # Show visualization of results
             scanner.print_ascii_visualization()
+            # Show the map built from every scan
+            scanner.print_grid_visualization()
 
     except KeyboardInterrupt:
         # If user presses Ctrl+C, exit gracefully
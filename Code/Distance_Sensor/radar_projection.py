@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    radar_projection.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Batched polar to screen projection for the radar display
+    Project a whole sweep of (angle, distance) readings with NumPy
+    Draw the points with a fixed pool of reusable canvas items
+"""
+import numpy as np
+
+# Radar center point on the canvas
+CENTER_X = 430
+CENTER_Y = 550
+# Pixels per cm
+SCALE = 1.6
+
+
+# ------------------------- POLAR TO SCREEN ------------------------------ #
+def polar_to_screen(angles, distances, center_pos, max_distance,
+                    center_x=CENTER_X, center_y=CENTER_Y, scale=SCALE):
+    """Convert servo angles and distances (cm) to canvas x, y arrays"""
+    angles = np.asarray(angles, dtype=np.float64)
+    # Distances beyond the display range are drawn on the outer ring
+    distances = np.minimum(
+        np.asarray(distances, dtype=np.float64), max_distance)
+
+    radius = distances * scale
+    # Offset so the servo center position points straight up
+    display_angle = np.radians(angles - center_pos + 90)
+
+    x = center_x + radius * np.cos(display_angle)
+    y = center_y - radius * np.sin(display_angle)
+    return x, y
+
+
+class PointPool:
+    """Fixed pool of canvas ovals that are moved instead of recreated"""
+
+    def __init__(self, canvas, size, point_size=5, color='red',
+                 tags="scan_point"):
+        self.canvas = canvas
+        self.point_size = point_size
+        self.color = color
+        self.tags = tags
+        self.items = []
+        # Items that are shown
+        self.shown = set()
+        self.grow(size)
+
+# ------------------------------- GROW ----------------------------------- #
+    def grow(self, size):
+        """Create hidden items until the pool holds size items"""
+        while len(self.items) < size:
+            item = self.canvas.create_oval(
+                0, 0, 0, 0,
+                fill=self.color, outline=self.color,
+                state='hidden',
+                tags=self.tags
+            )
+            self.items.append(item)
+
+# ------------------------------- PLACE ---------------------------------- #
+    def place(self, slots, x, y):
+        """Move only the items numbered slots, for example one per
+        servo angle, the other items are not touched"""
+        self.grow(max(slots) + 1)
+        size = self.point_size
+        for slot, point_x, point_y in zip(slots, np.asarray(x).tolist(),
+                                          np.asarray(y).tolist()):
+            item = self.items[slot]
+            self.canvas.coords(item, point_x - size, point_y - size,
+                               point_x + size, point_y + size)
+            if slot not in self.shown:
+                self.canvas.itemconfigure(item, state='normal')
+                self.shown.add(slot)
+
+# ------------------------------- CLEAR ---------------------------------- #
+    def clear(self):
+        """Hide every item in the pool"""
+        self.canvas.itemconfigure(self.tags, state='hidden')
+        self.shown = set()
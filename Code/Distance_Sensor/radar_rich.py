@@ -1,10 +1,11 @@
 from easygopigo3 import EasyGoPiGo3
-from time import sleep
 from math import cos, sin, radians
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 from rich.layout import Layout
+from occupancy_grid import OccupancyGrid
+from servo_motion import load_servo_motion, save_servo_motion
 
 
 class DistanceScanner:
@@ -13,14 +14,25 @@ class DistanceScanner:
         self.distance_sensor = self.gpg.init_distance_sensor("AD1")
         self.servo2 = self.gpg.init_servo("SERVO2")
         self.scan_range = range(20, 160, 20)
-        self.servo_delay = 0.1
+        # Servo settle time is based on how far each move is
+        self.servo_motion = load_servo_motion(self.servo2)
         self.scan_results = []
+        # Map that keeps every scan, not just the last one
+        self.grid = OccupancyGrid()
         self.console = Console()
 
     def move_servo(self, angle):
         """Move servo to specified angle and wait for it to reach position"""
-        self.servo2.rotate_servo(angle)
-        sleep(self.servo_delay)
+        self.servo_motion.move(angle)
+
+    def calibrate_servo(self):
+        """Measure the servo slew rate and save it for the next run"""
+        slew_rate = self.servo_motion.calibrate(self.distance_sensor)
+        if slew_rate is None:
+            self.console.print("Calibration failed: point the sensor at a varied scene")
+        else:
+            save_servo_motion(self.servo_motion)
+            self.console.print(f"Servo slew rate: {slew_rate:.0f} degrees per second")
 
     def take_measurement(self):
         """Take a distance measurement and return it in centimeters"""
@@ -38,6 +50,7 @@ class DistanceScanner:
                 'angle': angle,
                 'distance': distance
             })
+            self.grid.update(angle, distance)
             msg = f"[green]Angle:[/green] [yellow]{angle}°[/yellow], "
             msg += f"[green]Distance:[/green]"
             msg += f"[yellow]{distance:.1f}cm[/yellow]"
@@ -139,6 +152,50 @@ class DistanceScanner:
         # Print the final visualization
         self.console.print(panel)
 
+    def print_grid_visualization(self):
+        """Create a rich visualization of the occupancy grid"""
+        width = 41
+        height = 21
+        grid = self.grid.to_chars(width, height)
+        grid[height - 1][width // 2] = 'R'
+
+        viz_text = Text()
+        border = '+' + '-' * width + '+'
+        viz_text.append(border + '\n', style="bright_blue")
+
+        for row in grid:
+            line = Text()
+            line.append('|', style="bright_blue")
+            for char in row:
+                if char == 'R':
+                    line.append(char, style="bold red")
+                elif char == '*':
+                    line.append(char, style="bold yellow")
+                elif char == '.':
+                    line.append(char, style="green")
+                else:
+                    line.append(char)
+            line.append('|', style="bright_blue")
+            viz_text.append(line)
+            viz_text.append('\n')
+
+        viz_text.append(border, style="bright_blue")
+
+        legend = Text()
+        legend.append("\nLegend:\n", style="bold")
+        legend.append("* ", style="bold yellow")
+        legend.append("- Occupied\n")
+        legend.append(". ", style="green")
+        legend.append("- Free space\n")
+        legend.append("\nMap: 300cm x 300cm, all scans so far")
+
+        panel = Panel(
+            viz_text + legend,
+            title="[bold]Occupancy Grid[/bold]",
+            border_style="bright_blue"
+        )
+        self.console.print(panel)
+
     def reset(self):
         self.servo2.disable_servo()
         self.gpg.reset_all()
@@ -151,10 +208,14 @@ def main():
     try:
         while True:
             console.print(
-                "\n[bold cyan]Press Enter to perform a scan (Ctrl+C to exit)...[/bold cyan]")
-            input()
+                "\n[bold cyan]Press Enter to perform a scan, "
+                "c to calibrate the servo (Ctrl+C to exit)...[/bold cyan]")
+            if input().strip().lower() == 'c':
+                scanner.calibrate_servo()
+                continue
             results = scanner.perform_scan()
             scanner.print_ascii_visualization()
+            scanner.print_grid_visualization()
 
     except KeyboardInterrupt:
         console.print("\n[bold red]Scanning terminated by user[/bold red]")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    scan_log.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Compact binary log of distance sensor scans
+    Every reading is one fixed size record appended to the file
+    (timestamp, servo angle, distance in mm, robot pose x, y, heading)
+    read_scan_log memory maps the file as a NumPy structured array
+    Run this file with a log file name to print a summary
+"""
+import os
+import sys
+import struct
+import time
+
+import numpy as np
+
+MAGIC = b'GPGSCAN1'
+VERSION = 1
+# Magic, version, record size
+HEADER = struct.Struct('<8sII')
+
+# Little-endian, no padding, 26 bytes per reading
+RECORD = struct.Struct('<dfHfff')
+RECORD_DTYPE = np.dtype([
+    ('time', '<f8'),        # Seconds since the epoch
+    ('angle', '<f4'),       # Servo angle in degrees
+    ('distance', '<u2'),    # Distance in mm
+    ('x', '<f4'),           # Robot pose in cm
+    ('y', '<f4'),
+    ('heading', '<f4'),     # Robot heading in degrees
+])
+# Largest distance that fits in a record
+MAX_MM = 0xFFFF
+
+
+class ScanLogWriter:
+    """Append readings to a binary scan log"""
+
+    def __init__(self, file_name):
+        self.file_name = file_name
+        self.file = open(file_name, 'ab')
+        # New file, write the header first
+        if self.file.tell() == 0:
+            self.file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+
+# ------------------------------- WRITE ---------------------------------- #
+    def write(self, angle, distance_mm, pose=(0.0, 0.0, 90.0),
+              timestamp=None):
+        """Append one reading"""
+        if timestamp is None:
+            timestamp = time.time()
+        distance_mm = min(max(int(distance_mm), 0), MAX_MM)
+        x, y, heading = pose
+        self.file.write(RECORD.pack(
+            timestamp, angle, distance_mm, x, y, heading))
+
+# ------------------------------- FLUSH ---------------------------------- #
+    def flush(self):
+        """Push buffered records to the file"""
+        self.file.flush()
+
+# ------------------------------- CLOSE ---------------------------------- #
+    def close(self):
+        """Flush and close the log file"""
+        if not self.file.closed:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+# --------------------------- READ SCAN LOG ------------------------------ #
+def read_scan_log(file_name):
+    """Memory map a scan log as a read only NumPy structured array"""
+    with open(file_name, 'rb') as log_file:
+        magic, version, record_size = HEADER.unpack(
+            log_file.read(HEADER.size))
+    if magic != MAGIC or record_size != RECORD_DTYPE.itemsize:
+        raise ValueError(f"{file_name} is not a scan log")
+
+    # Ignore a partly written last record
+    count = (os.path.getsize(file_name) - HEADER.size) // record_size
+    if count == 0:
+        return np.zeros(0, dtype=RECORD_DTYPE)
+    return np.memmap(file_name, dtype=RECORD_DTYPE, mode='r',
+                     offset=HEADER.size, shape=(count,))
+
+
+def main():
+    """Print a summary of a scan log"""
+    if len(sys.argv) < 2:
+        print("Usage: python3 scan_log.py scan_log_file")
+        return
+
+    records = read_scan_log(sys.argv[1])
+    print(f"Readings: {len(records)}")
+    if len(records) == 0:
+        return
+
+    duration = records['time'][-1] - records['time'][0]
+    print(f"Duration: {duration:.1f} seconds")
+    print(f"Angles:   {records['angle'].min():.0f}° to "
+          f"{records['angle'].max():.0f}°")
+    print(f"Distance: {records['distance'].min()} mm to "
+          f"{records['distance'].max()} mm, "
+          f"mean {records['distance'].mean():.0f} mm")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    sweep_scheduler.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Decide which servo angles each scanner pass visits
+    serpentine:  back and forth, the turnaround angle is only read once
+    interleaved: every angle at the scan resolution on one pass, the
+                 half steps in between on the next, twice the resolution
+                 every two passes that each take as long as serpentine
+                 An odd resolution gives half degree angles
+    focus:       full resolution around the focus center,
+                 coarse steps everywhere else
+"""
+
+SWEEP_MODES = ('serpentine', 'interleaved', 'focus')
+# Outside the focus region take one reading every COARSE_FACTOR steps
+COARSE_FACTOR = 3
+
+
+class SweepScheduler:
+    """Produce the list of servo angles for each pass of the scanner"""
+
+    def __init__(self, left_limit, right_limit, resolution,
+                 mode='serpentine', focus_center=None, focus_width=30):
+        if mode not in SWEEP_MODES:
+            raise ValueError(f"Unknown sweep mode: {mode}")
+        # Left is the larger servo angle
+        self.left_limit = left_limit
+        self.right_limit = right_limit
+        self.resolution = resolution
+        self.mode = mode
+        if focus_center is None:
+            focus_center = (left_limit + right_limit) // 2
+        self.focus_center = focus_center
+        self.focus_width = focus_width
+
+        self.pass_count = 0
+        # Angle the previous pass finished on
+        self.last_angle = None
+
+# ------------------------------ NEXT PASS ------------------------------- #
+    def next_pass(self):
+        """Return the angles for the next pass, alternating direction"""
+        if self.mode == 'interleaved':
+            angles = self.interleaved_angles()
+        elif self.mode == 'focus':
+            angles = self.focus_angles()
+        else:
+            angles = self.serpentine_angles()
+
+        # Even passes go left to right, odd passes right to left
+        if self.pass_count % 2:
+            angles.reverse()
+
+        # The servo is already at the turnaround angle, don't read it twice
+        if angles and angles[0] == self.last_angle:
+            angles = angles[1:]
+        if angles:
+            self.last_angle = angles[-1]
+
+        self.pass_count += 1
+        return angles
+
+# --------------------------- SERPENTINE ANGLES -------------------------- #
+    def serpentine_angles(self):
+        """Every angle at the scan resolution, left to right"""
+        return list(range(self.left_limit, self.right_limit - 1,
+                          -self.resolution))
+
+# -------------------------- INTERLEAVED ANGLES -------------------------- #
+    def interleaved_angles(self):
+        """Every angle at the scan resolution, shifted by half a step
+        on alternate passes, so two passes read every half step"""
+        if self.pass_count % 2 == 0:
+            return self.serpentine_angles()
+        # Whole degrees stay ints, an odd resolution needs half degrees
+        offset = self.resolution / 2
+        if offset == int(offset):
+            offset = int(offset)
+        angles = []
+        angle = self.left_limit - offset
+        while angle >= self.right_limit:
+            angles.append(angle)
+            angle -= self.resolution
+        return angles
+
+# ----------------------------- FOCUS ANGLES ----------------------------- #
+    def focus_angles(self):
+        """Fine steps inside the focus region, coarse steps outside"""
+        half_width = self.focus_width // 2
+        focus_left = min(self.left_limit, self.focus_center + half_width)
+        focus_right = max(self.right_limit, self.focus_center - half_width)
+
+        coarse = range(self.left_limit, self.right_limit - 1,
+                       -self.resolution * COARSE_FACTOR)
+        fine = range(focus_left, focus_right - 1, -self.resolution)
+
+        angles = {angle for angle in coarse
+                  if not focus_right <= angle <= focus_left}
+        angles.update(fine)
+        return sorted(angles, reverse=True)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    sweep_scheduler_test.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Check the sweep modes in sweep_scheduler.py without a robot
+    Two interleaved passes must read every half step between the limits,
+    each pass no longer than a serpentine pass
+    Usage: python3 sweep_scheduler_test.py
+    Exits with 1 if a check fails
+"""
+import sys
+
+from sweep_scheduler import SweepScheduler
+
+
+def full_grid(left, right, step):
+    """Every angle from left down to right, step apart"""
+    angles = set()
+    angle = left
+    while angle >= right:
+        angles.add(angle)
+        angle -= step
+    return angles
+
+
+def check_interleaved(left, right, resolution):
+    """Return a list of problems with two interleaved passes"""
+    problems = []
+    sweep = SweepScheduler(left, right, resolution, 'interleaved')
+    serpentine = SweepScheduler(left, right, resolution, 'serpentine')
+    first = sweep.next_pass()
+    second = sweep.next_pass()
+
+    expected = full_grid(left, right, resolution / 2)
+    missing = expected - set(first) - set(second)
+    if missing:
+        problems.append(f"missing {sorted(missing, reverse=True)[:5]}")
+    if set(first) & set(second):
+        problems.append("the passes read the same angles")
+    if max(len(first), len(second)) > len(serpentine.next_pass()):
+        problems.append("a pass is longer than a serpentine pass")
+    outside = [a for a in first + second if not right <= a <= left]
+    if outside:
+        problems.append(f"outside the limits {outside}")
+    return problems
+
+
+def main():
+    failed = 0
+    for left, right in ((180, 0), (150, 30), (135, 45)):
+        for resolution in range(1, 11):
+            problems = check_interleaved(left, right, resolution)
+            if problems:
+                failed += 1
+                print(f"FAIL {left}-{right} resolution {resolution}: "
+                      f"{'; '.join(problems)}")
+    if failed:
+        print(f"{failed} interleaved sweep(s) failed")
+        return 1
+    print("Interleaved sweeps cover every half step")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
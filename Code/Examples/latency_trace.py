@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    latency_trace.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Measure how long a key press or stick move takes
+    to reach the motors
+    Each command is timed at four stages:
+        event     the OS event, only when the event has a time (Tkinter)
+        handler   the program's handler starts
+        decision  the program has worked out the wheel speeds
+        write     set_motor_dps() returns, the SPI write is done
+    Tracing is off unless GOPIGO_LATENCY_TRACE is set to a CSV file name
+        GOPIGO_LATENCY_TRACE=latency.csv python3 rc_gui.py
+    When the program exits it prints p50/p95/p99 for each stage,
+    writes every command to the CSV file and the percentiles
+    to the same name ending in _summary.csv
+    Works with the real robot or with the simulator on PYTHONPATH
+    Tkinter event times come from the X server clock, so the event stage
+    is measured from the fastest event seen, not from an absolute zero
+"""
+import atexit
+import csv
+import math
+import os
+import time
+from threading import Lock
+
+STAGES = ('event', 'handler', 'decision', 'write')
+# (from stage, to stage, name) for each time that is reported
+INTERVALS = (
+    ('event', 'handler', 'event_to_handler'),
+    ('handler', 'decision', 'handler_to_decision'),
+    ('decision', 'write', 'decision_to_write'),
+    (None, 'write', 'total'),
+)
+
+
+def percentile(values, percent):
+    """Nearest rank percentile of a sorted list"""
+    index = math.ceil(percent / 100 * len(values)) - 1
+    return values[max(0, min(len(values) - 1, index))]
+
+
+class LatencyTracer:
+    """Time stamps for each command from input to motor write"""
+
+    def __init__(self, csv_file=None, expire=1.0):
+        # Tracing does nothing without a file to write
+        self.enabled = csv_file is not None
+        self.csv_file = csv_file
+        # Commands that got no motor write in this many seconds
+        # were coalesced or dropped
+        self.expire = expire
+        self.lock = Lock()
+        self.pending = []
+        self.samples = []
+        self.no_write = 0
+        # Smallest (now - event time) seen for each source, ms
+        self.event_offset = {}
+
+# -------------------------------- WRAP ---------------------------------- #
+    def wrap(self, gpg):
+        """Time stamp every set_motor_dps() call on this GoPiGo3"""
+        set_motor_dps = gpg.set_motor_dps
+
+        def traced_set_motor_dps(port, dps):
+            set_motor_dps(port, dps)
+            self.write_done()
+
+        # forward(), stop() and the rest call set_motor_dps() too
+        gpg.set_motor_dps = traced_set_motor_dps
+
+# -------------------------------- BEGIN --------------------------------- #
+    def begin(self, source, event_time_ms=None):
+        """Start timing a command when its handler starts
+        event_time_ms is the OS event time, for example event.time"""
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        trace = {'source': source, 'handler': now}
+        if event_time_ms is not None:
+            # The event clock has its own zero, line it up with ours
+            delay = now * 1000 - event_time_ms
+            offset = min(delay, self.event_offset.get(source, delay))
+            self.event_offset[source] = offset
+            trace['event'] = now - (delay - offset) / 1000
+        return trace
+
+# ------------------------------- DECISION ------------------------------- #
+    def decision(self, trace):
+        """The wheel speeds are known, now wait for the motor write"""
+        if trace is None:
+            return
+        trace['decision'] = time.monotonic()
+        with self.lock:
+            self.pending.append(trace)
+
+# ------------------------------ WRITE DONE ------------------------------ #
+    def write_done(self):
+        """A motor write returned, finish every command waiting for it
+        The write may happen on another thread, like MotorCommander's"""
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        with self.lock:
+            for trace in self.pending:
+                if now - trace['decision'] > self.expire:
+                    self.no_write += 1
+                    continue
+                trace['write'] = now
+                self.samples.append(trace)
+            self.pending = []
+
+# ------------------------------- SUMMARY -------------------------------- #
+    def summary(self):
+        """{(source, interval): (count, p50, p95, p99, max)} in ms"""
+        times = {}
+        for trace in self.samples:
+            start = trace.get('event', trace['handler'])
+            for first, last, name in INTERVALS:
+                begin = start if first is None else trace.get(first)
+                if begin is None or last not in trace:
+                    continue
+                times.setdefault((trace['source'], name), []).append(
+                    (trace[last] - begin) * 1000)
+
+        results = {}
+        for key, values in sorted(times.items()):
+            values.sort()
+            results[key] = (len(values), percentile(values, 50),
+                            percentile(values, 95), percentile(values, 99),
+                            values[-1])
+        return results
+
+# -------------------------------- REPORT -------------------------------- #
+    def report(self):
+        """Print the percentiles"""
+        print(f"{'Source':10} {'Interval':20} {'Count':>6} {'p50':>8} "
+              f"{'p95':>8} {'p99':>8} {'max':>8}  (ms)")
+        for (source, name), (count, *values) in self.summary().items():
+            print(f"{source:10} {name:20} {count:6d} " +
+                  " ".join(f"{value:8.2f}" for value in values))
+        print(f"Commands with no motor write: {self.no_write}")
+
+# ------------------------------- WRITE CSV ------------------------------ #
+    def write_csv(self):
+        """Every command, times in ms from the handler start,
+        and the percentiles in a _summary file"""
+        with open(self.csv_file, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['source'] + [f"{stage}_ms" for stage in STAGES])
+            for trace in self.samples:
+                writer.writerow([trace['source']] + [
+                    f"{(trace[stage] - trace['handler']) * 1000:.3f}"
+                    if stage in trace else '' for stage in STAGES])
+
+        root, extension = os.path.splitext(self.csv_file)
+        with open(f"{root}_summary{extension or '.csv'}", 'w',
+                  newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['source', 'interval', 'count',
+                             'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'])
+            for (source, name), (count, *values) in self.summary().items():
+                writer.writerow([source, name, count] +
+                                [f"{value:.3f}" for value in values])
+
+# -------------------------------- CLOSE --------------------------------- #
+    def close(self):
+        """Report and save, runs when the program exits"""
+        if not self.enabled or not self.samples:
+            return
+        # Whatever is still waiting never reached the motors
+        self.no_write += len(self.pending)
+        self.report()
+        self.write_csv()
+        print(f"Latency trace saved to {self.csv_file}")
+
+
+def get_tracer(gpg):
+    """Tracer for this program, turned on by GOPIGO_LATENCY_TRACE"""
+    tracer = LatencyTracer(os.environ.get('GOPIGO_LATENCY_TRACE'))
+    if tracer.enabled:
+        tracer.wrap(gpg)
+        atexit.register(tracer.close)
+    return tracer
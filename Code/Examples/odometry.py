@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    odometry.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Keep track of where the GoPiGo3 is from its wheel encoders
+    Both encoders are read many times a second on a background thread
+    The change in each wheel gives the distance driven and the turn,
+    which are added up into a pose (x cm, y cm, heading degrees)
+    Heading 0 points along the x axis, positive headings turn left
+    The IMU heading can be mixed in to correct wheel slip on turns
+    Run this file and push the robot around to see the pose
+"""
+import math
+import time
+from collections import namedtuple
+from threading import Thread, Event
+
+# Pose with the monotonic time it was measured
+Pose = namedtuple('Pose', 'time x y heading')
+
+
+def angle_difference(a, b):
+    """Smallest angle from b to a in degrees, -180 to 180"""
+    return (a - b + 180) % 360 - 180
+
+
+class Odometry:
+    """Differential drive pose from the wheel encoders"""
+
+    def __init__(self, gpg, rate=100, imu=None, imu_weight=0.02,
+                 imu_interval=0.1, start=(0.0, 0.0, 0.0)):
+        self.gpg = gpg
+        self.interval = 1 / rate
+        # Optional EasyIMUSensor, None to use the encoders only
+        self.imu = imu
+        # How much of the IMU heading is mixed in on each IMU read
+        self.imu_weight = imu_weight
+        self.imu_interval = imu_interval
+        # Wheel size from the GoPiGo3 library, mm converted to cm
+        self.cm_per_degree = gpg.WHEEL_DIAMETER * math.pi / 3600
+        self.wheel_base = gpg.WHEEL_BASE_WIDTH / 10
+
+        self.subscribers = []
+        self.stop_event = Event()
+        self.thread = None
+        self.last_encoders = None
+        self.imu_offset = None
+        self.next_imu = 0
+        self.imu_errors = 0
+        # The pose is replaced as a whole, never changed in place
+        self.pose = Pose(time.monotonic(), *start)
+
+# ------------------------------ SUBSCRIBE ------------------------------- #
+    def subscribe(self, callback):
+        """Call callback(pose) after every update
+        The callback runs on the odometry thread, keep it short"""
+        self.subscribers.append(callback)
+
+# -------------------------------- RESET --------------------------------- #
+    def reset(self, x=0.0, y=0.0, heading=0.0):
+        """Set the pose, the next encoder reading starts from here"""
+        self.last_encoders = None
+        self.imu_offset = None
+        self.pose = Pose(time.monotonic(), x, y, heading)
+
+# -------------------------------- START --------------------------------- #
+    def start(self):
+        """Start the polling thread"""
+        self.stop_event.clear()
+        self.thread = Thread(target=self.poll_loop, daemon=True)
+        self.thread.start()
+
+# --------------------------------- STOP --------------------------------- #
+    def stop(self):
+        """Stop the polling thread and wait for it"""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=2)
+
+# ------------------------------ POLL LOOP ------------------------------- #
+    def poll_loop(self):
+        """Update the pose at a fixed rate"""
+        next_update = time.monotonic()
+        while not self.stop_event.is_set():
+            self.update()
+            # Skip missed updates instead of catching up in a burst
+            next_update = max(next_update + self.interval, time.monotonic())
+            if self.stop_event.wait(next_update - time.monotonic()):
+                break
+
+# ------------------------------- UPDATE --------------------------------- #
+    def update(self):
+        """Read the encoders once and move the pose"""
+        left, right = self.gpg.read_encoders()
+        now = time.monotonic()
+        if self.last_encoders is None:
+            self.last_encoders = (left, right)
+            return self.pose
+        last_left, last_right = self.last_encoders
+        self.last_encoders = (left, right)
+
+        # Wheel travel in cm since the last update
+        left_cm = (left - last_left) * self.cm_per_degree
+        right_cm = (right - last_right) * self.cm_per_degree
+        distance = (left_cm + right_cm) / 2
+        turn = math.degrees((right_cm - left_cm) / self.wheel_base)
+
+        _, x, y, heading = self.pose
+        # Move along the average heading during this update
+        middle = math.radians(heading + turn / 2)
+        x += distance * math.cos(middle)
+        y += distance * math.sin(middle)
+        heading = self.fuse_imu(heading + turn, now)
+
+        self.pose = Pose(now, x, y, heading % 360)
+        for callback in self.subscribers:
+            callback(self.pose)
+        return self.pose
+
+# ------------------------------ FUSE IMU -------------------------------- #
+    def fuse_imu(self, heading, now):
+        """Pull the heading a little toward the IMU heading"""
+        if self.imu is None or now < self.next_imu:
+            return heading
+        self.next_imu = now + self.imu_interval
+        try:
+            # Compass heading turns clockwise, ours turns counterclockwise
+            imu_heading = -self.imu.safe_read_euler()[0]
+        except Exception:
+            self.imu_errors += 1
+            return heading
+
+        # Line the IMU up with the current heading the first time
+        if self.imu_offset is None:
+            self.imu_offset = angle_difference(heading, imu_heading)
+        error = angle_difference(imu_heading + self.imu_offset, heading)
+        return heading + error * self.imu_weight
+
+
+def main():
+    """Print the pose while the robot is driven or pushed by hand"""
+    import easygopigo3 as easy
+    gpg = easy.EasyGoPiGo3()
+    odometry = Odometry(gpg)
+    odometry.start()
+    try:
+        while True:
+            pose = odometry.pose
+            print(f"x: {pose.x:7.1f} cm  y: {pose.y:7.1f} cm  "
+                  f"heading: {pose.heading:6.1f}°")
+            time.sleep(0.25)
+    except KeyboardInterrupt:
+        odometry.stop()
+        gpg.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,7 @@
 # Author          Date              Comments
 # Karan	    	  27 June 14        Code cleanup
 # Loring          10/10/21          Convert to Python3 3.5
+# Loring          10/18/26          Optional key to motor latency tracing
 # EasyGoPiGo3 documentation: https://gopigo3.readthedocs.io/en/latest
 # Copyright (c) 2017 Dexter Industries Released under the MIT license
 ##############################################################################################################
@@ -24,11 +25,16 @@
 import sys                    # For sys.exit
 from time import sleep        # Import the time library for the sleep function
 import easygopigo3 as easy    # Import the EasyGoPiGo3 library
+from latency_trace import get_tracer  # GOPIGO_LATENCY_TRACE=file.csv
+
+# Commands that drive the motors, only these are timed
+MOTOR_KEYS = ('w', 'a', 'd', 's', ' ')
 
 
 #--------------------------------- INITIALIZE GOPIGO -------------------------------------#
 gpg = easy.EasyGoPiGo3()    # Initialize a EasyGoPiGo3 object
 gpg.set_speed(200)          # Set initial speed
+tracer = get_tracer(gpg)    # Times commands when turned on
 
 
 #--------------------------------- MAIN FUNCTION -----------------------------------------#
@@ -42,6 +48,10 @@ def main():
     while True:
         # Fetch the input from the terminal
         key_press = input("Enter the Command: ")
+        # The key is the command, there is nothing else to decide
+        # Exit and unknown keys never write the motors
+        if key_press in MOTOR_KEYS:
+            tracer.decision(tracer.begin("console"))
         # Forward
         if key_press == 'w':
             gpg.forward()
@@ -27,6 +27,7 @@
 # Loring        04/28/18        Ported from GoPiGo, converted to GoPiGo3
 # Loring        09/06/21        Converted to Python3
 # Loring        09/24/21        Refactored to OOP
+# Loring        10/18/26        Optional key to motor latency tracing
 
 ############################################################################
 # Includes the basic functions for controlling the GoPiGo Robot
@@ -35,6 +36,10 @@ import atexit               # Used for stopping the GoPiGo when closing the runn
 import os                   # For placement of the pygame window
 import sys                  # For sys.exit
 import pygame               # Gives access to KEYUP/KEYDOWN events
+from latency_trace import get_tracer  # GOPIGO_LATENCY_TRACE=file.csv
+
+# Keys that drive the motors, only these are timed
+MOTOR_KEYS = "wadslo"
 
 
 class RemoteControlGUI:
@@ -43,6 +48,8 @@ class RemoteControlGUI:
     def __init__(self):
         """ Initialize remote control class """
         self.gpg = easy.EasyGoPiGo3()
+        # Times key presses to motor writes when turned on
+        self.tracer = get_tracer(self.gpg)
 
         # Set initial speed
         self.gpg.set_speed(200)
@@ -179,9 +186,11 @@ class RemoteControlGUI:
         while True:
             # Capture any events
             event = pygame.event.wait()
+            trace = self.tracer.begin("pygame")
             # If the event is a keyup event
             # Stop everything
             if (event.type == pygame.KEYUP):
+                self.tracer.decision(trace)
                 self.gpg.stop()
                 # Make sure the blinkers are off
                 self.gpg.led_off("left")
@@ -195,6 +204,9 @@ class RemoteControlGUI:
 
             # Get the keyboard character from the keydown event
             char = event.unicode
+            # Speed and exit keys never write the motors
+            if char in MOTOR_KEYS:
+                self.tracer.decision(trace)
 
             # Move Forward
             if char == 'w':
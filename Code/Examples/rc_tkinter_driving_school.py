@@ -10,12 +10,14 @@
 # History
 # ------------------------------------------------
 # Author     Date           Comments
+# Loring     10/18/26       Drive with TrajectoryExecutor, window stays live
 
 
 from tkinter import *       # Import tkinter for GUI
 from tkinter.ttk import *   # Add ttk themed widgets
 import sys                  # Used to as sys.exit() to exit the program
 import easygopigo3 as easy  # Import EasyGoPiGo3 library
+from trajectory import TrajectoryExecutor, square
 
 
 class GoPiGoGUI:
@@ -23,12 +25,15 @@ class GoPiGoGUI:
         """ Initialize the program """
         self.gpg = easy.EasyGoPiGo3()  # Create EasyGoPiGo3 object
         self.gpg.set_speed(200)        # Set initial speed
+        # Runs moves in the background so the window doesn't freeze
+        self.executor = TrajectoryExecutor(self.gpg)
         self.window = Tk()             # Create Tkinter window
         self.window.title("GoPiGo Driving School")
         # Set the window size and location
         # 375x320 pixels in size, location at 50x50
         self.window.geometry("375x320+50+50")
         self.create_widgets()  # Create and layout widgets
+        self.update_status()   # Show the progress of the moves
         mainloop()             # Start Tkinter program main loop
 
 # --------------------------- CREATE WIDGETS ------------------------------#
@@ -51,6 +56,11 @@ class GoPiGoGUI:
             text="Square Right",
             command=self.square_right)
 
+        btn_stop = Button(
+            self.main_frame,
+            text="Stop",
+            command=self.executor.cancel)
+
         btn_exit = Button(
             self.main_frame,
             text="Exit",
@@ -58,7 +68,11 @@ class GoPiGoGUI:
 
         # Grid the widgets
         btn_square.grid(row=0, column=0,)
-        btn_exit.grid(row=0, column=1)
+        btn_stop.grid(row=0, column=1)
+        btn_exit.grid(row=0, column=2)
+
+        self.lbl_status = Label(self.main_frame, text="Ready")
+        self.lbl_status.grid(row=1, column=0, columnspan=3, sticky=W)
 
         # Set padding between frame and window
         self.main_frame.pack_configure(padx=10, pady=(10))
@@ -69,12 +83,24 @@ class GoPiGoGUI:
 
 # ------------------------- DRIVE RIGHT SQUARE ----------------------------#
     def square_right(self):
-        for i in range(4):
-            self.gpg.drive_inches(12)
-            self.gpg.turn_degrees(90)
+        # Returns right away, the executor drives the square
+        self.executor.run(square(12 * 2.54))
+
+# ---------------------------- UPDATE STATUS ------------------------------#
+    def update_status(self):
+        """ Show which move is running, checked 10 times a second """
+        executor = self.executor
+        if executor.running:
+            text = (f"Move {executor.index + 1} of {len(executor.segments)}"
+                    f" {executor.progress:.0%}")
+        else:
+            text = executor.state.capitalize()
+        self.lbl_status.configure(text=text)
+        self.window.after(100, self.update_status)
 
 # ----------------------------- EXIT PROGRAM ------------------------------#
     def exit_program(self):
+        self.executor.cancel()
         # Unconfigure the sensors, disable the motors,
         # restore the LED to the control of the GoPiGo3 firmware
         self.gpg.reset_all()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    trajectory.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Drive a list of moves without blocking the program
+    drive_inches() and turn_degrees() don't return until the move is done,
+    a Tkinter window freezes and no sensor can be checked meanwhile
+    TrajectoryExecutor runs the moves on a background thread,
+    checking the wheel encoders many times a second
+    Each wheel's speed is corrected so both wheels stay on their path,
+    and slows down near the end of the move
+    run() returns right away, cancel() stops the robot
+    A wheel that can't move, blocked or stuck, ends the run as stalled
+    Positive turns are to the right, like turn_degrees() and orbit()
+"""
+import math
+import time
+from collections import namedtuple
+from threading import Thread, Event, current_thread
+
+# kind is line, arc, spin or orbit
+Segment = namedtuple('Segment', 'kind value radius')
+
+
+def line(distance_cm):
+    """Drive straight, negative is backward"""
+    return Segment('line', distance_cm, 0)
+
+
+def arc(distance_cm, radius_cm):
+    """Drive distance_cm along a circle, positive radius curves right"""
+    return Segment('arc', distance_cm, radius_cm)
+
+
+def spin(degrees):
+    """Turn in place, positive is right"""
+    return Segment('spin', degrees, 0)
+
+
+def orbit(degrees, radius_cm):
+    """Drive degrees around a circle, positive radius curves right"""
+    return Segment('orbit', degrees, radius_cm)
+
+
+def square(side_cm, right=True):
+    """Segments to drive a square"""
+    turn = 90 if right else -90
+    return [line(side_cm), spin(turn)] * 4
+
+
+class TrajectoryExecutor:
+    """Run segments one after another on encoder feedback"""
+
+    # States
+    IDLE = "idle"
+    RUNNING = "running"
+    DONE = "done"
+    CANCELED = "canceled"
+    BLOCKED = "blocked"
+    STALLED = "stalled"
+
+    def __init__(self, gpg, rate=50, speed=None, tolerance=3, gain=4,
+                 slow_degrees=90, min_speed=0.25, stall_seconds=1.0):
+        self.gpg = gpg
+        self.interval = 1 / rate
+        # Top wheel speed in degrees per second
+        self.speed = speed or gpg.get_speed()
+        # Close enough to the target, wheel degrees
+        self.tolerance = tolerance
+        # Extra degrees per second for each degree a wheel is off its path
+        self.gain = gain
+        # Start slowing down this many wheel degrees before the end
+        self.slow_degrees = slow_degrees
+        # Slowest speed while slowing down, fraction of speed
+        self.min_speed = min_speed
+        # Stop if the wheels haven't moved in this many seconds
+        self.stall_seconds = stall_seconds
+        self.cm_to_degrees = 3600 / (gpg.WHEEL_DIAMETER * math.pi)
+        self.half_base = gpg.WHEEL_BASE_WIDTH / 20
+
+        self.stop_event = Event()
+        self.thread = None
+        self.segments = []
+        self.state = self.IDLE
+        self.index = 0
+        self.progress = 0.0
+        self.guard = None
+        self.on_progress = None
+        self.on_done = None
+        # Encoders at the start of the segment and the wheel targets
+        self.start = None
+        self.target = None
+        # Wheel degrees moved in this segment and when that last grew
+        self.travel = 0
+        self.travel_time = None
+
+# --------------------------- WHEEL TARGETS ------------------------------ #
+    def wheel_targets(self, segment):
+        """(left, right) wheel degrees for a segment"""
+        kind, value, radius = segment
+        if kind == 'line':
+            left = right = value
+        elif kind == 'spin':
+            left = 2 * math.pi * self.half_base * value / 360
+            right = -left
+        else:
+            if kind == 'orbit':
+                # Convert degrees around the circle to cm at the center
+                value = 2 * math.pi * abs(radius) * value / 360
+            if radius == 0:
+                raise ValueError(f"{kind} needs a radius, use spin")
+            # The outside wheel goes further, (r + half base) / r
+            outside = value * (abs(radius) + self.half_base) / abs(radius)
+            inside = value * (abs(radius) - self.half_base) / abs(radius)
+            if radius > 0:
+                left, right = outside, inside
+            else:
+                left, right = inside, outside
+        return left * self.cm_to_degrees, right * self.cm_to_degrees
+
+# --------------------------------- RUN ---------------------------------- #
+    def run(self, segments, on_progress=None, on_done=None, guard=None):
+        """Start driving the segments, returns right away
+        on_progress(index, progress) is called as each segment moves,
+        progress goes from 0.0 to 1.0
+        on_done(state) is called once at the end with DONE, CANCELED,
+        BLOCKED or STALLED
+        guard() is checked on every update, return True to stop,
+        for example when an obstacle is too close
+        Callbacks run on the executor thread, don't touch Tkinter from them"""
+        self.cancel()
+        self.segments = list(segments)
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.guard = guard
+        self.index = 0
+        self.progress = 0.0
+        self.start = None
+        self.state = self.RUNNING
+        self.stop_event.clear()
+        self.thread = Thread(target=self.run_loop, daemon=True)
+        self.thread.start()
+
+# -------------------------------- CANCEL -------------------------------- #
+    def cancel(self):
+        """Stop the robot and forget the remaining segments
+        Can be called from on_progress or on_done too"""
+        if self.thread is not None and self.thread.is_alive():
+            self.stop_event.set()
+            # A callback can't wait for its own thread to end
+            if current_thread() is not self.thread:
+                self.thread.join(timeout=1)
+
+    @property
+    def running(self):
+        return self.state == self.RUNNING
+
+# ------------------------------- RUN LOOP ------------------------------- #
+    def run_loop(self):
+        next_update = time.monotonic()
+        state = self.CANCELED
+        try:
+            while not self.stop_event.is_set():
+                state = self.tick()
+                if state != self.RUNNING:
+                    break
+                next_update = max(next_update + self.interval,
+                                  time.monotonic())
+                self.stop_event.wait(next_update - time.monotonic())
+            else:
+                state = self.CANCELED
+        finally:
+            self.stop_motors()
+            self.state = state
+            if self.on_done is not None:
+                self.on_done(state)
+
+# --------------------------------- TICK --------------------------------- #
+    def tick(self):
+        """One control update, returns the state"""
+        if self.guard is not None and self.guard():
+            return self.BLOCKED
+        if self.index >= len(self.segments):
+            return self.DONE
+
+        encoders = self.gpg.read_encoders()
+        now = time.monotonic()
+        if self.start is None:
+            # Starting a new segment
+            self.start = encoders
+            self.target = self.wheel_targets(self.segments[self.index])
+            self.travel = 0
+            self.travel_time = now
+
+        moved = [wheel - start for wheel, start in zip(encoders, self.start)]
+        total = sum(abs(target) for target in self.target)
+        # Degrees each wheel has to go, negative once it coasted past,
+        # a wheel that reached its target is done, it never backs up
+        remaining = [abs(target) - done * math.copysign(1, target)
+                     if target else 0
+                     for target, done in zip(self.target, moved)]
+
+        if total == 0 or max(remaining) <= self.tolerance:
+            # Segment finished, the next tick starts the next one
+            self.report(1.0)
+            self.index += 1
+            self.start = None
+            self.stop_motors()
+            if self.index >= len(self.segments):
+                return self.DONE
+            return self.RUNNING
+
+        # Blocked or stuck wheels stop the run instead of trying forever
+        travel = sum(abs(done) for done in moved)
+        if travel >= self.travel + self.tolerance:
+            self.travel = travel
+            self.travel_time = now
+        elif now - self.travel_time > self.stall_seconds:
+            return self.STALLED
+
+        progress = min(travel / total, 1.0)
+        self.report(progress)
+
+        # Slow down near the end of the segment
+        longest = max(abs(target) for target in self.target)
+        left_to_go = max(remaining)
+        speed = self.speed * max(self.min_speed,
+                                 min(1.0, left_to_go / self.slow_degrees))
+
+        for motor, target, done, to_go in zip(
+                (self.gpg.MOTOR_LEFT, self.gpg.MOTOR_RIGHT),
+                self.target, moved, remaining):
+            # Where this wheel should be at this much progress
+            error = target * progress - done
+            dps = speed * target / longest + self.gain * error
+            # Never drive past the target
+            if to_go <= 0:
+                dps = 0
+            self.gpg.set_motor_dps(motor, dps)
+        return self.RUNNING
+
+    def stop_motors(self):
+        self.gpg.set_motor_dps(self.gpg.MOTOR_LEFT + self.gpg.MOTOR_RIGHT, 0)
+
+    def report(self, progress):
+        self.progress = progress
+        if self.on_progress is not None:
+            self.on_progress(self.index, progress)
+
+
+def main():
+    """Drive a square and an orbit while printing the progress"""
+    import easygopigo3 as easy
+    gpg = easy.EasyGoPiGo3()
+    executor = TrajectoryExecutor(gpg, speed=200)
+    executor.run(square(30) + [orbit(180, 20)],
+                 on_done=lambda state: print(f"Finished: {state}"))
+    try:
+        while executor.running:
+            print(f"Segment {executor.index + 1} of {len(executor.segments)}"
+                  f" {executor.progress:.0%}")
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        executor.cancel()
+
+
+if __name__ == "__main__":
+    main()
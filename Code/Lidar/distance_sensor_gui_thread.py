@@ -4,9 +4,8 @@ import tkinter as tk  # Import the Tkinter library for creating the GUI
 from tkinter import ttk  # Import the themed Tkinter widgets
 # Import the EasyGoPiGo3 library for interacting with the distance sensor
 import easygopigo3 as easy
-# Import the threading library for creating a separate thread
-from threading import Thread
-from time import sleep
+# The sensor hub reads the sensor on its own thread
+from sensor_hub import SensorHub
 
 
 class DistanceSensorTkinter:
@@ -19,7 +18,7 @@ class DistanceSensorTkinter:
         # Initialize the EasyGoPiGo3 object and the distance sensor
         self.gpg = easy.EasyGoPiGo3()
         self.distance_sensor = self.gpg.init_distance_sensor("AD1")
-        self.initialize_thread()
+        self.initialize_hub()
         self.create_widgets()
 
 # -------------------------- CREATE WIDGETS ------------------------------ #
@@ -49,28 +48,24 @@ class DistanceSensorTkinter:
         # Pack the quit button with vertical padding
         self.quit_button.pack(pady=10)
 
-# ----------------------- INITIALIZE THREAD ------------------------------ #
-    def initialize_thread(self):
-        # Initialize the running flag and start the update thread
-        # Setting daemon=True allows the thread to quit
-        # when the main application quits
-        self.running = True
-        self.update_thread = Thread(
-            target=self.update_distance_thread,
-            daemon=True
-        )
-
-          # Start the update_distance_thread
-        self.update_thread.start()
-
-# ----------------------- UPDATE DISTANCE THREAD ------------------------- #
-    def update_distance_thread(self):
-        """This method runs in a separate thread 
-        and continuously updates the distance label
-        """
-        while self.running:
-            # Read the distance from the sensor and calculate feet and inches
-            inches = self.distance_sensor.read_inches()
+# ------------------------- INITIALIZE HUB ------------------------------- #
+    def initialize_hub(self):
+        # The sensor hub reads the distance sensor once a second
+        # on its own daemon thread, so the GUI never waits for the sensor
+        # The hub thread never touches the widgets, Tkinter isn't thread safe
+        self.hub = SensorHub()
+        self.hub.add_sensor("distance", self.distance_sensor.read_inches, 1)
+        self.hub.start()
+
+        # Show the latest reading once the mainloop is running
+        self.root.after(100, self.display_distance)
+
+# ------------------------- DISPLAY DISTANCE ----------------------------- #
+    def display_distance(self):
+        """Runs in the Tkinter mainloop and shows the latest reading"""
+        inches = self.hub.get("distance")
+        if inches is not None:
+            # Calculate feet and inches
             feet = int(inches // 12)
             remaining_inches = int(inches % 12)
 
@@ -78,23 +73,22 @@ class DistanceSensorTkinter:
             distance_text = f"{feet}' {remaining_inches}\""
             self.distance_label.configure(text=distance_text)
 
-            # Pause for 1 second before the next update
-            sleep(1)
+        # Check for a new reading every 100 ms
+        # 'after' schedules this method again without blocking the GUI
+        self.root.after(100, self.display_distance)
 
 # -------------------------- UPDATE DISTANCE ----------------------------- #
     def update_distance(self):
         # This method is called when the "Update Distance" button is clicked
         # However, it doesn't do anything, as the distance is already
-        # being updated in the separate thread
+        # being updated by the sensor hub
         pass
 
 # -------------------------- QUIT APPLICATION ---------------------------- #
     def quit(self):
         # This method is called when the "Quit" button is clicked
-        # It sets the running flag to False to stop the update thread
-        # and waits for the thread to join before quitting the application
-        self.running = False
-        self.update_thread.join()
+        # It stops the sensor hub thread before quitting the application
+        self.hub.stop()
         self.root.destroy()
 
 
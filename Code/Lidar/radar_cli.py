@@ -1,6 +1,7 @@
 # Import required libraries
 from easygopigo3 import EasyGoPiGo3  # Import the GoPiGo3 robot control library
-import time  # Import time library for adding delays
+# Import the servo motion model for adaptive settle times
+from servo_motion import load_servo_motion, save_servo_motion
 import math  # Import math library for trigonometric calculations
 LEFT = 20
 RIGHT = 160
@@ -28,9 +29,9 @@ class DistanceScanner:
         # These are the angles (in degrees) where the servo will take measurements
         self.scan_range = range(LEFT, RIGHT, LEFT)
 
-        # Time to wait after moving servo (in seconds)
-        # This gives the servo time to reach its position
-        self.servo_delay = 0.1
+        # Wait after moving the servo only as long as the move needs
+        # Small steps settle much faster than a full swing
+        self.servo_motion = load_servo_motion(self.servo2)
 
         # Create an empty list to store scan results
         self.scan_results = []
@@ -38,10 +39,18 @@ class DistanceScanner:
 # --------------------------- MOVE SERVO --------------------------------- #
     def move_servo(self, angle):
         """Move servo to specified angle and wait for it to reach position"""
-        # Tell the servo motor to move to the specified angle
-        self.servo2.rotate_servo(angle)
-        # Wait for the servo to reach its position
-        time.sleep(self.servo_delay)
+        # Move the servo and wait for it to reach its position
+        self.servo_motion.move(angle)
+
+# -------------------------- CALIBRATE SERVO ----------------------------- #
+    def calibrate_servo(self):
+        """Measure the servo slew rate and save it for the next run"""
+        slew_rate = self.servo_motion.calibrate(self.distance_sensor)
+        if slew_rate is None:
+            print("Calibration failed: point the sensor at a varied scene")
+        else:
+            save_servo_motion(self.servo_motion)
+            print(f"Servo slew rate: {slew_rate:.0f} degrees per second")
 
 # --------------------------TAKE MEASUREMENT ----------------------------- #
     def take_measurement(self):
@@ -160,7 +169,13 @@ def main():
         # Main program loop
         while True:
             # Wait for user to press Enter
-            input("Press Enter to perform a scan (Ctrl+C to exit)...")
+            choice = input(
+                "Press Enter to perform a scan, c to calibrate the servo "
+                "(Ctrl+C to exit)...")
+            # Measure the servo speed once, it is saved for next time
+            if choice.strip().lower() == 'c':
+                scanner.calibrate_servo()
+                continue
             # Perform scan and get results
             scanner.perform_scan()
             # Show visualization of results
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    sensor_hub.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: One thread that reads every sensor at its own rate
+    The latest readings are published as a snapshot dictionary
+    The hub never changes a published snapshot, it swaps in a new one,
+    so readers never wait on a lock or on the SPI/I2C bus
+    Tkinter programs read the snapshot from an after() callback
+    or subscribe and hand each update to the GUI thread
+"""
+import heapq
+import time
+from threading import Thread, Event
+
+
+class SensorHub:
+    """Poll sensors on one background thread and publish the results"""
+
+    def __init__(self):
+        # name: (read function, interval in seconds)
+        self.sensors = {}
+        # Latest values and errors, replaced as a whole on every update
+        self.snapshot = {}
+        self.errors = {}
+        self.subscribers = []
+        self.stop_event = Event()
+        self.thread = None
+
+# ----------------------------- ADD SENSOR ------------------------------- #
+    def add_sensor(self, name, read_function, interval):
+        """Call read_function every interval seconds, publish it as name"""
+        self.sensors[name] = (read_function, interval)
+
+# ------------------------------ SUBSCRIBE ------------------------------- #
+    def subscribe(self, callback):
+        """Call callback(name, value) after every new reading
+        If the read failed, value is the exception that was raised
+        The callback runs on the hub thread, keep it short
+        and don't touch Tkinter widgets from it"""
+        self.subscribers.append(callback)
+
+# --------------------------------- GET ---------------------------------- #
+    def get(self, name, default=None):
+        """Latest value of a sensor, never blocks"""
+        return self.snapshot.get(name, default)
+
+    def error(self, name):
+        """Last error from a sensor, None if the last read worked"""
+        return self.errors.get(name)
+
+# -------------------------------- START --------------------------------- #
+    def start(self):
+        """Start the polling thread"""
+        self.stop_event.clear()
+        self.thread = Thread(target=self.poll_loop, daemon=True)
+        self.thread.start()
+
+# --------------------------------- STOP --------------------------------- #
+    def stop(self):
+        """Stop the polling thread and wait for it"""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=2)
+
+# --------------------------- WAIT UNTIL READY --------------------------- #
+    def wait_until_ready(self, timeout=5):
+        """Wait until every sensor has been read once"""
+        end = time.monotonic() + timeout
+        while time.monotonic() < end:
+            if all(name in self.snapshot or name in self.errors
+                   for name in self.sensors):
+                return True
+            time.sleep(0.01)
+        return False
+
+# ------------------------------ POLL LOOP ------------------------------- #
+    def poll_loop(self):
+        """Read whichever sensor is due next, then sleep until the next"""
+        now = time.monotonic()
+        # (due time, name) with the soonest first
+        schedule = [(now, name) for name in self.sensors]
+        heapq.heapify(schedule)
+
+        while schedule and not self.stop_event.is_set():
+            due, name = schedule[0]
+            wait = due - time.monotonic()
+            # Event.wait lets stop() end the wait right away
+            if wait > 0 and self.stop_event.wait(wait):
+                break
+
+            read_function, interval = self.sensors[name]
+            try:
+                value = read_function()
+            except Exception as e:
+                self.errors = {**self.errors, name: e}
+                self.notify(name, e)
+            else:
+                self.publish(name, value)
+
+            # Skip missed readings instead of catching up in a burst
+            next_due = max(due + interval, time.monotonic())
+            heapq.heapreplace(schedule, (next_due, name))
+
+# ------------------------------- PUBLISH -------------------------------- #
+    def publish(self, name, value):
+        """Swap in a new snapshot with the new value"""
+        self.snapshot = {**self.snapshot, name: value}
+        if name in self.errors:
+            errors = dict(self.errors)
+            del errors[name]
+            self.errors = errors
+        self.notify(name, value)
+
+# -------------------------------- NOTIFY -------------------------------- #
+    def notify(self, name, value):
+        """Pass a new reading or error to every subscriber
+        A failing subscriber is reported, it can't stop the hub thread"""
+        for callback in self.subscribers:
+            try:
+                callback(name, value)
+            except Exception as e:
+                print(f" Sensor hub subscriber "
+                      f"{getattr(callback, '__name__', callback)} "
+                      f"failed on {name}: {type(e).__name__}: {e}")
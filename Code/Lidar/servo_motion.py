@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    servo_motion.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Servo motion model for the distance sensor scanner
+    Wait only as long as the servo needs to travel the angle it was given
+    instead of a fixed delay after every move
+    Calibrate measures the real slew rate with the distance sensor
+"""
+import time
+import configparser
+
+# Typical hobby servo, about 0.2 s per 60 degrees with a sensor on it
+DEFAULT_SLEW_RATE = 300     # Degrees per second
+# Time for the servo to stop jittering and the sensor to take a reading
+DEFAULT_MIN_SETTLE = 0.02   # Seconds
+# Extra travel time so a slow move is never cut short
+SAFETY_MARGIN = 1.2
+# Used when we don't know where the servo is
+FULL_RANGE = 180
+
+SECTION = 'ServoMotion'
+
+
+class ServoMotion:
+    """Move a servo and wait just long enough for it to arrive"""
+
+    def __init__(self, servo, slew_rate=DEFAULT_SLEW_RATE,
+                 min_settle=DEFAULT_MIN_SETTLE):
+        self.servo = servo
+        self.slew_rate = slew_rate
+        self.min_settle = min_settle
+        # Unknown until the first move
+        self.angle = None
+
+# ---------------------------- SETTLE TIME ------------------------------- #
+    def settle_time(self, delta):
+        """Seconds needed to travel delta degrees and settle"""
+        travel = abs(delta) / self.slew_rate * SAFETY_MARGIN
+        return self.min_settle + travel
+
+# -------------------------------- MOVE ---------------------------------- #
+    def move(self, angle):
+        """Rotate the servo and block until it has settled"""
+        if self.angle is None:
+            delta = FULL_RANGE
+        else:
+            delta = angle - self.angle
+        self.servo.rotate_servo(angle)
+        time.sleep(self.settle_time(delta))
+        self.angle = angle
+
+# ------------------------------ CALIBRATE ------------------------------- #
+    def calibrate(self, distance_sensor, start=30, end=150,
+                  tolerance=30, stable_reads=3, timeout=2.0):
+        """Measure the slew rate by timing a long move with the sensor
+        Point the robot so the distance is different at start and end
+        Returns the new slew rate or None if the scene is too uniform"""
+        # Reference distance at the end angle
+        self.servo.rotate_servo(end)
+        time.sleep(1)
+        reference = distance_sensor.read_mm()
+
+        self.servo.rotate_servo(start)
+        time.sleep(1)
+        if abs(distance_sensor.read_mm() - reference) <= tolerance:
+            # The servo was left at start
+            self.angle = start
+            return None
+
+        # Time the move until the reading matches the reference
+        self.servo.rotate_servo(end)
+        start_time = time.monotonic()
+        arrived = None
+        count = 0
+        while time.monotonic() - start_time < timeout:
+            if abs(distance_sensor.read_mm() - reference) <= tolerance:
+                if count == 0:
+                    arrived = time.monotonic()
+                count += 1
+                if count >= stable_reads:
+                    break
+            else:
+                count = 0
+        self.angle = end
+
+        if count < stable_reads:
+            return None
+
+        elapsed = arrived - start_time
+        self.slew_rate = abs(end - start) / max(elapsed, 0.001)
+        return self.slew_rate
+
+# ----------------------------- LOAD CONFIG ------------------------------ #
+    def load_config(self, config):
+        """Read slew rate and settle time from a ConfigParser"""
+        if config.has_section(SECTION):
+            self.slew_rate = config.getfloat(
+                SECTION, 'slew_rate', fallback=self.slew_rate)
+            self.min_settle = config.getfloat(
+                SECTION, 'min_settle', fallback=self.min_settle)
+
+# ----------------------------- SAVE CONFIG ------------------------------ #
+    def save_config(self, config):
+        """Store slew rate and settle time in a ConfigParser"""
+        if not config.has_section(SECTION):
+            config.add_section(SECTION)
+        config.set(SECTION, 'slew_rate', f"{self.slew_rate:.1f}")
+        config.set(SECTION, 'min_settle', f"{self.min_settle:.3f}")
+
+
+# ------------------------- LOAD / SAVE FILE ----------------------------- #
+def load_servo_motion(servo, config_file='servo_motion.ini'):
+    """Create a ServoMotion with the calibration saved in config_file"""
+    motion = ServoMotion(servo)
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    motion.load_config(config)
+    return motion
+
+
+def save_servo_motion(motion, config_file='servo_motion.ini'):
+    """Save the ServoMotion calibration to config_file"""
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    motion.save_config(config)
+    with open(config_file, 'w') as configfile:
+        config.write(configfile)
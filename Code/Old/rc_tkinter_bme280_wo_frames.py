@@ -11,11 +11,13 @@
 # Loring     09/12/21       Convert to EasyGoPiGo3, OOP, test with Python 3.5
 # Loring     10/23/21       Add battery voltage display
 # Loring     11/11/21       Add BME280 sensor display
+# Loring     10/18/26       Sea level pressure from weather_units
 
 from tkinter import *       # Import tkinter for GUI
 import sys                  # Used to exit the program
 import easygopigo3 as easy  # Import EasyGoPiGo3 library
 from di_sensors.easy_temp_hum_press import EasyTHPSensor
+from weather_units import sea_level_inhg
 
 
 class GoPiGoGUI:
@@ -139,8 +141,8 @@ class GoPiGoGUI:
         # Read pressure in pascals
         press = self.my_thp.safe_pressure()
 
-        # Convert pascals to inHg, compensate for 4000' altitude
-        self.pressure = (press / 3386.38867) + 4.08
+        # Convert to sea level pressure in inHg for our altitude
+        self.pressure = sea_level_inhg(press)
 
         self.voltage = round(self.gpg.volt(), 1)
 
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    motor_commands.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Smooth and thin out motor speed commands
+    Every set_motor_dps() call is an SPI transaction to the GoPiGo3
+    Programs ask for wheel speeds as often as they like with set_speeds(),
+    a background thread moves the wheels toward those speeds
+    no faster than the acceleration limit
+    A wheel is only written when its speed changes, and both wheels
+    are written with one call when they get the same speed
+    sent and requested count the SPI writes made and the writes
+    the program asked for, the difference is what was saved
+    SPI writes are made outside the speed lock, set_speeds() never
+    waits on the bus
+"""
+import time
+from threading import Thread, Event, Lock
+
+
+class MotorCommander:
+    """Acceleration limited, deduplicated set_motor_dps writes"""
+
+    def __init__(self, gpg, accel=600, rate=50, deadband=2):
+        self.gpg = gpg
+        # Largest speed change in degrees per second, per second
+        self.accel = accel
+        self.interval = 1 / rate
+        # Smaller speed changes are not worth a write
+        self.deadband = deadband
+
+        # Guards target and current, only held for a few calculations
+        self.lock = Lock()
+        # Held while writing, one writer on the bus at a time
+        self.write_lock = Lock()
+        self.target = (0, 0)
+        # Speed the wheels are ramping through and the last speed written
+        self.current = [0.0, 0.0]
+        self.written = [None, None]
+        self.wake = Event()
+        self.stop_event = Event()
+        self.thread = None
+        # SPI writes asked for and made
+        self.requested = 0
+        self.sent = 0
+
+# ----------------------------- SET SPEEDS ------------------------------- #
+    def set_speeds(self, left, right):
+        """Ask for new wheel speeds in degrees per second, never blocks"""
+        with self.lock:
+            self.target = (left, right)
+            # Counted the way the program used to write them
+            self.requested += 2
+        self.wake.set()
+
+# -------------------------------- STOP ---------------------------------- #
+    def stop(self):
+        """Emergency stop, both wheels stop right away without ramping"""
+        with self.lock:
+            self.target = (0, 0)
+            self.current = [0.0, 0.0]
+            self.requested += 1
+        self.flush()
+
+    @property
+    def saved(self):
+        """SPI writes saved so far"""
+        return self.requested - self.sent
+
+# ------------------------------- START ---------------------------------- #
+    def start(self):
+        """Start the background thread"""
+        self.stop_event.clear()
+        self.thread = Thread(target=self.run_loop, daemon=True)
+        self.thread.start()
+
+# ------------------------------ SHUTDOWN -------------------------------- #
+    def shutdown(self):
+        """Stop the robot and the background thread"""
+        self.stop_event.set()
+        self.wake.set()
+        if self.thread is not None:
+            self.thread.join(timeout=1)
+        self.stop()
+
+# ------------------------------ RUN LOOP -------------------------------- #
+    def run_loop(self):
+        last = time.monotonic()
+        while not self.stop_event.is_set():
+            now = time.monotonic()
+            ramping = self.update(now - last)
+            last = now
+            if ramping:
+                self.stop_event.wait(self.interval)
+            else:
+                # Nothing to do until someone asks for a new speed
+                self.wake.wait()
+                self.wake.clear()
+                # One interval back, the first step is written right away
+                last = time.monotonic() - self.interval
+
+# ------------------------------- UPDATE --------------------------------- #
+    def update(self, dt):
+        """Move toward the target speeds, returns True while ramping"""
+        with self.lock:
+            step = self.accel * dt
+            for wheel in (0, 1):
+                change = self.target[wheel] - self.current[wheel]
+                self.current[wheel] += max(-step, min(step, change))
+            ramping = list(self.target) != self.current
+        self.flush()
+        return ramping
+
+# -------------------------------- FLUSH --------------------------------- #
+    def flush(self):
+        """Write the newest speeds without holding the speed lock
+        The speeds are read after getting the bus, so a slow write
+        can't be followed by an older speed"""
+        with self.write_lock:
+            with self.lock:
+                left, right = self.current
+                target = self.target
+            self.write(left, right, target)
+
+# -------------------------------- WRITE --------------------------------- #
+    def write(self, left, right, target):
+        """Write only the wheels that changed, called with write_lock held
+        A wheel that reached its target is always written,
+        even when the last step was inside the deadband"""
+        changed = [self.needs_write(speed, written, wheel_target)
+                   for speed, written, wheel_target
+                   in zip((left, right), self.written, target)]
+        gpg = self.gpg
+        if all(changed) and left == right:
+            # One transaction for both motors
+            gpg.set_motor_dps(gpg.MOTOR_LEFT + gpg.MOTOR_RIGHT, left)
+            self.sent += 1
+        else:
+            for motor, speed, wheel_changed in zip(
+                    (gpg.MOTOR_LEFT, gpg.MOTOR_RIGHT), (left, right), changed):
+                if wheel_changed:
+                    gpg.set_motor_dps(motor, speed)
+                    self.sent += 1
+        self.written = [speed if wheel_changed else written
+                        for speed, written, wheel_changed
+                        in zip((left, right), self.written, changed)]
+
+    def needs_write(self, speed, written, target):
+        """Skip repeated speeds and small steps, never the target or a stop"""
+        if written is None:
+            return True
+        if speed == written:
+            return False
+        return (abs(speed - written) >= self.deadband
+                or speed == target or speed == 0)
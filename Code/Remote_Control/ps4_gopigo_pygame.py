@@ -7,8 +7,12 @@
     Purpose: Test the PS4 joystick on a Raspberry Pi with pygame and GoPiGo3
     Left stick Y-axis controls forward/backward movement
     Right stick X-axis controls turning
-    Square button is an emergency stop
+    X (Cross) button is an emergency stop
     Triangle button exits the program
+    Motor speeds go through MotorCommander, which ramps them and
+    only writes to the motors when a speed changes
+    Input is event driven, the program sleeps in pygame.event.wait()
+    until a stick or button changes, then drives right away
 """
 # PS4 Controller Button Mapping:
 # Button 0: X (Cross)
@@ -28,6 +32,18 @@
 
 import pygame
 import easygopigo3 as easy
+from motor_commands import MotorCommander
+from latency_trace import get_tracer
+
+# Controller inputs used to drive
+LEFT_STICK_Y = 1
+RIGHT_STICK_X = 3
+STOP_BUTTON = 0  # X (Cross)
+EXIT_BUTTON = 2  # Triangle
+
+# pygame 1.x event.wait() has no timeout, a timer event wakes it instead
+PYGAME_2 = pygame.version.vernum[0] >= 2
+WAKE_EVENT = pygame.USEREVENT
 
 
 class PS4Controller:
@@ -46,6 +62,39 @@ class PS4Controller:
         # Buster comes with Pygame 1.9.6
         self.controller.init()
 
+        # Latest stick positions, kept up to date from events
+        self.axes = [0.0] * self.controller.get_numaxes()
+
+        # Block all events initially
+        pygame.event.set_blocked(None)
+        # Only allow necessary events
+        pygame.event.set_allowed([pygame.JOYBUTTONDOWN, pygame.JOYAXISMOTION,
+                                  WAKE_EVENT])
+
+# ---------------------------- WAIT FOR INPUT ------------------------------ #
+    def wait_for_input(self, timeout=0.5):
+        """Sleep until the controller changes or timeout seconds pass
+        Returns (axes_changed, buttons pressed since the last call)"""
+        if PYGAME_2:
+            event = pygame.event.wait(int(timeout * 1000))
+        else:
+            # Make sure a timer event ends the wait
+            pygame.time.set_timer(WAKE_EVENT, int(timeout * 1000))
+            event = pygame.event.wait()
+            pygame.time.set_timer(WAKE_EVENT, 0)
+
+        axes_changed = False
+        buttons = []
+        # Handle this event and everything else already waiting
+        for event in [event] + pygame.event.get():
+            if event.type == pygame.JOYAXISMOTION:
+                if event.axis < len(self.axes):
+                    self.axes[event.axis] = event.value
+                    axes_changed = True
+            elif event.type == pygame.JOYBUTTONDOWN:
+                buttons.append(event.button)
+        return axes_changed, buttons
+
     def get_button(self, button_number):
         return self.controller.get_button(button_number)
 
@@ -62,6 +111,27 @@ class PS4Controller:
         self.quit()
 
 
+# ----------------------------- DRIVE SPEEDS ------------------------------- #
+def drive_speeds(left_y, right_x, max_speed):
+    """Left and right wheel speeds from the stick positions"""
+    # Calculate motor speeds
+    base_speed = left_y * max_speed
+
+    if abs(base_speed) < 1:  # If not moving forward/backward, spin in place
+        left_speed = right_x * max_speed
+        right_speed = -right_x * max_speed
+    else:  # If moving, adjust speeds for turning
+        # Reduce inside wheel speed to turn
+        turn_factor = 1 - abs(right_x)
+        if right_x > 0:  # Turning right
+            left_speed = base_speed
+            right_speed = base_speed * turn_factor
+        else:  # Turning left
+            left_speed = base_speed * turn_factor
+            right_speed = base_speed
+    return left_speed, right_speed
+
+
 class GoPiGoController:
     """GoPiGo3 PlayStation 4 controller interface"""
 
@@ -71,20 +141,20 @@ class GoPiGoController:
         self.DEADZONE = 0.1    # Joystick deadzone
         self.TURN_SCALE = 0.8  # Turn scaling factor
         self.DEBUG = False     # Debug output flag
-        self.FPS = 30          # Frames per second
+        # Wake up this often to check for stop() with no input
+        self.TIMEOUT = 0.5
 
         # Initialize components
         self.controller = PS4Controller(controller_number)
         self.gpg = easy.EasyGoPiGo3()
+        # Times stick moves to motor writes, see latency_trace.py
+        self.tracer = get_tracer(self.gpg)
+        # Ramps wheel speeds and skips repeated motor writes
+        self.motors = MotorCommander(self.gpg)
+        self.motors.start()
         self.running = False
-
-        # Initialize pygame clock object to control frame rate
-        self.clock = pygame.time.Clock()
-
-        # Block all events initially
-        pygame.event.set_blocked(None)
-        # Only allow necessary events
-        pygame.event.set_allowed([pygame.JOYBUTTONDOWN, pygame.JOYAXISMOTION])
+        # Last wheel speeds sent, new speeds are only sent on a change
+        self.speeds = (0, 0)
 
 # ------------------------------ SCALE INPUT ------------------------------- #
     def scale_input(self, value):
@@ -95,43 +165,39 @@ class GoPiGoController:
 
 # -------------------------------- UPDATE ---------------------------------- #
     def update(self):
-        """Non-blocking update"""
-        pygame.event.pump()  # Process event queue without blocking
-
-        # Get joystick values directly without event loop
-        left_y = -self.scale_input(self.controller.get_axis(1))
-        right_x = self.scale_input(self.controller.get_axis(3))
+        """Wait for controller input, then drive"""
+        axes_changed, buttons = self.controller.wait_for_input(self.TIMEOUT)
+        if not axes_changed and not buttons:
+            # Woke up to check for stop(), there was no input to time
+            return
+        trace = self.tracer.begin("ps4")
 
-        # Handle emergency stop button (Square)
-        if self.controller.get_button(0):
-            self.gpg.stop()
+        # Handle emergency stop button
+        if STOP_BUTTON in buttons:
+            self.tracer.decision(trace)
+            self.motors.stop()
+            self.speeds = (0, 0)
+            return
+        if EXIT_BUTTON in buttons:
+            self.stop()
+            return
+        if not axes_changed:
             return
 
-        # Calculate motor speeds
-        base_speed = left_y * self.MAX_SPEED
-
-        if abs(base_speed) < 1:  # If not moving forward/backward, spin in place
-            left_speed = right_x * self.MAX_SPEED
-            right_speed = -right_x * self.MAX_SPEED
-        else:  # If moving, adjust speeds for turning
-            # Reduce inside wheel speed to turn
-            turn_factor = 1 - abs(right_x)
-            if right_x > 0:  # Turning right
-                left_speed = base_speed
-                right_speed = base_speed * turn_factor
-            else:  # Turning left
-                left_speed = base_speed * turn_factor
-                right_speed = base_speed
+        left_y = -self.scale_input(self.controller.axes[LEFT_STICK_Y])
+        right_x = self.scale_input(self.controller.axes[RIGHT_STICK_X])
+        speeds = drive_speeds(left_y, right_x, self.MAX_SPEED)
+        # Other axes and stick moves inside the deadzone change nothing
+        if speeds == self.speeds:
+            return
+        self.speeds = speeds
 
         if self.DEBUG:
-            print(f"L: {left_speed:.0f} R: {right_speed:.0f}")
-
-        # Set motor speeds
-        self.gpg.set_motor_dps(self.gpg.MOTOR_LEFT, left_speed)
-        self.gpg.set_motor_dps(self.gpg.MOTOR_RIGHT, right_speed)
+            print(f"L: {speeds[0]:.0f} R: {speeds[1]:.0f}")
 
-        # Cap frame rate
-        self.clock.tick(self.FPS)
+        # Set motor speeds, MotorCommander ramps them
+        self.tracer.decision(trace)
+        self.motors.set_speeds(*speeds)
 
 # -------------------------------- START ----------------------------------- #
     def start(self):
@@ -153,7 +219,9 @@ class GoPiGoController:
 # ------------------------------- CLEANUP ---------------------------------- #
     def cleanup(self):
         """Clean up resources"""
-        self.gpg.stop()
+        self.motors.shutdown()
+        print(f"Motor writes sent: {self.motors.sent} "
+              f"saved: {self.motors.saved}")
         self.controller.quit()
 
 
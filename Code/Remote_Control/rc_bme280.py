@@ -14,6 +14,9 @@ Author     Date           Comments
 Loring     09/12/21       Convert to EasyGoPiGo3, OOP, test with Python 3.7
 Loring     10/23/21       Add battery voltage display
 Loring     11/11/21       Add BME280 sensor display using 'threading
+Loring     10/18/26       Ramp and coalesce motor commands with MotorCommander
+Loring     10/18/26       Save BME280 readings with TimeSeriesStore
+Loring     10/18/26       Use weather_units for pressure and self heating
 """
 from time import sleep
 import tkinter as tk
@@ -21,6 +24,9 @@ import tkinter.ttk as ttk
 from threading import Thread
 # Import EasyGoPiGo3 library
 import easygopigo3 as easy
+from motor_commands import MotorCommander
+from timeseries_store import TimeSeriesStore
+from weather_units import sea_level_inhg, compensate_fahrenheit
 from di_sensors.easy_temp_hum_press import EasyTHPSensor
 MAX_SPEED = 300             # Maximum speed setting for GoPiGo3
 MIN_SPEED = 100             # Minimum speed setting for GoPiGo3
@@ -44,10 +50,15 @@ class GoPiGoGUI:
         # ------------------- INITIALIZE GOPIGO ---------------------------- #
         # Create EasyGoPiGo3 object
         self.gpg = easy.EasyGoPiGo3()
+        # Ramps wheel speeds and skips repeated motor writes
+        self.motors = MotorCommander(self.gpg)
+        self.motors.start()
         # Set initial speed
         self.gpg.set_speed(150)
         # Create EasyTHPSensor object
         self.my_thp = EasyTHPSensor()
+        # History of every BME280 reading
+        self.history = TimeSeriesStore()
 
         # Initial reading of environment data for initial display
         self.read_environment_data()
@@ -71,21 +82,24 @@ class GoPiGoGUI:
         """Read Bosch bme280 sensor, temp, humidity, pressure"""
         # Read temperature
         # temp = my_thp.safe_celsius()
-        self.temp_fahrenheit = self.my_thp.safe_fahrenheit()
+        temp_fahrenheit = self.my_thp.safe_fahrenheit()
         # Compensate for heat of Raspberry Pi
-        self.temp_fahrenheit = self.temp_fahrenheit - 4
+        self.temp_fahrenheit = compensate_fahrenheit(temp_fahrenheit)
 
         # Read relative humidity
         self.humidity = self.my_thp.safe_humidity()
 
         # Read barometric pressure in pascals
         press_pascals = self.my_thp.safe_pressure()
-        # Convert pascals to inHg
-        press_inhg = press_pascals / 3386.3886666667
+        # Convert to sea level pressure in inHg for our altitude
+        self.press_inhg = sea_level_inhg(press_pascals)
 
-        # Compensate for 3960' altitude 4.04
-        # Scottsbluff, NE, Heilig Field, 4.04
-        self.press_inhg = press_inhg + 4.04
+        # Save the sensor's own values, pressure in pascals
+        self.history.append_many({
+            "temperature": temp_fahrenheit,
+            "humidity": self.humidity,
+            "pressure": press_pascals,
+        })
 
         # Read GPG3 battery voltage
         self.voltage = round(self.gpg.volt(), 1)
@@ -198,8 +212,7 @@ class GoPiGoGUI:
             self.quit()
 
         # Set motor speeds using DPS (Degrees Per Second)
-        self.gpg.set_motor_dps(self.gpg.MOTOR_LEFT, left_speed)
-        self.gpg.set_motor_dps(self.gpg.MOTOR_RIGHT, right_speed)
+        self.motors.set_speeds(left_speed, right_speed)
 
 
 # ------------------------- CREATE FRAMES ---------------------------------- #
@@ -319,6 +332,8 @@ class GoPiGoGUI:
 
     # ------------------------- QUIT PROGRAM ------------------------------- #
     def quit(self):
+        self.motors.shutdown()
+        self.history.close()
         self.window.destroy()
 
 
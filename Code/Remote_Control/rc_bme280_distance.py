@@ -11,6 +11,7 @@ with Bosch BME280 Temperature, Humidity, and Pressure sensor
  Loring     09/12/21       Convert to EasyGoPiGo3, OOP, test with Python 3.7
  Loring     10/23/21       Add battery voltage display
  Loring     11/11/21       Add BME280 sensor display
+ Loring     10/18/26       Use weather_units for pressure and self heating
 """
 from time import sleep
 import tkinter as tk
@@ -19,6 +20,7 @@ from threading import Thread
 # Import EasyGoPiGo3 library
 import easygopigo3 as easy
 from di_sensors.easy_temp_hum_press import EasyTHPSensor
+from weather_units import sea_level_inhg, compensate_fahrenheit
 
 # Set servo pointing straight ahead
 # You may have to change the degrees to adapt to your servo
@@ -82,7 +84,7 @@ class GoPiGoGUI:
         self.temp_fahrenheit = self.my_thp.safe_fahrenheit()
 
         # Compensate for heat of Raspberry Pi
-        self.temp_fahrenheit = self.temp_fahrenheit - 4
+        self.temp_fahrenheit = compensate_fahrenheit(self.temp_fahrenheit)
 
         # Read relative humidity
         self.humidity = self.my_thp.safe_humidity()
@@ -90,12 +92,8 @@ class GoPiGoGUI:
         # Read barometric pressure in pascals
         press_pascals = self.my_thp.safe_pressure()
 
-        # Convert pascals to inHg
-        press_inhg = press_pascals / 3386.3886666667
-
-        # Compensate for 3960' altitude 4.04
-        # Scottsbluff, NE, Heilig Field, 4.04
-        self.press_inhg = press_inhg + 4.04
+        # Convert to sea level pressure in inHg for our altitude
+        self.press_inhg = sea_level_inhg(press_pascals)
 
         # Read GPG3 battery voltage
         self.voltage = round(self.gpg.volt(), 1)
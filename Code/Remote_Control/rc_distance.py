@@ -7,16 +7,18 @@ Connect Distance Sensor to AD1 port
 # History
 # ------------------------------------------------
 # Author     Date           Comments
+# Loring     10/18/26       Ramp and coalesce motor commands with MotorCommander
+# Loring     10/18/26       Read sensors with the shared sensor hub
 # Loring     11/10/24       Add threading for distance sensor
 # Loring     09/12/21       Convert to EasyGoPiGo3, OOP, test with Python 3.7
 # Loring     10/23/21       Add battery voltage display
 """
 from tkinter import *       # Import tkinter for GUI
 from tkinter.ttk import *   # Add ttk themed widgets
-from time import sleep      # Import sleep function
-from threading import Thread
-
 import easygopigo3 as easy  # Import EasyGoPiGo3 library
+from sensor_hub import SensorHub  # One thread reads all of the sensors
+from ui_dispatcher import UIDispatcher  # Thread safe widget updates
+from motor_commands import MotorCommander  # Smooth motor speed changes
 MAX_SPEED = 300             # Maximum speed setting for GoPiGo3
 MIN_SPEED = 100             # Minimum speed setting for GoPiGo3
 
@@ -40,6 +42,9 @@ class GoPiGoGUI:
     # ---------------------- INITIALIZE GOPIGO3 ---------------------------- #
         # Create EasyGoPiGo3 object
         self.gpg = easy.EasyGoPiGo3()
+        # Ramps wheel speeds and skips repeated motor writes
+        self.motors = MotorCommander(self.gpg)
+        self.motors.start()
 
         # Set initial speed
         self.gpg.set_speed(150)
@@ -51,45 +56,41 @@ class GoPiGoGUI:
         self.servo2 = self.gpg.init_servo("SERVO2")
         self.servo2.rotate_servo(90)
 
-    # ---------------------- DISTANCE SENSOR THREAD ------------------------ #
-        self.create_widgets()
-        # Create flag for controlling the distance sensor thread
-        self.running = True
-
-        # Start distance sensor thread
-        self.sensor_thread = Thread(target=self.distance_sensor_loop)
-        # Thread will close when main program exits
-        self.sensor_thread.daemon = True
+    # ------------------------- SENSOR HUB --------------------------------- #
+        # The hub thread reads every sensor, the GUI reads the latest values
+        self.hub = SensorHub()
+        self.hub.add_sensor(
+            "distance", self.distance_sensor.read_inches, 0.1)
+        self.hub.add_sensor("voltage", self.gpg.volt, 5)
+        self.hub.start()
+        self.hub.wait_until_ready()
 
-        self.sensor_thread.start()
+        self.create_widgets()
+        # Show each new distance reading as the hub publishes it
+        self.ui = UIDispatcher(self.window)
+        self.hub.subscribe(self.sensor_reading)
         self.window.mainloop()
 
-# ---------------------- DISTANCE SENSOR LOOP ------------------------------ #
-    def distance_sensor_loop(self):
-        """Continuous loop for reading distance sensor"""
-        try:
-            while self.running:
-                # Read the sensor data in inches or mm
-                # mm = self.distance_sensor.read_mm()
-                inches = self.distance_sensor.read_inches()
-
-                # Calculate feet and inches
-                # Use integer division to get the whole number of feet
-                feet = inches // 12
-                # Use modulus to get the remaining inches
-                remaining_inches = inches % 12
-
-                # Display the values
-                self.lbl_distance_display.configure(
-                    text=f"  {feet:.0f}' {remaining_inches:.0f}\"")
-
-                # Add a small delay to prevent overwhelming the CPU
-                sleep(0.1)
-
-        except Exception as e:
-            self.lbl_distance_display.configure(text=f"Error: {e}")
-            # Uncomment the line below to see the error in the console
-            # print(f"Error in distance sensor thread: {e}")
+# ------------------------- SENSOR READING ------------------------------- #
+    def sensor_reading(self, name, value):
+        """Called on the sensor hub thread with every new reading
+        Widget updates are handed to the GUI thread by the dispatcher"""
+        if name != "distance":
+            return
+        if isinstance(value, Exception):
+            self.ui.configure(self.lbl_distance_display, text=f"Error: {value}")
+            return
+
+        # Calculate feet and inches
+        # Use integer division to get the whole number of feet
+        feet = value // 12
+        # Use modulus to get the remaining inches
+        remaining_inches = value % 12
+
+        # Only the latest distance is drawn, once per frame
+        self.ui.configure(
+            self.lbl_distance_display,
+            text=f"  {feet:.0f}' {remaining_inches:.0f}\"")
 
 # ------------------------- INCREASE SPEED --------------------------------- #
     def increase_speed(self):
@@ -118,8 +119,8 @@ class GoPiGoGUI:
 
 # ----------------------- GET BATTERY VOLTAGE ------------------------------ #
     def get_battery_voltage(self):
-        # Read GPG3 battery voltage
-        voltage = round(self.gpg.volt(), 1)
+        # Latest GPG3 battery voltage
+        voltage = round(self.hub.get("voltage", 0), 1)
         self.lbl_voltage.config(text=f"Voltage: {voltage}V")
 
 # --------------------------- KEY INPUT ------------------------------------ #
@@ -189,8 +190,7 @@ class GoPiGoGUI:
             self.quit()
 
         # Set motor speeds using DPS (Degrees Per Second)
-        self.gpg.set_motor_dps(self.gpg.MOTOR_LEFT, left_speed)
-        self.gpg.set_motor_dps(self.gpg.MOTOR_RIGHT, right_speed)
+        self.motors.set_speeds(left_speed, right_speed)
 
 # -------------------------- CREATE WIDGETS -------------------------------- #
     def create_widgets(self):
@@ -224,7 +224,7 @@ class GoPiGoGUI:
         # Get and display battery voltage
         btn_voltage = Button(text="Voltage", command=self.get_battery_voltage)
         # Round the voltage to 1 decimal place
-        voltage = round(self.gpg.volt(), 1)
+        voltage = round(self.hub.get("voltage", 0), 1)
         self.lbl_voltage = Label(
             text=f"Voltage: {voltage}V")
 
@@ -264,6 +264,9 @@ class GoPiGoGUI:
 
 # ----------------------------- QUIT PROGRAM ------------------------------- #
     def quit(self):
+        self.hub.stop()  # Stop reading sensors
+        self.motors.shutdown()
+        self.ui.stop()
         self.window.destroy()
 
 
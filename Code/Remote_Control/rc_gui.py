@@ -11,11 +11,15 @@ History
 Author     Date           Comments
 Loring     09/12/21       Convert to EasyGoPiGo3, OOP, test with Python 3.5
 Loring     10/23/21       Add battery voltage display
+Loring     10/18/26       Ramp and coalesce motor commands with MotorCommander
+Loring     10/18/26       Optional key to motor latency tracing
 
 """
 from tkinter import *       # Import tkinter for GUI
 from tkinter.ttk import *   # Add ttk themed widgets
 import easygopigo3 as easy  # Import EasyGoPiGo3 library
+from motor_commands import MotorCommander  # Smooth motor speed changes
+from latency_trace import get_tracer  # GOPIGO_LATENCY_TRACE=file.csv
 MAX_SPEED = 300             # Maximum speed setting for GoPiGo3
 MIN_SPEED = 100             # Minimum speed setting for GoPiGo3
 
@@ -37,6 +41,11 @@ class GoPiGoGUI:
     # ---------------------- INITIALIZE GOPIGO3 ---------------------------- #
         # Create EasyGoPiGo3 object
         self.gpg = easy.EasyGoPiGo3()
+        # Times key presses to motor writes when turned on
+        self.tracer = get_tracer(self.gpg)
+        # Ramps wheel speeds and skips repeated motor writes
+        self.motors = MotorCommander(self.gpg)
+        self.motors.start()
 
         # Set initial speed
         self.gpg.set_speed(150)
@@ -80,6 +89,8 @@ class GoPiGoGUI:
         """Get keystrokes for remote control"""
         # Get all key presses as lower case
         key_press = event.keysym.lower()
+        # event.time is when the X server saw the key
+        trace = self.tracer.begin("tk", event.time)
 
         # Get current speed setting
         base_speed = self.gpg.get_speed()
@@ -142,8 +153,8 @@ class GoPiGoGUI:
             self.quit()
 
         # Set motor speeds using DPS (Degrees Per Second)
-        self.gpg.set_motor_dps(self.gpg.MOTOR_LEFT, left_speed)
-        self.gpg.set_motor_dps(self.gpg.MOTOR_RIGHT, right_speed)
+        self.tracer.decision(trace)
+        self.motors.set_speeds(left_speed, right_speed)
 
 # -------------------------- CREATE WIDGETS -------------------------------- #
     def create_widgets(self):
@@ -210,6 +221,7 @@ class GoPiGoGUI:
 
 # --------------------------- QUIT PROGRAM --------------------------------- #
     def quit(self):
+        self.motors.shutdown()
         self.window.destroy()
 
 
@@ -10,13 +10,16 @@
 # History
 # ------------------------------------------------
 # Author     Date           Comments
+# Loring     10/18/26       Use weather_units for pressure and self heating
+# Loring     10/18/26       Save BME280 readings with TimeSeriesStore
+# Loring     10/18/26       Drive with PS4 controller events, no polling loop
+# Loring     10/18/26       Ramp and coalesce motor commands with MotorCommander
 # Loring     03/23/25       Add PS4 controller support with PyGame
 # Loring     09/12/21       Convert to EasyGoPiGo3, OOP, test with Python 3.7
 # Loring     10/23/21       Add battery voltage display
 # Loring     11/11/21       Add BME280 sensor display
 # Loring     08/15/24       Add PS4 controller support
 
-from time import sleep      # Import sleep function
 from threading import Thread
 
 import tkinter as tk
@@ -26,7 +29,18 @@ import easygopigo3 as easy
 from di_sensors.easy_temp_hum_press import EasyTHPSensor
 
 # Import ps4 controller library
-from ps4_gopigo_pygame import PS4Controller
+from ps4_gopigo_pygame import (
+    PS4Controller, drive_speeds, LEFT_STICK_Y, RIGHT_STICK_X, STOP_BUTTON)
+# One thread reads all of the sensors
+from sensor_hub import SensorHub
+# Thread safe widget updates
+from ui_dispatcher import UIDispatcher
+# Smooth motor speed changes with fewer SPI writes
+from motor_commands import MotorCommander
+# Compressed history of the BME280 readings
+from timeseries_store import TimeSeriesStore
+# Pressure and temperature conversions
+from weather_units import sea_level_inhg, compensate_fahrenheit
 
 # Set servo pointing straight ahead
 # You may have to change the degrees to adapt to your servo
@@ -34,6 +48,9 @@ from ps4_gopigo_pygame import PS4Controller
 FORWARD = 90
 MAX_SPEED = 600             # Maximum speed setting for GoPiGo3
 MIN_SPEED = 100             # Minimum speed setting for GoPiGo3
+# Hub sensor name: history series name
+HISTORY = {"temp_f": "temperature", "humidity": "humidity",
+           "pressure": "pressure"}
 
 
 class GoPiGoGUI:
@@ -54,9 +71,14 @@ class GoPiGoGUI:
 
     # ---------------------- INITIALIZE GOPIGO3 ---------------------------- #
         self.gpg = easy.EasyGoPiGo3()
+        # Ramps wheel speeds and skips repeated motor writes
+        self.motors = MotorCommander(self.gpg)
+        self.motors.start()
 
         # Create EasyTHPSensor object
         self.my_thp = EasyTHPSensor()
+        # Only the sensor hub thread adds readings
+        self.history = TimeSeriesStore()
 
         # Initialize distance sensor, connect to AD1 port
         self.distance_sensor = self.gpg.init_distance_sensor('AD1')
@@ -70,15 +92,22 @@ class GoPiGoGUI:
         controller_thread.daemon = True
         controller_thread.start()
 
-    # ---------------------- DISTANCE SENSOR THREAD ------------------------ #
-        # Create flag for controlling the distance sensor thread
-        self.running = True
-
-        # Start distance sensor thread
-        self.sensor_thread = Thread(target=self.distance_sensor_loop)
-        # Thread will close when main program exits
-        self.sensor_thread.daemon = True
-        self.sensor_thread.start()
+    # ------------------------- SENSOR HUB --------------------------------- #
+        # Widget updates from the hub thread, run once the mainloop starts
+        self.ui = UIDispatcher(self.window)
+        # The hub thread reads every sensor, the GUI reads the latest values
+        self.hub = SensorHub()
+        self.hub.add_sensor(
+            "distance", self.distance_sensor.read_inches, 0.1)
+        # Read the BME280 sensor and battery every 15 seconds
+        self.hub.add_sensor("temp_f", self.my_thp.safe_fahrenheit, 15)
+        self.hub.add_sensor("humidity", self.my_thp.safe_humidity, 15)
+        self.hub.add_sensor("pressure", self.my_thp.safe_pressure, 15)
+        self.hub.add_sensor("voltage", self.gpg.volt, 15)
+        # Subscribe before starting so the first readings are saved too
+        self.hub.subscribe(self.sensor_reading)
+        self.hub.start()
+        self.hub.wait_until_ready()
 
         # Set initial speed
         self.gpg.set_speed(200)
@@ -96,66 +125,84 @@ class GoPiGoGUI:
         # Start the mainloop of the tkinter program
         self.window.mainloop()
 
-# ---------------------- DISTANCE SENSOR LOOP ---------------------------- #
-    def distance_sensor_loop(self):
-        """Continuous loop for reading distance sensor"""
-        try:
-            while self.running:
-                # Read the sensor data in inches or mm
-                # mm = self.distance_sensor.read_mm()
-                inches = self.distance_sensor.read_inches()
-
-                # Calculate feet and inches
-                # Use integer division to get the whole number of feet
-                feet = inches // 12
-                # Use modulus to get the remaining inches
-                remaining_inches = inches % 12
-
-                # Print the values
-                self.lbl_distance.config(
-                    text=f"Distance: {feet:.0f}' {remaining_inches:.0f}\"")
-
-                # Add a small delay to prevent overwhelming the CPU
-                sleep(0.1)
-
-        except Exception as e:
-            self.lbl_distance.config(text=f"Distance: Error {e}")
-            # Uncomment the line below to see the error in the console
-            # print(f"Error in distance sensor thread: {e}")
+# ------------------------- SENSOR READING ----------------------------- #
+    def sensor_reading(self, name, value):
+        """Called on the sensor hub thread with every new reading
+        Widget updates are handed to the GUI thread by the dispatcher"""
+        if name in HISTORY and not isinstance(value, Exception):
+            self.history.append(HISTORY[name], value)
+        if name != "distance":
+            return
+        if isinstance(value, Exception):
+            text = f"Distance: Error {value}"
+        else:
+            # Calculate feet and inches
+            # Use integer division to get the whole number of feet
+            feet = value // 12
+            # Use modulus to get the remaining inches
+            remaining_inches = value % 12
+            text = f"Distance: {feet:.0f}' {remaining_inches:.0f}\""
+
+        # Only the latest distance is drawn, once per frame
+        # The label is looked up on the GUI thread, readings can
+        # arrive before create_widgets() has made it
+        self.ui.post("distance", self.show_distance, text)
+
+    def show_distance(self, text):
+        """Called on the GUI thread by the dispatcher"""
+        self.lbl_distance.configure(text=text)
 
 # --------------------- RUN CONTROLLER IN THREAD ------------------------- #
     def controller_task(self):
         """Background thread for PS4 controller"""
         try:
             self.ps4_controller = PS4Controller()
+            speeds = (0, 0)
             while self.controller_running:
-                # Non-blocking update
-                sleep(0.016)  # ~60Hz refresh rate
+                # Sleeps until a stick or button changes,
+                # wakes up every half second to check controller_running
+                axes_changed, buttons = self.ps4_controller.wait_for_input()
+                if STOP_BUTTON in buttons:
+                    self.motors.stop()
+                    speeds = (0, 0)
+                    continue
+                if not axes_changed:
+                    continue
+
+                axes = self.ps4_controller.axes
+                new_speeds = drive_speeds(
+                    -self.deadzone(axes[LEFT_STICK_Y]),
+                    self.deadzone(axes[RIGHT_STICK_X]),
+                    self.gpg.get_speed())
+                # Only drive when the stick moved enough to matter,
+                # the keyboard keeps control while the sticks rest
+                if new_speeds != speeds:
+                    speeds = new_speeds
+                    self.motors.set_speeds(*speeds)
         except Exception as e:
             print(f"Controller error: {e}")
 
+    def deadzone(self, value):
+        """Ignore small stick movements around the center"""
+        return 0 if abs(value) < 0.1 else value
+
 # -------------------------- READ ENVIRONMENT DATA ----------------------- #
     def read_environment_data(self):
-        """Read Bosch bme280 sensor, temp, humidity, pressure"""
+        """Get the latest Bosch bme280 temp, humidity, pressure readings"""
         # Read temperature
-        # temp = my_thp.safe_celsius()
-        self.temp_f = self.my_thp.safe_fahrenheit()
+        self.temp_f = self.hub.get("temp_f", 0)
         # Compensate for heat of Raspberry Pi
-        self.temp_f = self.temp_f - 4
+        self.temp_f = compensate_fahrenheit(self.temp_f)
         # Read relative humidity
-        self.humidity = self.my_thp.safe_humidity()
+        self.humidity = self.hub.get("humidity", 0)
 
         # Read barometric pressure in pascals
-        press_pascals = self.my_thp.safe_pressure()
-        # Convert pascals to inHg
-        press_inhg = press_pascals / 3386.3886666667
-
-        # Compensate for 3960' altitude 4.04
-        # Scottsbluff, NE, Heilig Field, 4.04
-        self.press_inhg = press_inhg + 4.04
+        press_pascals = self.hub.get("pressure", 0)
+        # Convert to sea level pressure in inHg for our altitude
+        self.press_inhg = sea_level_inhg(press_pascals)
 
         # Read GPG3 battery voltage
-        self.voltage = round(self.gpg.volt(), 1)
+        self.voltage = round(self.hub.get("voltage", 0), 1)
 
 # ------------------- DISPLAY ENVIRONMENT DATA --------------------------- #
     def display_environment_data(self):
@@ -171,7 +218,7 @@ class GoPiGoGUI:
         self.lbl_pressure.config(
             text=f"Press: {round(self.press_inhg, 2)} inHg")
 
-        # Every 15 seconds (15000 ms), read the BME280 sensor
+        # Every 15 seconds (15000 ms), show the latest BME280 readings
         # 'after' runs a function so many milliseconds after the mainloop starts
         # this callback function runs when the mainloop isn't busy
         # 'after' is a non blocking call, it does not interrupt or stall execution
@@ -269,8 +316,7 @@ class GoPiGoGUI:
             self.quit()
 
         # Set motor speeds using DPS (Degrees Per Second)
-        self.gpg.set_motor_dps(self.gpg.MOTOR_LEFT, left_speed)
-        self.gpg.set_motor_dps(self.gpg.MOTOR_RIGHT, right_speed)
+        self.motors.set_speeds(left_speed, right_speed)
 
 # ------------------------- CREATE FRAMES -------------------------------- #
     def create_frames(self):
@@ -397,11 +443,17 @@ class GoPiGoGUI:
         # This will capture all keystrokes for remote control of robot
         self.window.bind_all('<Key>', self.remote_control)
 
+        # Start updating the environment display
+        self.window.after(15000, self.display_environment_data)
+
 # ----------------------------- QUIT PROGRAM ------------------------------- #
     def quit(self):
         """Clean shutdown"""
         self.controller_running = False
-        self.running = False  # Stop distance sensor
+        self.hub.stop()  # Stop reading sensors
+        self.history.close()
+        self.motors.shutdown()
+        self.ui.stop()
         self.window.destroy()
 
 
@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+    Name:    timeseries_store.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Keep a history of sensor readings on the SD card
+    Readings are added to a file for each series and day, never rewritten
+    Every chunk_size readings, or every flush_seconds for slow sensors,
+    the buffered readings are compressed into one chunk:
+        times are rounded to TIME_UNIT_MS and stored as the change in
+        the time step, which is 0 for readings taken at a steady rate
+        values are rounded to the sensor's useful precision and
+        stored as the change from the previous value
+        the changes are stored in the fewest bytes that hold them,
+        regrouped by byte and zlib compressed
+    Hourly and daily min/max/mean are kept in small fixed size files,
+    minute rollups are worked out from the readings when asked for,
+    so they go back as far as the readings kept
+    Readings are rounded, not compressed bit for bit like floats,
+    the rounded changes of a slow sensor are mostly 0 and compress best
+    Size on the SD card for one series read once a second:
+        readings, set by sensor noise, about 50-70 KB a day
+        hourly and daily rollups, about 220 KB a year
+    Readings older than keep_days (14) are deleted once a day and the
+    rollups are kept, so a year of one 1 Hz series is about 1.2 MB
+    keep_days=None keeps every reading, about 18-25 MB a year a series
+    Usage: python3 timeseries_store.py [folder] shows what is stored
+"""
+import os
+import struct
+import sys
+import time
+import zlib
+from datetime import datetime, timezone
+
+import numpy as np
+
+# Rounding for each kind of reading, smaller changes are sensor noise
+# temperature °F, humidity %, pressure pascals, gas resistance ohms
+PRECISION = {
+    'temperature': 0.1,
+    'humidity': 0.1,
+    'pressure': 1.0,
+    'gas_resistance': 100.0,
+}
+DEFAULT_PRECISION = 0.001
+
+# magic, start ms, count, precision, first value, time unit ms,
+# bytes per time change, bytes per value change, times bytes, values bytes
+CHUNK_HEADER = struct.Struct('<4sqIdqHBBII')
+CHUNK_MAGIC = b'TSC2'
+# Times are kept to a tenth of a second, timer jitter is not stored
+TIME_UNIT_MS = 100
+# Days of readings kept, the rollups are kept for good
+KEEP_DAYS = 14
+
+# Seconds in each rollup
+ROLLUPS = {'1m': 60, '1h': 3600, '1d': 86400}
+# Rollups kept on disk, minutes are worked out from the readings
+STORED_ROLLUPS = ('1h', '1d')
+ROLLUP_DTYPE = np.dtype([
+    ('time', '<i8'),      # Start of the bucket, seconds since 1970
+    ('min', '<f4'),
+    ('max', '<f4'),
+    ('mean', '<f4'),
+    ('count', '<u4'),
+])
+
+
+# ------------------------------ ZIGZAG ------------------------------------ #
+def zigzag(numbers):
+    """0, -1, 1, -2, 2... become 0, 1, 2, 3, 4...
+    Small changes either way become small positive numbers"""
+    numbers = np.asarray(numbers, dtype=np.int64)
+    return ((numbers << 1) ^ (numbers >> 63)).astype(np.uint64)
+
+
+def unzigzag(numbers):
+    numbers = np.asarray(numbers, dtype=np.uint64)
+    return ((numbers >> 1).astype(np.int64)
+            ^ -(numbers & 1).astype(np.int64))
+
+
+def narrow(numbers):
+    """Smallest unsigned type that holds every number"""
+    largest = int(numbers.max()) if len(numbers) else 0
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if largest <= np.iinfo(dtype).max:
+            return numbers.astype(dtype)
+    return numbers.astype(np.uint64)
+
+
+# ---------------------------- BYTE SHUFFLE -------------------------------- #
+def shuffle(array):
+    """Group the first bytes of every number together, then the second...
+    Small numbers leave whole rows of zero bytes that compress well"""
+    return array.view(np.uint8).reshape(-1, array.itemsize).T.tobytes()
+
+
+def unshuffle(data, dtype, count):
+    dtype = np.dtype(dtype)
+    rows = np.frombuffer(data, dtype=np.uint8).reshape(dtype.itemsize, count)
+    return np.ascontiguousarray(rows.T).view(dtype).reshape(count)
+
+
+# ---------------------------- ENCODE CHUNK -------------------------------- #
+def encode_chunk(times_ms, values, precision, time_unit=TIME_UNIT_MS):
+    """Compress readings into one chunk record"""
+    times = np.round(np.asarray(times_ms) / time_unit).astype(np.int64)
+    quantized = np.round(np.asarray(values) / precision).astype(np.int64)
+    # Change in the time step, 0 while readings are evenly spaced
+    step_changes = narrow(zigzag(np.diff(np.diff(times), prepend=0)))
+    changes = narrow(zigzag(np.diff(quantized)))
+
+    times_data = zlib.compress(shuffle(step_changes), 9)
+    values_data = zlib.compress(shuffle(changes), 9)
+    header = CHUNK_HEADER.pack(
+        CHUNK_MAGIC, int(times[0]) * time_unit, len(times), precision,
+        int(quantized[0]), time_unit, step_changes.itemsize,
+        changes.itemsize, len(times_data), len(values_data))
+    return header + times_data + values_data
+
+
+def decode_chunk(start_ms, count, precision, first, time_unit,
+                 times_data, times_size, values_data, values_size):
+    """Readings from one chunk as (times in seconds, values)"""
+    step_changes = unzigzag(unshuffle(zlib.decompress(times_data),
+                                      f'<u{times_size}', count - 1))
+    changes = unzigzag(unshuffle(zlib.decompress(values_data),
+                                 f'<u{values_size}', count - 1))
+    steps = np.cumsum(step_changes)
+    times_ms = start_ms + time_unit * np.concatenate(([0], np.cumsum(steps)))
+    quantized = first + np.concatenate(([0], np.cumsum(changes)))
+    return times_ms / 1000, quantized * precision
+
+
+def read_chunks(path):
+    """Yield the decode_chunk() arguments of every chunk in a file"""
+    with open(path, 'rb') as file:
+        while True:
+            header = file.read(CHUNK_HEADER.size)
+            if len(header) < CHUNK_HEADER.size:
+                return
+            (magic, start_ms, count, precision, first, time_unit,
+             times_size, values_size, tlen, vlen) = \
+                CHUNK_HEADER.unpack(header)
+            if magic != CHUNK_MAGIC:
+                raise ValueError(f"{path} is damaged")
+            data = file.read(tlen + vlen)
+            if len(data) < tlen + vlen:
+                # Cut off by a power failure, the rest is lost
+                return
+            yield (start_ms, count, precision, first, time_unit,
+                   data[:tlen], times_size, data[tlen:], values_size)
+
+
+class Series:
+    """Buffer, chunk files and rollups for one kind of reading"""
+
+    def __init__(self, folder, name, chunk_size, flush_seconds):
+        self.folder = os.path.join(folder, name)
+        os.makedirs(self.folder, exist_ok=True)
+        self.precision = PRECISION.get(name, DEFAULT_PRECISION)
+        self.chunk_size = chunk_size
+        self.flush_ms = flush_seconds * 1000
+        self.times_ms = []
+        self.values = []
+        # Rollup being built for each stored resolution
+        self.buckets = {}
+
+    def append(self, timestamp, value):
+        # Rounded the way it will be stored
+        times_ms = round(timestamp * 1000 / TIME_UNIT_MS) * TIME_UNIT_MS
+        # A new day starts a new file, flush the old day first
+        if self.times_ms and day(self.times_ms[0]) != day(times_ms):
+            self.flush()
+        self.times_ms.append(times_ms)
+        self.values.append(value)
+        self.add_to_rollups(timestamp, value)
+        # Write by count, or by time so a crash or power loss
+        # loses no more than flush_seconds of readings
+        if (len(self.times_ms) >= self.chunk_size
+                or times_ms - self.times_ms[0] >= self.flush_ms):
+            self.flush()
+
+    def flush(self):
+        """Write buffered readings as a chunk"""
+        if not self.times_ms:
+            return
+        chunk = encode_chunk(self.times_ms, self.values, self.precision)
+        path = os.path.join(self.folder, f"{day(self.times_ms[0])}.chunks")
+        with open(path, 'ab') as file:
+            file.write(chunk)
+        self.times_ms = []
+        self.values = []
+
+    def add_to_rollups(self, timestamp, value):
+        for resolution in STORED_ROLLUPS:
+            start = int(timestamp // ROLLUPS[resolution] * ROLLUPS[resolution])
+            bucket = self.buckets.get(resolution)
+            if bucket is not None and bucket[0] != start:
+                self.write_rollup(resolution, bucket)
+                bucket = None
+            if bucket is None:
+                # [start, min, max, total, count]
+                bucket = [start, value, value, 0.0, 0]
+                self.buckets[resolution] = bucket
+            bucket[1] = min(bucket[1], value)
+            bucket[2] = max(bucket[2], value)
+            bucket[3] += value
+            bucket[4] += 1
+
+    def write_rollup(self, resolution, bucket):
+        start, low, high, total, count = bucket
+        record = np.array([(start, low, high, total / count, count)],
+                          dtype=ROLLUP_DTYPE)
+        with open(os.path.join(self.folder, f"{resolution}.rollup"),
+                  'ab') as file:
+            file.write(record.tobytes())
+
+    def close(self):
+        """Write everything, an unfinished bucket is merged on read"""
+        self.flush()
+        for resolution, bucket in self.buckets.items():
+            self.write_rollup(resolution, bucket)
+        self.buckets = {}
+
+
+def day(times_ms):
+    """UTC date of a time in ms, names the chunk file"""
+    return datetime.fromtimestamp(times_ms / 1000, timezone.utc).strftime(
+        "%Y-%m-%d")
+
+
+class TimeSeriesStore:
+    """Append only, compressed history of sensor readings"""
+
+    def __init__(self, folder="sensor_history", chunk_size=600,
+                 flush_seconds=300, keep_days=KEEP_DAYS):
+        self.folder = folder
+        self.chunk_size = chunk_size
+        self.flush_seconds = flush_seconds
+        # None keeps every reading
+        self.keep_days = keep_days
+        self.pruned_day = None
+        self.series = {}
+
+    def get_series(self, name):
+        if name not in self.series:
+            self.series[name] = Series(self.folder, name, self.chunk_size,
+                                       self.flush_seconds)
+        return self.series[name]
+
+# -------------------------------- APPEND -------------------------------- #
+    def append(self, name, value, timestamp=None):
+        """Add one reading, timestamp is seconds since 1970"""
+        if timestamp is None:
+            timestamp = time.time()
+        self.get_series(name).append(timestamp, float(value))
+        # Once a day drop the oldest readings, the rollups stay
+        today = int(timestamp // 86400)
+        if self.keep_days is not None and today != self.pruned_day:
+            self.pruned_day = today
+            self.prune(self.keep_days)
+
+    def append_many(self, readings, timestamp=None):
+        """Add {name: value, ...} taken at the same time"""
+        if timestamp is None:
+            timestamp = time.time()
+        for name, value in readings.items():
+            self.append(name, value, timestamp)
+
+# --------------------------------- FLUSH -------------------------------- #
+    def flush(self):
+        """Write buffered readings to the SD card"""
+        for series in self.series.values():
+            series.flush()
+
+    def close(self):
+        for series in self.series.values():
+            series.close()
+
+# --------------------------------- NAMES -------------------------------- #
+    def names(self):
+        """Names of the stored series"""
+        if not os.path.isdir(self.folder):
+            return []
+        return sorted(name for name in os.listdir(self.folder)
+                      if os.path.isdir(os.path.join(self.folder, name)))
+
+# --------------------------------- QUERY -------------------------------- #
+    def query(self, name, start=None, end=None):
+        """Readings between start and end, seconds since 1970
+        Returns (times, values) NumPy arrays"""
+        start = 0 if start is None else start
+        end = time.time() + 1 if end is None else end
+        folder = os.path.join(self.folder, name)
+        times, values = [], []
+
+        if os.path.isdir(folder):
+            # Only open the files for the days in the range
+            first_day = day(start * 1000)
+            last_day = day(end * 1000)
+            for filename in sorted(os.listdir(folder)):
+                file_day = filename[:-len('.chunks')]
+                if (not filename.endswith('.chunks')
+                        or not first_day <= file_day <= last_day):
+                    continue
+                for chunk in read_chunks(os.path.join(folder, filename)):
+                    if chunk[0] / 1000 > end:
+                        break
+                    chunk_times, chunk_values = decode_chunk(*chunk)
+                    if chunk_times[-1] < start:
+                        continue
+                    times.append(chunk_times)
+                    values.append(chunk_values)
+
+        # Readings not written yet
+        series = self.series.get(name)
+        if series is not None and series.times_ms:
+            times.append(np.array(series.times_ms) / 1000)
+            values.append(np.array(series.values))
+
+        if not times:
+            return np.empty(0), np.empty(0)
+        times = np.concatenate(times)
+        values = np.concatenate(values)
+        keep = (times >= start) & (times <= end)
+        return times[keep], values[keep]
+
+# -------------------------------- ROLLUP -------------------------------- #
+    def rollup(self, name, resolution, start=None, end=None):
+        """min/max/mean/count for each minute, hour or day, 1m, 1h or 1d
+        Returns a NumPy array with ROLLUP_DTYPE"""
+        if resolution not in STORED_ROLLUPS:
+            return self.rollup_readings(name, resolution, start, end)
+
+        start = 0 if start is None else start
+        end = time.time() + 1 if end is None else end
+        path = os.path.join(self.folder, name, f"{resolution}.rollup")
+        records = [np.fromfile(path, dtype=ROLLUP_DTYPE)
+                   if os.path.exists(path) else np.empty(0, ROLLUP_DTYPE)]
+        # The bucket being built right now
+        series = self.series.get(name)
+        if series is not None and resolution in series.buckets:
+            bucket_start, low, high, total, count = series.buckets[resolution]
+            records.append(np.array(
+                [(bucket_start, low, high, total / count, count)],
+                dtype=ROLLUP_DTYPE))
+        records = np.concatenate(records)
+        records = records[(records['time'] >= start - ROLLUPS[resolution])
+                          & (records['time'] <= end)]
+        return merge_buckets(records)
+
+    def rollup_readings(self, name, resolution, start=None, end=None):
+        """Rollup worked out from the readings"""
+        seconds = ROLLUPS[resolution]
+        times, values = self.query(name, start, end)
+        if not len(times):
+            return np.empty(0, ROLLUP_DTYPE)
+        buckets = (times // seconds * seconds).astype(np.int64)
+        starts, index, counts = np.unique(
+            buckets, return_index=True, return_counts=True)
+        result = np.empty(len(starts), dtype=ROLLUP_DTYPE)
+        result['time'] = starts
+        result['min'] = np.minimum.reduceat(values, index)
+        result['max'] = np.maximum.reduceat(values, index)
+        result['mean'] = np.add.reduceat(values, index) / counts
+        result['count'] = counts
+        return result
+
+# --------------------------------- PRUNE -------------------------------- #
+    def prune(self, keep_days):
+        """Delete readings older than keep_days, the rollups are kept
+        Called once a day by append() with the store's keep_days"""
+        oldest = day((time.time() - keep_days * 86400) * 1000)
+        for name in self.names():
+            folder = os.path.join(self.folder, name)
+            for filename in os.listdir(folder):
+                if (filename.endswith('.chunks')
+                        and filename[:-len('.chunks')] < oldest):
+                    os.remove(os.path.join(folder, filename))
+
+# --------------------------------- SIZE --------------------------------- #
+    def size_bytes(self):
+        """Space used on the SD card"""
+        total = 0
+        for root, _, files in os.walk(self.folder):
+            total += sum(os.path.getsize(os.path.join(root, name))
+                         for name in files)
+        return total
+
+
+def merge_buckets(records):
+    """Combine records for the same bucket, written when a program
+    stopped partway through an hour or day and started again"""
+    if len(records) == 0:
+        return records
+    records = np.sort(records, order='time')
+    starts, index = np.unique(records['time'], return_index=True)
+    if len(starts) == len(records):
+        return records
+    counts = np.add.reduceat(records['count'], index)
+    totals = np.add.reduceat(
+        records['mean'].astype(np.float64) * records['count'], index)
+    merged = np.empty(len(starts), dtype=ROLLUP_DTYPE)
+    merged['time'] = starts
+    merged['min'] = np.minimum.reduceat(records['min'], index)
+    merged['max'] = np.maximum.reduceat(records['max'], index)
+    merged['mean'] = totals / counts
+    merged['count'] = counts
+    return merged
+
+
+def main():
+    """Show what is stored and the last day of hourly rollups"""
+    store = TimeSeriesStore(sys.argv[1] if len(sys.argv) > 1
+                            else "sensor_history")
+    print(f"{store.folder}: {store.size_bytes() / 1024:.1f} KB")
+    for name in store.names():
+        times, values = store.query(name)
+        if not len(times):
+            continue
+        print(f"\n{name}: {len(times)} readings from "
+              f"{datetime.fromtimestamp(times[0]):%Y-%m-%d %H:%M} to "
+              f"{datetime.fromtimestamp(times[-1]):%Y-%m-%d %H:%M}")
+        for record in store.rollup(name, '1h', times[-1] - 86400)[-24:]:
+            print(f"  {datetime.fromtimestamp(record['time']):%m-%d %H:00}"
+                  f"  min {record['min']:9.2f}  max {record['max']:9.2f}"
+                  f"  mean {record['mean']:9.2f}  ({record['count']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@
 # Author    Date        Comments
 # Loring    10/24/21    Changed to fahrenheit, convert pressure to inHg,
 #                       compensate for altitude
+# Loring    10/18/26    Sea level pressure from weather_units
 
 # Barometric pressure compensation for altitude:
 # https://www.engineeringtoolbox.com/barometers-elevation-compensation-d_1812.html
@@ -22,6 +23,8 @@ from time import sleep
 # EasyTHPSensor rounds data to 0 decimal for temp and humidty
 from di_sensors.easy_temp_hum_press import EasyTHPSensor
 from easygopigo3 import EasyGoPiGo3  # Import GoPiGo3 library
+# Pressure conversion for our altitude
+from weather_units import sea_level_inhg
 
 # Create an instance of the GoPiGo3 class
 gpg = EasyGoPiGo3()
@@ -44,8 +47,8 @@ try:
         # Read pressure in pascals
         pressure = my_thp.safe_pressure()
 
-        # Convert pascals to inHg, compensate for 4000' altitude
-        pressure = (pressure / 3386.38867) + 4.08
+        # Convert to sea level pressure in inHg for our altitude
+        pressure = sea_level_inhg(pressure)
 
         # Print values to the console
         print(f"Temperature: {temperature:3.0f}°F | Humidity: {humidity:3.0f}% | Pressure: {pressure:3.2f} inHg")
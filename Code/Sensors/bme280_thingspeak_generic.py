@@ -5,6 +5,8 @@
     Created: 10/27/21 Revised:
     Purpose: Upload temperature, humidity, and barometric pressure
     to a ThingSpeak Channel
+    Readings are saved on the Pi and sent in batches, see
+    thingspeak_uploader.py, nothing is lost when the network is down
 """
 # This uses the EasyGoPiGo3 library
 # https://gopigo3.readthedocs.io/en/master/api-basic/easygopigo3.html#easygopigo3
@@ -12,17 +14,22 @@
 # Import the time library for the sleep function
 import time
 import sys  # For clean CTRL-C break
-import requests
 # Import GoPiGo3 library
 from easygopigo3 import EasyGoPiGo3
 # Import sensor library
 from di_sensors.easy_temp_hum_press import EasyTHPSensor
+# Saves readings and uploads them in the background
+from thingspeak_uploader import ThingSpeakUploader
+# Pressure conversion for our altitude
+from weather_units import sea_level_inhg
 
 # api key for updating ThingSpeak
 TS_KEY = "Your ThingSpeak API Key"
+# Channel ID from the ThingSpeak channel page
+TS_CHANNEL = "Your ThingSpeak Channel ID"
 
-# ThingSpeak data dictionary
-ts_data = {}
+# Readings wait in this file until they are uploaded
+uploader = ThingSpeakUploader(TS_CHANNEL, TS_KEY)
 
 # Create an instance of the GoPiGo3 class
 gpg = EasyGoPiGo3()
@@ -35,9 +42,11 @@ def main():
     print(" +-------------------------------------------------------+")
     print(" | Thingspeak BME280 Temperature, Humidity, and Pressure |")
     print(" +-------------------------------------------------------+")
-    minutes = float(input(" Minutes between uploads: "))
+    minutes = float(input(" Minutes between readings: "))
     read_time = minutes * 60
-    
+
+    # Send anything left over from last time, then new readings
+    uploader.start()
     while True:
         # ============================================================
         # field1: Read Temperature in Fahrenheit
@@ -51,11 +60,8 @@ def main():
         # field3: Read barometric pressure in pascals
         press_pascals = my_thp.safe_pressure()
 
-        # Convert pascals to inHg
-        press_inhg = press_pascals / 3386.3886666667
-        # Compensate for 3960' altitude 4.04
-        # Scottsbluff, NE, Heilig Field, 4.04
-        press_inhg = press_inhg + 4.04
+        # Convert to sea level pressure in inHg for our altitude
+        press_inhg = sea_level_inhg(press_pascals)
 
         # Print the values to the console
         print(" Upload data to ThingSpeak (CTRL-C to quit)")
@@ -67,40 +73,24 @@ def main():
         # Send sensor data to ThingSpeak
         thingspeak_send(temp, hum, press_inhg)
 
-        # 20 seconds is the minimum amount of time between uploads
+        # Readings are sent in batches at most every 15 seconds,
+        # reading more often than that is fine
         time.sleep(read_time)
 
 
 # --------------------- SEND TO THINGSPEAK ------------------------------- #
 def thingspeak_send(temp, hum, press):
     """
-        Update the ThingSpeak channel using the requests library
+        Save the reading for the ThingSpeak channel,
+        the uploader sends it in the background
     """
-    print(" Update Thingspeak Channel")
-
     # Each field number corresponds to a field in ThingSpeak
-    params = {
-        "api_key": TS_KEY,
+    uploader.add({
         "field1": temp,
         "field2": hum,
         "field3": press
-    }
-
-    # Update data on Thingspeak
-    ts_update = requests.get(
-        "https://api.thingspeak.com/update",
-        params=params
-    )
-
-    # Was the update successful?
-    if ts_update.status_code == requests.codes.ok:
-        print(" Data Received!")
-    else:
-        print(f"Error Code: {ts_update.status_code}")
-
-    # Print ThngSpeak response to console
-    # ts_update.text is the thingspeak data entry number in the channel
-    print(f" ThingSpeak Channel Entry: {ts_update.text}")
+    })
+    print(f" Readings waiting to upload: {uploader.pending()}")
 
 
 # If a standalone program, call the main function
@@ -109,6 +99,8 @@ if __name__ == '__main__':
     try:
         main()
     except KeyboardInterrupt:
+        # Readings that weren't sent are uploaded on the next run
+        uploader.stop()
         # Unconfigure the sensors, disable the motors,
         # and restore the LED to the control of the GoPiGo3 firmware
         gpg.reset_all()
@@ -2,15 +2,25 @@
 """
     Name:    bme280_tkinter.py
     Author:  William A Loring
-    Created: 10/27/21 Revised:
+    Created: 10/27/21 Revised: 10/18/26
     Purpose: Tkinter read temperature, humidity,
     and barometric pressure every 15 seconds
+    Every reading is saved in sensor_history with TimeSeriesStore
+    A trend line of the last hour or day is drawn beside each reading
 """
 
+from time import time
 from tkinter import *
 from tkinter.ttk import *
 from easygopigo3 import EasyGoPiGo3
 from di_sensors.easy_temp_hum_press import EasyTHPSensor
+from timeseries_store import TimeSeriesStore
+from sparkline import Sparkline
+from weather_units import sea_level_inhg
+
+# Seconds of history shown by the trend lines
+HOUR = 3600
+DAY = 86400
 
 
 class THP_Sensor:
@@ -23,14 +33,15 @@ class THP_Sensor:
         # Color and padding to edge of window
         self.window.config(padx=10, pady=10)
 
-        # Setup after to call function every 15 seconds
-        self.window.after(15000, self.read_sensors)
         # Initialize GoPiGo3 object
         self.gpg = EasyGoPiGo3()
         # Initialize THP object
         self.my_thp = EasyTHPSensor()
+        # History of every reading
+        self.history = TimeSeriesStore()
 
         self.create_widgets()
+        self.load_history()
         self.read_sensors()
         self.window.protocol("WM_DELETE_WINDOW", self.on_closing)
         mainloop()
@@ -44,9 +55,18 @@ class THP_Sensor:
         self.humidity = self.my_thp.safe_humidity()
         # Read the pressure in pascals
         press = self.my_thp.safe_pressure()
-        # Convert pascals to inHg, compensate for 4000' altitude
-        self.pressure = (press/3386.33857) + 4.08
+        # Convert to sea level pressure in inHg for our altitude
+        self.pressure = sea_level_inhg(press)
+        self.read_time = time()
+        # Save the sensor's own values, pressure in pascals
+        self.history.append_many({
+            "temperature": self.temperature,
+            "humidity": self.humidity,
+            "pressure": press,
+        }, self.read_time)
         self.display_sensors()
+        # Call this function again in 15 seconds
+        self.window.after(15000, self.read_sensors)
 
 # ------------------------- DISPLAY SENSORS ------------------------------ #
     def display_sensors(self):
@@ -54,6 +74,24 @@ class THP_Sensor:
         self.lbl_temp.config(text=f"{self.temperature:.0f}°F")
         self.lbl_hum.config(text=f"{self.humidity:.0f}%")
         self.lbl_press.config(text=f"{self.pressure:.2f} inHg")
+        # Add the reading to the end of each trend line
+        self.spark_temp.add(self.read_time, self.temperature)
+        self.spark_hum.add(self.read_time, self.humidity)
+        self.spark_press.add(self.read_time, self.pressure)
+
+# --------------------------- LOAD HISTORY -------------------------------- #
+    def load_history(self):
+        """Draw the saved history for the hour or day selected"""
+        window = self.trend_window.get()
+        start = time() - window
+        for spark, name in ((self.spark_temp, "temperature"),
+                            (self.spark_hum, "humidity"),
+                            (self.spark_press, "pressure")):
+            times, values = self.history.query(name, start)
+            if name == "pressure":
+                values = sea_level_inhg(values)
+            spark.set_window(window)
+            spark.load(times, values)
 
 # -------------------------- CREATE WIDGETS ------------------------------- #
     def create_widgets(self):
@@ -91,6 +129,22 @@ class THP_Sensor:
             self.main_frame,
             text="Pressure:"
         )
+        # Trend line beside each reading
+        self.spark_temp = Sparkline(self.main_frame, color="red")
+        self.spark_hum = Sparkline(self.main_frame, color="blue")
+        self.spark_press = Sparkline(
+            self.main_frame, color="green", decimals=2)
+        # Choose an hour or a day of history
+        self.trend_window = IntVar(value=HOUR)
+        trend_frame = Frame(self.main_frame)
+        for text, seconds in (("Last hour", HOUR), ("Last day", DAY)):
+            Radiobutton(
+                trend_frame,
+                text=text,
+                variable=self.trend_window,
+                value=seconds,
+                command=self.load_history
+            ).pack(side=LEFT, padx=4)
         # Use grid layout manager to place widgets in the frame
         lbl_temperature.grid(row=0, column=0, sticky=E)
         self.lbl_temp.grid(row=0, column=1)
@@ -98,6 +152,10 @@ class THP_Sensor:
         self.lbl_hum.grid(row=1, column=1)
         lbl_pressure.grid(row=2, column=0, sticky=E)
         self.lbl_press.grid(row=2, column=1)
+        self.spark_temp.grid(row=0, column=2)
+        self.spark_hum.grid(row=1, column=2)
+        self.spark_press.grid(row=2, column=2)
+        trend_frame.grid(row=3, column=2)
 
         # Set padding between frame and window
         self.main_frame.grid_configure(padx=5, pady=5)
@@ -110,6 +168,8 @@ class THP_Sensor:
         # Unconfigure the sensors, disable the motors,
         # and restore the LED to the control of the GoPiGo3 firmware
         self.gpg.reset_all()
+        # Write the readings still in memory
+        self.history.close()
         self.window.destroy()
 
 
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+    Name:    sparkline.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Small trend line of a sensor on a Tkinter canvas
+    However many readings are in the history, no more than
+    points readings are drawn
+    lttb() picks the readings that keep the shape of the line,
+    Largest Triangle Three Buckets by Sveinn Steinarsson:
+    https://skemman.is/handle/1946/15343
+    New readings are added one at a time, only the newest time bucket
+    is worked on and the same canvas line is moved with coords(),
+    nothing is deleted and drawn again
+"""
+import tkinter as tk
+from collections import deque
+
+import numpy as np
+
+
+# --------------------------------- LTTB ---------------------------------- #
+def lttb(times, values, threshold):
+    """Pick threshold readings that look like the whole line
+    Returns (times, values) NumPy arrays"""
+    times = np.asarray(times, dtype=float)
+    values = np.asarray(values, dtype=float)
+    count = len(times)
+    if threshold >= count or threshold < 3:
+        return times, values
+
+    # The first and last readings are always kept,
+    # the rest are split into threshold - 2 buckets
+    every = (count - 2) / (threshold - 2)
+    selected = np.empty(threshold, dtype=int)
+    selected[0] = 0
+    selected[-1] = count - 1
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        # Average of the next bucket, the last reading for the last bucket
+        next_end = min(int((i + 2) * every) + 1, count)
+        next_time = times[end:next_end].mean()
+        next_value = values[end:next_end].mean()
+        # Keep the reading that makes the largest triangle with
+        # the last kept reading and the next bucket's average
+        area = np.abs(
+            (times[a] - next_time) * (values[start:end] - values[a])
+            - (times[a] - times[start:end]) * (next_value - values[a]))
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+    return times[selected], values[selected]
+
+
+def triangle_area(first, point, last):
+    """Twice the area of the triangle, only used to compare"""
+    return abs((first[0] - last[0]) * (point[1] - first[1])
+               - (first[0] - point[0]) * (last[1] - first[1]))
+
+
+class Sparkline:
+    """Trend line of the last window seconds of one sensor"""
+
+    def __init__(self, parent, window=3600, points=200, width=200,
+                 height=40, color="blue", decimals=1):
+        self.width = width
+        self.height = height
+        self.decimals = decimals
+        self.canvas = tk.Canvas(parent, width=width, height=height,
+                                background="white", highlightthickness=0)
+        # One line and two labels, moved and changed as readings arrive
+        self.line = self.canvas.create_line(0, 0, 0, 0, fill=color)
+        self.high_label = self.canvas.create_text(
+            2, 1, anchor=tk.NW, font=("", 7), fill="gray")
+        self.low_label = self.canvas.create_text(
+            2, height - 1, anchor=tk.SW, font=("", 7), fill="gray")
+        self.set_window(window, points)
+
+    def grid(self, **options):
+        self.canvas.grid(**options)
+
+# ------------------------------ SET WINDOW ------------------------------ #
+    def set_window(self, window, points=None):
+        """Show the last window seconds, load() the history afterward"""
+        self.window = window
+        self.points = points or self.points
+        # Each bucket of time gets one point on the line
+        self.bucket = window / self.points
+        self.kept = deque()
+        self.current = []
+        self.current_bucket = None
+
+# --------------------------------- LOAD --------------------------------- #
+    def load(self, times, values):
+        """Draw a history of readings, for example from TimeSeriesStore"""
+        self.kept = deque(zip(*lttb(times, values, self.points)))
+        self.current = []
+        self.current_bucket = None
+        self.redraw()
+
+# ---------------------------------- ADD --------------------------------- #
+    def add(self, time, value):
+        """Add one new reading to the end of the line"""
+        bucket = int(time // self.bucket)
+        if self.current and bucket != self.current_bucket:
+            self.finish_bucket((time, value))
+        self.current_bucket = bucket
+        self.current.append((time, value))
+
+        # Forget readings that scrolled off the left side
+        while self.kept and self.kept[0][0] < time - self.window:
+            self.kept.popleft()
+        self.redraw()
+
+    def finish_bucket(self, next_reading):
+        """Keep one reading of the finished bucket, the LTTB way
+        The next bucket only has one reading so far, it stands in
+        for that bucket's average"""
+        first = self.kept[-1] if self.kept else self.current[0]
+        self.kept.append(max(
+            self.current,
+            key=lambda point: triangle_area(first, point, next_reading)))
+        self.current = []
+
+# -------------------------------- REDRAW -------------------------------- #
+    def redraw(self):
+        """Move the line to the kept readings and the newest reading"""
+        points = list(self.kept) + self.current[-1:]
+        if len(points) < 2:
+            self.canvas.coords(self.line, 0, 0, 0, 0)
+            return
+
+        end = points[-1][0]
+        low = min(value for _, value in points)
+        high = max(value for _, value in points)
+        # Keep a flat line in the middle
+        spread = (high - low) or 1
+        x_scale = (self.width - 1) / self.window
+        # Leave room for the labels at the top and bottom
+        y_scale = (self.height - 20) / spread
+        coords = []
+        for time, value in points:
+            coords.append(self.width - 1 - (end - time) * x_scale)
+            coords.append(self.height - 10 - (value - low) * y_scale)
+        self.canvas.coords(self.line, *coords)
+        self.canvas.itemconfig(self.high_label,
+                               text=f"{high:.{self.decimals}f}")
+        self.canvas.itemconfig(self.low_label, text=f"{low:.{self.decimals}f}")
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+    Name:    thingspeak_uploader.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Upload readings to ThingSpeak without losing any
+    Every reading is saved to a small SQLite file first,
+    so readings survive a network outage or a restart
+    A background thread sends the saved readings in batches with
+    ThingSpeak's bulk update, one keep-alive connection is reused
+    When an upload fails, the thread waits longer each time with
+    a random jitter, then sends the backlog when the network is back
+    A rejected batch is split in half and the halves are sent,
+    until only the readings ThingSpeak rejects are dropped
+    Bulk update: https://www.mathworks.com/help/thingspeak/bulkwritejsondata.html
+    thingspeak_uploader_test.py checks the uploader against a
+    stand-in ThingSpeak server on this computer, no account needed
+"""
+import json
+import random
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+import requests
+
+BULK_URL = "https://api.thingspeak.com/channels/{channel}/bulk_update.json"
+# Most updates ThingSpeak accepts in one bulk request
+MAX_BATCH = 960
+# Seconds between bulk updates allowed for a free account
+MIN_INTERVAL = 15
+# ThingSpeak will never take these readings, a rejected batch is split
+# until the rejected readings are found and dropped
+# Anything else, like 401/403 from a wrong API key, keeps them for later
+REJECTED = (400, 413, 422)
+
+
+class ThingSpeakUploader:
+    """Durable queue of readings, sent in batches on a background thread"""
+
+    def __init__(self, channel_id, api_key, queue_file="thingspeak_queue.db",
+                 url=BULK_URL, batch_size=MAX_BATCH, min_interval=MIN_INTERVAL,
+                 max_backoff=600, timeout=10):
+        self.url = url.format(channel=channel_id)
+        self.api_key = api_key
+        self.batch_size = min(batch_size, MAX_BATCH)
+        self.min_interval = min_interval
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+
+        # The connection is shared by the program and the upload thread
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(queue_file, check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS readings ("
+            "id INTEGER PRIMARY KEY, created_at TEXT, fields TEXT)")
+        self.db.commit()
+
+        # Reuses one keep-alive connection for every upload
+        self.session = requests.Session()
+        self.wake = threading.Event()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.failures = 0
+        self.uploaded = 0
+        self.dropped = 0
+        self.last_error = None
+        # Smaller batches while looking for rejected readings
+        self.split_size = None
+
+# -------------------------------- ADD ----------------------------------- #
+    def add(self, fields, created_at=None):
+        """Save a reading, fields is {"field1": value, ...}
+        Returns right away, the reading is sent later"""
+        if created_at is None:
+            created_at = datetime.now(timezone.utc)
+        with self.lock:
+            self.db.execute(
+                "INSERT INTO readings (created_at, fields) VALUES (?, ?)",
+                (created_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                 json.dumps(fields)))
+            self.db.commit()
+        self.wake.set()
+
+# ------------------------------- PENDING -------------------------------- #
+    def pending(self):
+        """Number of readings waiting to be sent"""
+        with self.lock:
+            return self.db.execute(
+                "SELECT COUNT(*) FROM readings").fetchone()[0]
+
+# -------------------------------- START --------------------------------- #
+    def start(self):
+        """Start the upload thread, sends any backlog from last time"""
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.upload_loop, daemon=True)
+        self.thread.start()
+
+# --------------------------------- STOP --------------------------------- #
+    def stop(self):
+        """Stop the upload thread, unsent readings stay in the file"""
+        self.stop_event.set()
+        self.wake.set()
+        if self.thread is not None:
+            self.thread.join(timeout=self.timeout + 1)
+        self.session.close()
+
+# ------------------------------ UPLOAD LOOP ----------------------------- #
+    def upload_loop(self):
+        while not self.stop_event.is_set():
+            if self.pending() == 0:
+                # Sleep until add() is called
+                self.wake.wait()
+                self.wake.clear()
+                continue
+
+            if self.send_batch():
+                self.failures = 0
+                wait = self.min_interval
+            else:
+                self.failures += 1
+                wait = self.backoff()
+                print(f" Upload failed ({self.last_error}), "
+                      f"{self.pending()} readings saved, "
+                      f"retry in {wait:.0f} seconds")
+            self.stop_event.wait(wait)
+
+# ------------------------------- BACKOFF -------------------------------- #
+    def backoff(self):
+        """Seconds to wait after a failure, doubling with random jitter
+        so many robots don't retry at the same moment"""
+        limit = min(self.max_backoff, self.min_interval * 2 ** self.failures)
+        return random.uniform(self.min_interval, max(limit, self.min_interval))
+
+# ------------------------------ SEND BATCH ------------------------------ #
+    def send_batch(self):
+        """Send the oldest readings, returns True if the upload worked"""
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT id, created_at, fields FROM readings "
+                "ORDER BY id LIMIT ?",
+                (self.split_size or self.batch_size,)).fetchall()
+        if not rows:
+            return True
+
+        updates = [dict(json.loads(fields), created_at=created_at)
+                   for _, created_at, fields in rows]
+        try:
+            response = self.session.post(
+                self.url,
+                json={"write_api_key": self.api_key, "updates": updates},
+                timeout=self.timeout)
+        except requests.RequestException as e:
+            self.last_error = type(e).__name__
+            return False
+
+        if response.status_code in (200, 202):
+            self.remove(rows[-1][0])
+            self.uploaded += len(rows)
+            if self.split_size is not None:
+                # Past the rejected readings, grow back to full batches
+                self.split_size *= 2
+                if self.split_size >= self.batch_size:
+                    self.split_size = None
+            return True
+
+        self.last_error = f"HTTP {response.status_code}"
+        if response.status_code in REJECTED:
+            if len(rows) > 1:
+                # Send the first half next time, the bad readings
+                # are narrowed down without dropping good ones
+                self.split_size = (len(rows) + 1) // 2
+                return True
+            # Only this reading is bad, don't let it block the queue
+            print(f" ThingSpeak rejected {updates[0]}: {response.text}")
+            self.remove(rows[0][0])
+            self.dropped += 1
+            return True
+        if response.status_code in (401, 403):
+            self.last_error += ", check the channel ID and write API key"
+        return False
+
+    def remove(self, last_id):
+        """Delete the readings up to and including last_id"""
+        with self.lock:
+            self.db.execute("DELETE FROM readings WHERE id <= ?", (last_id,))
+            self.db.commit()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+    Name:    thingspeak_uploader_test.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Check thingspeak_uploader.py against a stand-in ThingSpeak
+    server on this computer, no account or network needed
+    Outage and replay, batching, no lost readings on errors,
+    and only rejected readings dropped from a rejected batch
+    Usage: python3 thingspeak_uploader_test.py
+    Exits with 1 if a check fails
+"""
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from thingspeak_uploader import ThingSpeakUploader
+
+
+class StandInServer:
+    """Local stand-in for ThingSpeak's bulk update, records every request
+    Set status to make it answer with an error, a batch with a
+    field1 of "bad" in it is always answered with 400"""
+
+    def __init__(self, port=0):
+        self.status = 202
+        # Every POST, and one list of updates for each one accepted
+        self.attempts = 0
+        self.requests = []
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                updates = json.loads(body)["updates"]
+                stand_in.attempts += 1
+                status = stand_in.status
+                if any(update["field1"] == "bad" for update in updates):
+                    status = 400
+                if status in (200, 202):
+                    stand_in.requests.append(updates)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(b'{"success": true}')
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.port = self.server.server_address[1]
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def received(self):
+        """Every field1 value received, in order"""
+        return [update["field1"] for batch in self.requests
+                for update in batch]
+
+
+def wait_for(condition, timeout=5):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def run_checks(folder):
+    """Returns a list of (check name, passed)"""
+    results = []
+
+    def check(name, passed):
+        results.append(passed)
+        print(f" {'PASS' if passed else 'FAIL'}: {name}")
+
+    def make_uploader(name, url):
+        return ThingSpeakUploader(
+            "1", "KEY", os.path.join(folder, name), url=url,
+            batch_size=10, min_interval=0.05, max_backoff=0.2, timeout=2)
+
+    # A free port with nothing listening yet, the network is down
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    url = f"http://127.0.0.1:{port}/channels/{{channel}}/bulk_update.json"
+    uploader = make_uploader("queue.db", url)
+
+    # Outage: readings are kept while the server can't be reached
+    for value in range(5):
+        uploader.add({"field1": value})
+    uploader.start()
+    wait_for(lambda: uploader.failures >= 2)
+    check("readings kept during an outage", uploader.pending() == 5)
+
+    # Replay: the backlog is sent in order once the server is back
+    server = StandInServer(port)
+    wait_for(lambda: uploader.pending() == 0)
+    check("backlog sent when the network is back",
+          server.received() == list(range(5)))
+
+    # Errors that are not the readings' fault keep every reading
+    for count, status in enumerate((401, 403, 429, 500, 503), 1):
+        server.status = status
+        attempts = server.attempts
+        uploader.add({"field1": status})
+        # Two refused uploads of the whole queue
+        wait_for(lambda: server.attempts >= attempts + 2)
+        check(f"HTTP {status} keeps the readings",
+              uploader.pending() == count)
+    server.status = 202
+    wait_for(lambda: uploader.pending() == 0)
+    check("kept readings sent after the errors",
+          server.received()[-5:] == [401, 403, 429, 500, 503])
+    uploader.stop()
+
+    # Batching: 25 queued readings go in batches of at most 10
+    server.requests = []
+    uploader = make_uploader("batch.db", url)
+    for value in range(25):
+        uploader.add({"field1": value})
+    uploader.start()
+    wait_for(lambda: uploader.pending() == 0)
+    check("batches of 10, 10 and 5",
+          [len(batch) for batch in server.requests] == [10, 10, 5])
+    check("every batched reading arrived once, in order",
+          server.received() == list(range(25)))
+    uploader.stop()
+
+    # A rejected batch is split, only the bad readings are dropped
+    server.requests = []
+    uploader = make_uploader("split.db", url)
+    values = list(range(25))
+    values[3] = values[16] = "bad"
+    for value in values:
+        uploader.add({"field1": value})
+    uploader.start()
+    wait_for(lambda: uploader.pending() == 0)
+    check("only the 2 rejected readings are dropped",
+          uploader.dropped == 2)
+    check("every good reading around them arrived, in order",
+          server.received() == [v for v in values if v != "bad"])
+    check("full batches again after the rejected readings",
+          uploader.split_size is None)
+    uploader.stop()
+    server.close()
+    return results
+
+
+def main():
+    with tempfile.TemporaryDirectory() as folder:
+        results = run_checks(folder)
+    print(f" {sum(results)} of {len(results)} checks passed")
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    easygopigo3.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Stand-in for the easygopigo3 library that uses the simulator
+    Put this folder first on PYTHONPATH, see gopigo_sim.py
+"""
+from gopigo_sim import SimGoPiGo3, SimDistanceSensor, SimServo
+
+EasyGoPiGo3 = SimGoPiGo3
+EasyDistanceSensor = SimDistanceSensor
+Servo = SimServo
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    gopigo3.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Stand-in for the gopigo3 driver that uses the simulator
+    Put this folder first on PYTHONPATH, see gopigo_sim.py
+"""
+from gopigo_sim import SimGoPiGo3
+
+GoPiGo3 = SimGoPiGo3
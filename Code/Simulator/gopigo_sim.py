@@ -0,0 +1,586 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    gopigo_sim.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Simulated GoPiGo3 for running programs without the robot
+    The robot drives around a 2D world of walls in real time
+    The distance sensor casts a ray from the robot to the nearest wall
+    Every hardware call can be given a latency like the real SPI/I2C bus
+    Put this folder first on PYTHONPATH to use it in place of easygopigo3:
+        PYTHONPATH=../Simulator python3 obstacle_scanner.py
+    Environment variables:
+        GOPIGO_SIM_WORLD           Walls file, one "x1 y1 x2 y2" (cm) per line
+        GOPIGO_SIM_BUS_LATENCY     Seconds for each motor/LED/servo call
+        GOPIGO_SIM_SENSOR_LATENCY  Seconds for each distance sensor read
+        GOPIGO_SIM_VOLTAGE         Battery voltage
+"""
+import math
+import os
+import threading
+import time
+
+# Distance sensor reading when nothing is in range (mm)
+OUT_OF_RANGE_MM = 3000
+# Distance sensor range limit (mm)
+MAX_RANGE_MM = 2300
+
+
+class World:
+    """2D world of wall segments, all units are cm"""
+
+    def __init__(self, walls=None, start=(150.0, 50.0, 90.0)):
+        # List of (x1, y1, x2, y2) segments
+        self.walls = list(walls or [])
+        # Robot start pose (x, y, heading degrees), 90 is up the map
+        self.start = start
+
+# ------------------------------ ADD WALL -------------------------------- #
+    def add_wall(self, x1, y1, x2, y2):
+        """Add one wall segment"""
+        self.walls.append((x1, y1, x2, y2))
+
+# ------------------------------- ADD BOX -------------------------------- #
+    def add_box(self, x, y, width, height):
+        """Add the four walls of a box with its lower left corner at x, y"""
+        self.add_wall(x, y, x + width, y)
+        self.add_wall(x + width, y, x + width, y + height)
+        self.add_wall(x + width, y + height, x, y + height)
+        self.add_wall(x, y + height, x, y)
+
+# ------------------------------ CAST RAY -------------------------------- #
+    def cast_ray(self, x, y, heading, max_range):
+        """Return the distance to the nearest wall along heading
+        or None if no wall is closer than max_range"""
+        dx = math.cos(math.radians(heading))
+        dy = math.sin(math.radians(heading))
+        nearest = None
+        for x1, y1, x2, y2 in self.walls:
+            ex = x2 - x1
+            ey = y2 - y1
+            denominator = dx * ey - dy * ex
+            # Ray is parallel to the wall
+            if abs(denominator) < 1e-9:
+                continue
+            # Distance along the ray and position along the wall
+            t = ((x1 - x) * ey - (y1 - y) * ex) / denominator
+            u = ((x1 - x) * dy - (y1 - y) * dx) / denominator
+            if t >= 0 and 0 <= u <= 1:
+                if nearest is None or t < nearest:
+                    nearest = t
+        if nearest is None or nearest > max_range:
+            return None
+        return nearest
+
+
+# ---------------------------- DEFAULT WORLD ----------------------------- #
+def default_world():
+    """3 m x 3 m room with a box in front of the robot"""
+    world = World()
+    world.add_box(0, 0, 300, 300)
+    world.add_box(110, 170, 80, 30)
+    return world
+
+
+def load_world(file_name):
+    """Read walls from a file with one "x1 y1 x2 y2" line per wall
+    An optional "start x y heading" line sets the robot start pose"""
+    world = World()
+    with open(file_name) as world_file:
+        for line in world_file:
+            parts = line.split('#')[0].split()
+            if not parts:
+                continue
+            if parts[0] == 'start':
+                world.start = tuple(float(value) for value in parts[1:4])
+            else:
+                world.add_wall(*(float(value) for value in parts[:4]))
+    return world
+
+
+def _env_float(name, default):
+    """Read a float setting from the environment"""
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+
+# Settings used by every new simulated robot, see configure()
+settings = {
+    'world': None,
+    'bus_latency': _env_float('GOPIGO_SIM_BUS_LATENCY', 0.0),
+    'sensor_latency': _env_float('GOPIGO_SIM_SENSOR_LATENCY', 0.0),
+    'voltage': _env_float('GOPIGO_SIM_VOLTAGE', 9.6),
+}
+
+
+def configure(world=None, bus_latency=None, sensor_latency=None,
+              voltage=None):
+    """Change the settings used by robots created after this call"""
+    if world is not None:
+        settings['world'] = world
+    if bus_latency is not None:
+        settings['bus_latency'] = bus_latency
+    if sensor_latency is not None:
+        settings['sensor_latency'] = sensor_latency
+    if voltage is not None:
+        settings['voltage'] = voltage
+
+
+def get_world():
+    """World shared by all simulated robots"""
+    if settings['world'] is None:
+        world_file = os.environ.get('GOPIGO_SIM_WORLD')
+        if world_file:
+            settings['world'] = load_world(world_file)
+        else:
+            settings['world'] = default_world()
+    return settings['world']
+
+
+class SimMotor:
+    """One wheel motor, runs at a speed or to a target position"""
+
+    def __init__(self):
+        # Encoder position in degrees
+        self.position = 0.0
+        self.dps = 0.0
+        # Target position in degrees, None when running at self.dps
+        self.target = None
+        # Speed limit for position moves, 0 is no limit
+        self.limit_dps = 0
+
+# ------------------------------- ADVANCE -------------------------------- #
+    def advance(self, dt, default_speed):
+        """Move the motor for dt seconds, return degrees turned"""
+        if self.target is None:
+            delta = self.dps * dt
+        else:
+            speed = self.limit_dps or default_speed
+            remaining = self.target - self.position
+            delta = math.copysign(min(abs(remaining), speed * dt), remaining)
+            if delta == remaining:
+                self.target = None
+                self.dps = 0
+        self.position += delta
+        return delta
+
+
+class SimGoPiGo3:
+    """Simulated GoPiGo3 with the EasyGoPiGo3 interface"""
+
+    # Same constants as the gopigo3 library
+    MOTOR_LEFT = 0x01
+    MOTOR_RIGHT = 0x02
+    WHEEL_BASE_WIDTH = 117          # mm
+    WHEEL_DIAMETER = 66.5           # mm
+    WHEEL_BASE_CIRCUMFERENCE = WHEEL_BASE_WIDTH * math.pi
+    WHEEL_CIRCUMFERENCE = WHEEL_DIAMETER * math.pi
+    MOTOR_GEAR_RATIO = 120
+    ENCODER_TICKS_PER_ROTATION = 6
+    MOTOR_TICKS_PER_DEGREE = (
+        (MOTOR_GEAR_RATIO * ENCODER_TICKS_PER_ROTATION) / 360.0)
+    SERVO_1 = 0x01
+    SERVO_2 = 0x02
+    LED_EYE_LEFT = 0x02
+    LED_EYE_RIGHT = 0x01
+    LED_BLINKER_LEFT = 0x04
+    LED_BLINKER_RIGHT = 0x08
+    LED_LEFT_EYE = LED_EYE_LEFT
+    LED_RIGHT_EYE = LED_EYE_RIGHT
+    LED_LEFT_BLINKER = LED_BLINKER_LEFT
+    LED_RIGHT_BLINKER = LED_BLINKER_RIGHT
+
+    def __init__(self, config_file_path=None, use_mutex=False):
+        self.world = get_world()
+        self.bus_latency = settings['bus_latency']
+        self.sensor_latency = settings['sensor_latency']
+        self.voltage = settings['voltage']
+
+        # Motor and pose state is shared with sensor threads
+        self.lock = threading.RLock()
+        self.motors = {self.MOTOR_LEFT: SimMotor(),
+                       self.MOTOR_RIGHT: SimMotor()}
+        self.x, self.y, self.heading = self.world.start
+        self.last_update = time.monotonic()
+
+        self.speed = 300
+        self.NO_LIMIT_SPEED = 1000
+        self.left_eye_color = (0, 255, 255)
+        self.right_eye_color = (0, 255, 255)
+        self.eyes = {'left': False, 'right': False}
+        self.leds = {'left': False, 'right': False}
+        self.grove_types = {}
+        # Angle of the servo that pans the distance sensor, 90 is forward
+        self.pan_angle = 90
+
+# ------------------------------ BUS CALL -------------------------------- #
+    def _bus(self):
+        """Wait like a real SPI transaction"""
+        if self.bus_latency:
+            time.sleep(self.bus_latency)
+
+# ------------------------------- UPDATE --------------------------------- #
+    def _update(self):
+        """Advance the motors and the robot pose to the current time"""
+        with self.lock:
+            now = time.monotonic()
+            dt = now - self.last_update
+            self.last_update = now
+            if dt <= 0:
+                return
+
+            left = self.motors[self.MOTOR_LEFT].advance(dt, self.speed)
+            right = self.motors[self.MOTOR_RIGHT].advance(dt, self.speed)
+
+            # Wheel travel in cm
+            mm_per_degree = self.WHEEL_CIRCUMFERENCE / 360
+            left_cm = left * mm_per_degree / 10
+            right_cm = right * mm_per_degree / 10
+
+            # Differential drive, turn about the midpoint heading
+            distance = (left_cm + right_cm) / 2
+            turn = math.degrees(
+                (right_cm - left_cm) / (self.WHEEL_BASE_WIDTH / 10))
+            mid_heading = math.radians(self.heading + turn / 2)
+            self.x += distance * math.cos(mid_heading)
+            self.y += distance * math.sin(mid_heading)
+            self.heading = (self.heading + turn) % 360
+
+# -------------------------------- POSE ---------------------------------- #
+    def get_pose(self):
+        """True robot pose (x cm, y cm, heading degrees) in the world"""
+        self._update()
+        return self.x, self.y, self.heading
+
+    def set_pose(self, x, y, heading):
+        """Place the robot somewhere in the world"""
+        with self.lock:
+            self._update()
+            self.x, self.y, self.heading = x, y, heading
+
+# --------------------------- MOTOR CONTROL ------------------------------ #
+    def _ports(self, port):
+        """Motors selected by a port mask"""
+        return [motor for mask, motor in self.motors.items() if port & mask]
+
+    def set_motor_dps(self, port, dps):
+        self._bus()
+        with self.lock:
+            self._update()
+            for motor in self._ports(port):
+                motor.target = None
+                motor.dps = dps
+
+    def set_motor_position(self, port, position):
+        self._bus()
+        with self.lock:
+            self._update()
+            for motor in self._ports(port):
+                motor.target = position
+
+    def set_motor_limits(self, port, power=0, dps=0):
+        self._bus()
+        with self.lock:
+            for motor in self._ports(port):
+                motor.limit_dps = dps
+
+    def set_motor_power(self, port, power):
+        # Power is treated as a percentage of the no limit speed
+        self.set_motor_dps(port, power / 100 * self.NO_LIMIT_SPEED)
+
+    def get_motor_encoder(self, port):
+        self._bus()
+        self._update()
+        motor = self._ports(port)[0]
+        return int(motor.position)
+
+    def offset_motor_encoder(self, port, offset):
+        self._bus()
+        with self.lock:
+            self._update()
+            for motor in self._ports(port):
+                motor.position -= offset
+                if motor.target is not None:
+                    motor.target -= offset
+
+    def reset_motor_encoder(self, port):
+        self.offset_motor_encoder(port, self.get_motor_encoder(port))
+
+    def get_motor_status(self, port):
+        self._bus()
+        self._update()
+        motor = self._ports(port)[0]
+        dps = motor.dps if motor.target is None else motor.limit_dps
+        return [0, 0, int(motor.position), int(dps)]
+
+    def read_encoders(self):
+        """Encoder positions in degrees, (left, right)"""
+        return (self.get_motor_encoder(self.MOTOR_LEFT),
+                self.get_motor_encoder(self.MOTOR_RIGHT))
+
+    def reset_encoders(self, blocking=True):
+        self.set_motor_dps(self.MOTOR_LEFT + self.MOTOR_RIGHT, 0)
+        self.reset_motor_encoder(self.MOTOR_LEFT)
+        self.reset_motor_encoder(self.MOTOR_RIGHT)
+
+# ------------------------------- SPEED ---------------------------------- #
+    def set_speed(self, in_speed):
+        self.speed = max(0, int(in_speed))
+        self.set_motor_limits(self.MOTOR_LEFT + self.MOTOR_RIGHT,
+                              dps=self.speed)
+
+    def get_speed(self):
+        return self.speed
+
+    def reset_speed(self):
+        self.set_speed(300)
+
+# ------------------------------ MOVEMENT -------------------------------- #
+    def stop(self):
+        self.set_motor_dps(self.MOTOR_LEFT + self.MOTOR_RIGHT, 0)
+
+    def forward(self):
+        self.set_motor_dps(self.MOTOR_LEFT + self.MOTOR_RIGHT,
+                           self.NO_LIMIT_SPEED)
+
+    def backward(self):
+        self.set_motor_dps(self.MOTOR_LEFT + self.MOTOR_RIGHT,
+                           -self.NO_LIMIT_SPEED)
+
+    def right(self):
+        self.set_motor_dps(self.MOTOR_LEFT, self.NO_LIMIT_SPEED)
+        self.set_motor_dps(self.MOTOR_RIGHT, 0)
+
+    def left(self):
+        self.set_motor_dps(self.MOTOR_LEFT, 0)
+        self.set_motor_dps(self.MOTOR_RIGHT, self.NO_LIMIT_SPEED)
+
+    def spin_right(self):
+        self.set_motor_dps(self.MOTOR_LEFT, self.NO_LIMIT_SPEED)
+        self.set_motor_dps(self.MOTOR_RIGHT, -self.NO_LIMIT_SPEED)
+
+    def spin_left(self):
+        self.set_motor_dps(self.MOTOR_LEFT, -self.NO_LIMIT_SPEED)
+        self.set_motor_dps(self.MOTOR_RIGHT, self.NO_LIMIT_SPEED)
+
+    def steer(self, left_percent, right_percent):
+        self.set_motor_dps(self.MOTOR_LEFT,
+                           self.NO_LIMIT_SPEED * left_percent / 100)
+        self.set_motor_dps(self.MOTOR_RIGHT,
+                           self.NO_LIMIT_SPEED * right_percent / 100)
+
+    def _move_degrees(self, left_degrees, right_degrees, blocking):
+        """Turn each wheel a number of degrees from where it is now"""
+        self._update()
+        with self.lock:
+            left = self.motors[self.MOTOR_LEFT]
+            right = self.motors[self.MOTOR_RIGHT]
+            self.set_motor_position(self.MOTOR_LEFT,
+                                    left.position + left_degrees)
+            self.set_motor_position(self.MOTOR_RIGHT,
+                                    right.position + right_degrees)
+        if blocking:
+            while not self.target_reached(None, None):
+                time.sleep(0.01)
+
+    def drive_cm(self, dist, blocking=True):
+        degrees = dist * 10 / self.WHEEL_CIRCUMFERENCE * 360
+        self._move_degrees(degrees, degrees, blocking)
+
+    def drive_inches(self, dist, blocking=True):
+        self.drive_cm(dist * 2.54, blocking)
+
+    def drive_degrees(self, degrees, blocking=True):
+        self._move_degrees(degrees, degrees, blocking)
+
+    def turn_degrees(self, degrees, blocking=True):
+        # Positive degrees turn right, same as the real robot
+        wheel_travel = self.WHEEL_BASE_CIRCUMFERENCE * degrees / 360
+        wheel_degrees = wheel_travel / self.WHEEL_CIRCUMFERENCE * 360
+        self._move_degrees(wheel_degrees, -wheel_degrees, blocking)
+
+    def orbit(self, degrees, radius_cm=0, blocking=True):
+        """Drive degrees around a circle of radius_cm, positive is right"""
+        half_base = self.WHEEL_BASE_WIDTH / 20
+        radius = abs(radius_cm)
+        left_cm = 2 * math.pi * (radius + half_base) * degrees / 360
+        right_cm = 2 * math.pi * (radius - half_base) * degrees / 360
+        if radius_cm < 0:
+            left_cm, right_cm = right_cm, left_cm
+        to_degrees = 3600 / self.WHEEL_CIRCUMFERENCE
+        self._move_degrees(left_cm * to_degrees, right_cm * to_degrees,
+                           blocking)
+
+    def target_reached(self, left_target_degrees, right_target_degrees):
+        self._update()
+        return all(motor.target is None for motor in self.motors.values())
+
+# ------------------------------ VOLTAGE --------------------------------- #
+    def volt(self):
+        self._bus()
+        return self.voltage
+
+    def get_voltage_battery(self):
+        return self.volt()
+
+    def get_voltage_5v(self):
+        self._bus()
+        return 5.0
+
+# ------------------------------- LEDS ----------------------------------- #
+    def _led_side(self, led_id):
+        if led_id in ('left', 1, self.LED_BLINKER_LEFT):
+            return 'left'
+        return 'right'
+
+    def led_on(self, id):
+        self._bus()
+        self.leds[self._led_side(id)] = True
+
+    def led_off(self, id):
+        self._bus()
+        self.leds[self._led_side(id)] = False
+
+    def blinker_on(self, id):
+        self.led_on(id)
+
+    def blinker_off(self, id):
+        self.led_off(id)
+
+    def set_led(self, led, red, green=0, blue=0):
+        self._bus()
+
+    def set_left_eye_color(self, color):
+        self.left_eye_color = color
+
+    def set_right_eye_color(self, color):
+        self.right_eye_color = color
+
+    def set_eye_color(self, color):
+        self.set_left_eye_color(color)
+        self.set_right_eye_color(color)
+
+    def open_left_eye(self):
+        self._bus()
+        self.eyes['left'] = True
+
+    def open_right_eye(self):
+        self._bus()
+        self.eyes['right'] = True
+
+    def open_eyes(self):
+        self.open_left_eye()
+        self.open_right_eye()
+
+    def close_left_eye(self):
+        self._bus()
+        self.eyes['left'] = False
+
+    def close_right_eye(self):
+        self._bus()
+        self.eyes['right'] = False
+
+    def close_eyes(self):
+        self.close_left_eye()
+        self.close_right_eye()
+
+# ------------------------------- GROVE ---------------------------------- #
+    def set_grove_type(self, port, type):
+        self._bus()
+        self.grove_types[port] = type
+
+    def get_grove_value(self, port):
+        self._bus()
+        return 0
+
+# ------------------------------ SENSORS --------------------------------- #
+    def init_distance_sensor(self, port="I2C"):
+        return SimDistanceSensor(self, port)
+
+    def init_servo(self, port="SERVO1"):
+        return SimServo(self, port)
+
+    def read_distance_mm(self):
+        """Distance from the sensor to the nearest wall in mm"""
+        if self.sensor_latency:
+            time.sleep(self.sensor_latency)
+        x, y, heading = self.get_pose()
+        # Servo angles above 90 point to the left of the robot
+        beam = heading + self.pan_angle - 90
+        distance = self.world.cast_ray(x, y, beam, MAX_RANGE_MM / 10)
+        if distance is None:
+            return OUT_OF_RANGE_MM
+        return int(round(distance * 10))
+
+# ------------------------------- RESET ---------------------------------- #
+    def reset_all(self):
+        self.stop()
+        self.leds = {'left': False, 'right': False}
+        self.eyes = {'left': False, 'right': False}
+
+
+class SimDistanceSensor:
+    """Simulated EasyDistanceSensor"""
+
+    def __init__(self, gpg, port="I2C"):
+        self.gpg = gpg
+        self.port = port
+
+    def read_mm(self):
+        return self.gpg.read_distance_mm()
+
+    def read(self):
+        """Distance in cm"""
+        return self.read_mm() // 10
+
+    def read_inches(self):
+        return round(self.read_mm() / 25.4, 1)
+
+
+class SimServo:
+    """Simulated EasyServo, every servo pans the distance sensor"""
+
+    def __init__(self, gpg, port="SERVO1"):
+        self.gpg = gpg
+        self.port = port
+
+    def rotate_servo(self, servo_position):
+        self.gpg._bus()
+        self.gpg.pan_angle = min(max(servo_position, 0), 180)
+
+    def reset_servo(self):
+        self.gpg._bus()
+
+    def disable_servo(self):
+        self.gpg._bus()
+
+
+def main():
+    """Quick check: sweep the sensor and drive a square"""
+    gpg = SimGoPiGo3()
+    distance_sensor = gpg.init_distance_sensor("AD1")
+    servo = gpg.init_servo("SERVO2")
+
+    print("Sweep from the start pose")
+    start = time.perf_counter()
+    count = 0
+    for angle in range(30, 151, 10):
+        servo.rotate_servo(angle)
+        print(f"Angle: {angle}° Distance: {distance_sensor.read_mm()} mm")
+        count += 1
+    elapsed = time.perf_counter() - start
+    print(f"{count / elapsed:.0f} readings per second")
+
+    print("\nDrive a 30 cm square")
+    gpg.set_speed(600)
+    for _ in range(4):
+        gpg.drive_cm(30)
+        gpg.turn_degrees(90)
+    x, y, heading = gpg.get_pose()
+    print(f"Pose: x {x:.1f} cm y {y:.1f} cm heading {heading:.1f}°")
+    print(f"Encoders: {gpg.read_encoders()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    sensor_replay.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Record GoPiGo3 sensor readings on the robot and replay them later
+    Record wraps the distance sensor, motor encoders, battery voltage,
+    EasyIMUSensor and EasyTHPSensor and logs every result with its time
+    Replay feeds the same results back in the same order to the same
+    program at the original speed or faster, on any computer
+    Usage:
+        python3 sensor_replay.py record field.gpgrec program.py
+        python3 sensor_replay.py replay field.gpgrec program.py [speed]
+    A speed of 0 replays as fast as possible
+"""
+import runpy
+import struct
+import sys
+import threading
+import time
+import types
+
+MAGIC = b'GPGREC1\n'
+# Record types
+CHANNEL = 0
+SAMPLE = 1
+# Channel definition: type, channel id, name length
+CHANNEL_HEADER = struct.Struct('<BHH')
+# Sample: type, channel id, timestamp, value kind, value count
+SAMPLE_HEADER = struct.Struct('<BHdBB')
+# Value kinds
+KIND_NONE = 0
+KIND_INT = 1
+KIND_FLOAT = 2
+KIND_TUPLE = 3
+KIND_BOOL = 4
+KIND_INT_TUPLE = 5
+
+# Methods recorded for each sensor, tag: (module, class, methods)
+RECORDED = {
+    'gpg': ('easygopigo3', 'EasyGoPiGo3',
+            ('get_motor_encoder', 'read_encoders', 'volt')),
+    'distance': ('easygopigo3', 'EasyDistanceSensor',
+                 ('read_mm', 'read', 'read_inches')),
+    'imu': ('di_sensors.easy_inertial_measurement_unit', 'EasyIMUSensor',
+            ('safe_read_euler', 'safe_read_magnetometer',
+             'safe_read_gyroscope', 'safe_read_accelerometer',
+             'safe_read_linear_acceleration', 'safe_read_temperature')),
+    'thp': ('di_sensors.easy_temp_hum_press', 'EasyTHPSensor',
+            ('safe_celsius', 'safe_fahrenheit', 'safe_pressure',
+             'safe_humidity')),
+}
+
+
+class ReplayFinished(KeyboardInterrupt):
+    """Raised when a channel runs out of recorded values
+    Programs shut down the same way they do for Ctrl+C"""
+
+
+# --------------------------- ENCODE / DECODE ---------------------------- #
+def encode_value(value):
+    """Return (kind, list of floats) for a sensor result"""
+    if value is None:
+        return KIND_NONE, []
+    if isinstance(value, bool):
+        return KIND_BOOL, [float(value)]
+    if isinstance(value, int):
+        return KIND_INT, [float(value)]
+    if isinstance(value, float):
+        return KIND_FLOAT, [value]
+    if isinstance(value, (tuple, list)):
+        if all(isinstance(item, int) for item in value):
+            return KIND_INT_TUPLE, [float(item) for item in value]
+        return KIND_TUPLE, [float(item) for item in value]
+    raise TypeError(f"Can't record a {type(value).__name__} result")
+
+
+def decode_value(kind, values):
+    """Turn a recorded kind and values back into a sensor result"""
+    if kind == KIND_NONE:
+        return None
+    if kind == KIND_BOOL:
+        return bool(values[0])
+    if kind == KIND_INT:
+        return int(values[0])
+    if kind == KIND_FLOAT:
+        return values[0]
+    if kind == KIND_INT_TUPLE:
+        return tuple(int(item) for item in values)
+    return tuple(values)
+
+
+def channel_name(tag, method, args):
+    """Name for one sensor method called with args, e.g. gpg.volt()"""
+    return f"{tag}.{method}{tuple(args)!r}"
+
+
+class SensorLogWriter:
+    """Append sensor results to a compact binary log"""
+
+    def __init__(self, file_name):
+        self.file = open(file_name, 'wb')
+        self.file.write(MAGIC)
+        self.channels = {}
+        # Sensors are read from several threads
+        self.lock = threading.Lock()
+
+# ------------------------------- WRITE ---------------------------------- #
+    def write(self, name, value, timestamp=None):
+        """Log one result for the named channel"""
+        if timestamp is None:
+            timestamp = time.time()
+        kind, values = encode_value(value)
+        with self.lock:
+            channel_id = self.channels.get(name)
+            if channel_id is None:
+                channel_id = len(self.channels)
+                self.channels[name] = channel_id
+                encoded = name.encode('utf-8')
+                self.file.write(CHANNEL_HEADER.pack(
+                    CHANNEL, channel_id, len(encoded)) + encoded)
+            self.file.write(SAMPLE_HEADER.pack(
+                SAMPLE, channel_id, timestamp, kind, len(values)))
+            self.file.write(struct.pack(f'<{len(values)}d', *values))
+
+# ------------------------------- CLOSE ---------------------------------- #
+    def close(self):
+        with self.lock:
+            if not self.file.closed:
+                self.file.close()
+
+
+# --------------------------- READ SENSOR LOG ---------------------------- #
+def read_sensor_log(file_name):
+    """Return {channel name: [(timestamp, result), ...]}"""
+    with open(file_name, 'rb') as log_file:
+        data = log_file.read()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"{file_name} is not a sensor log")
+
+    names = {}
+    channels = {}
+    offset = len(MAGIC)
+    while offset < len(data):
+        record_type = data[offset]
+        if record_type == CHANNEL:
+            _, channel_id, length = CHANNEL_HEADER.unpack_from(data, offset)
+            offset += CHANNEL_HEADER.size
+            name = data[offset:offset + length].decode('utf-8')
+            offset += length
+            names[channel_id] = name
+            channels[name] = []
+        elif record_type == SAMPLE:
+            # A program stopped mid write leaves a partial last record
+            if offset + SAMPLE_HEADER.size > len(data):
+                break
+            _, channel_id, timestamp, kind, count = \
+                SAMPLE_HEADER.unpack_from(data, offset)
+            offset += SAMPLE_HEADER.size
+            if offset + 8 * count > len(data):
+                break
+            values = struct.unpack_from(f'<{count}d', data, offset)
+            offset += 8 * count
+            channels[names[channel_id]].append(
+                (timestamp, decode_value(kind, values)))
+        else:
+            raise ValueError(f"{file_name} is damaged at byte {offset}")
+    return channels
+
+
+class SensorPlayer:
+    """Hand out recorded results in order, paced by a replay clock"""
+
+    def __init__(self, channels, speed=1.0):
+        self.channels = channels
+        self.positions = {name: 0 for name in channels}
+        # 0 means as fast as possible
+        self.speed = speed
+        self.lock = threading.Lock()
+
+        times = [samples[0][0] for samples in channels.values() if samples]
+        self.log_start = min(times) if times else 0.0
+        self.wall_start = time.monotonic()
+
+# -------------------------------- NEXT ---------------------------------- #
+    def next(self, name):
+        """Next recorded result for a channel, waits until it is due"""
+        with self.lock:
+            samples = self.channels.get(name)
+            if not samples:
+                raise ReplayFinished(f"Nothing recorded for {name}")
+            position = self.positions[name]
+            if position >= len(samples):
+                raise ReplayFinished(f"End of recording for {name}")
+            self.positions[name] = position + 1
+        timestamp, value = samples[position]
+
+        if self.speed:
+            due = self.wall_start + (timestamp - self.log_start) / self.speed
+            wait = due - time.monotonic()
+            if wait > 0:
+                _real_sleep(wait)
+        return value
+
+# -------------------------------- SLEEP --------------------------------- #
+    def sleep(self, seconds):
+        """time.sleep replacement that runs faster with the replay"""
+        if self.speed:
+            _real_sleep(seconds / self.speed)
+
+
+_real_sleep = time.sleep
+
+
+# ------------------------------- RECORD --------------------------------- #
+def install_recorder(writer):
+    """Wrap the real sensor classes so every result is logged"""
+    import importlib
+
+    # Nested calls, like read_encoders calling get_motor_encoder,
+    # are only logged once
+    local = threading.local()
+
+    def make_wrapper(tag, method, original):
+        def wrapper(self, *args):
+            if getattr(local, 'busy', False):
+                return original(self, *args)
+            local.busy = True
+            try:
+                result = original(self, *args)
+            finally:
+                local.busy = False
+            writer.write(channel_name(tag, method, args), result)
+            return result
+        return wrapper
+
+    for tag, (module_name, class_name, methods) in RECORDED.items():
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        original_class = getattr(module, class_name)
+        wrappers = {}
+        for method in methods:
+            if hasattr(original_class, method):
+                wrappers[method] = make_wrapper(
+                    tag, method, getattr(original_class, method))
+        # Subclass so isinstance checks still pass
+        recording_class = type(class_name, (original_class,), wrappers)
+        setattr(module, class_name, recording_class)
+
+
+# ------------------------------- REPLAY --------------------------------- #
+def install_replay(player):
+    """Put replay versions of the sensor modules in sys.modules"""
+    from gopigo_sim import SimGoPiGo3
+
+    def replay(tag, method, *args):
+        return player.next(channel_name(tag, method, args))
+
+    class ReplayDistanceSensor:
+        """Distance sensor that returns recorded readings"""
+
+        def __init__(self, port="I2C", gpg=None, use_mutex=False):
+            self.port = port
+
+        def read_mm(self):
+            return replay('distance', 'read_mm')
+
+        def read(self):
+            return replay('distance', 'read')
+
+        def read_inches(self):
+            return replay('distance', 'read_inches')
+
+    class ReplayGoPiGo3(SimGoPiGo3):
+        """Simulated robot whose sensors return recorded readings"""
+
+        def get_motor_encoder(self, port):
+            return replay('gpg', 'get_motor_encoder', port)
+
+        def read_encoders(self):
+            return replay('gpg', 'read_encoders')
+
+        def volt(self):
+            return replay('gpg', 'volt')
+
+        def init_distance_sensor(self, port="I2C"):
+            return ReplayDistanceSensor(port, self)
+
+    class ReplaySensor:
+        """IMU or THP sensor that returns recorded readings"""
+        tag = None
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __getattr__(self, method):
+            return lambda *args: replay(self.tag, method, *args)
+
+    class ReplayIMUSensor(ReplaySensor):
+        tag = 'imu'
+
+    class ReplayTHPSensor(ReplaySensor):
+        tag = 'thp'
+
+    easygopigo3 = types.ModuleType('easygopigo3')
+    easygopigo3.EasyGoPiGo3 = ReplayGoPiGo3
+    easygopigo3.EasyDistanceSensor = ReplayDistanceSensor
+    gopigo3 = types.ModuleType('gopigo3')
+    gopigo3.GoPiGo3 = ReplayGoPiGo3
+    di_sensors = types.ModuleType('di_sensors')
+    di_sensors.__path__ = []
+    imu = types.ModuleType('di_sensors.easy_inertial_measurement_unit')
+    imu.EasyIMUSensor = ReplayIMUSensor
+    thp = types.ModuleType('di_sensors.easy_temp_hum_press')
+    thp.EasyTHPSensor = ReplayTHPSensor
+    di_sensors.easy_inertial_measurement_unit = imu
+    di_sensors.easy_temp_hum_press = thp
+
+    sys.modules.update({
+        'easygopigo3': easygopigo3,
+        'gopigo3': gopigo3,
+        'di_sensors': di_sensors,
+        'di_sensors.easy_inertial_measurement_unit': imu,
+        'di_sensors.easy_temp_hum_press': thp,
+    })
+    # Programs sleep between reads, speed those up too
+    time.sleep = player.sleep
+
+
+def run_program(program):
+    """Run a program as if it was started from its own folder"""
+    program_folder = program.rsplit('/', 1)[0] if '/' in program else '.'
+    sys.path.insert(0, program_folder)
+    sys.argv = [program]
+    runpy.run_path(program, run_name='__main__')
+
+
+def main():
+    if len(sys.argv) < 4 or sys.argv[1] not in ('record', 'replay'):
+        print("Usage: python3 sensor_replay.py record log_file program.py")
+        print("       python3 sensor_replay.py replay log_file program.py "
+              "[speed]")
+        return
+
+    mode, log_file, program = sys.argv[1:4]
+    if mode == 'record':
+        writer = SensorLogWriter(log_file)
+        install_recorder(writer)
+        try:
+            run_program(program)
+        finally:
+            writer.close()
+    else:
+        speed = float(sys.argv[4]) if len(sys.argv) > 4 else 1.0
+        player = SensorPlayer(read_sensor_log(log_file), speed)
+        install_replay(player)
+        start = time.perf_counter()
+        try:
+            run_program(program)
+        except ReplayFinished as e:
+            print(f"\nReplay finished: {e}")
+        elapsed = time.perf_counter() - start
+        print(f"Replay ran for {elapsed:.2f} seconds")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    clip_recorder.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Save video from before and after an event
+    The last few seconds of frames are kept in memory as JPEGs
+    trigger() saves those frames plus the next few seconds to an
+    MJPEG file, play it with VLC or ffplay
+    Encoding and writing run on their own threads,
+    the live stream never stops
+    Memory use is limited by the number of frames kept
+"""
+import io
+import os
+import queue
+import time
+from collections import deque
+from datetime import datetime
+from threading import Thread, Event, Lock
+
+from PIL import Image
+
+from frame_ring import FrameRing
+
+
+class ClipRecorder:
+    """Keep recent frames as JPEGs, save them to disk when triggered"""
+
+    def __init__(self, fps=15, seconds_before=5, seconds_after=5,
+                 quality=70, folder='clips'):
+        self.fps = fps
+        self.seconds_after = seconds_after
+        self.quality = quality
+        self.folder = folder
+        # (time, jpeg), the oldest falls off when the ring is full
+        self.ring = deque(maxlen=int(fps * seconds_before))
+        self.lock = Lock()
+        # Frames waiting to be encoded, newest wins
+        self.frames = FrameRing()
+        self.new_frame = Event()
+        # Clip being recorded after a trigger
+        self.clip = None
+        self.clip_end = 0
+        self.clip_reason = None
+        # Finished clips waiting to be written
+        self.write_queue = queue.Queue(maxsize=2)
+        self.stop_event = Event()
+        self.clips_saved = 0
+        self.last_file = None
+
+# ------------------------------- START ---------------------------------- #
+    def start(self):
+        """Start the encoder and writer threads"""
+        self.stop_event.clear()
+        Thread(target=self.encode_loop, daemon=True).start()
+        Thread(target=self.write_loop, daemon=True).start()
+
+# -------------------------------- STOP ---------------------------------- #
+    def stop(self):
+        """Stop the threads, a clip being recorded is saved as it is
+        Never waits on the writer, it stops once its queue is empty"""
+        with self.lock:
+            if self.clip is not None:
+                self.finish_clip()
+        self.stop_event.set()
+        self.new_frame.set()
+
+# ------------------------------ ADD FRAME ------------------------------- #
+    def add_frame(self, frame):
+        """Hand a new camera frame to the encoder, called by capture"""
+        self.frames.write(frame)
+        self.new_frame.set()
+
+# ------------------------------- TRIGGER -------------------------------- #
+    def trigger(self, reason="event"):
+        """Save the frames before now and the next seconds_after
+        Returns False if a clip is already being recorded"""
+        with self.lock:
+            if self.clip is not None:
+                return False
+            self.clip = list(self.ring)
+            self.clip_end = time.monotonic() + self.seconds_after
+            self.clip_reason = reason
+        return True
+
+    @property
+    def recording(self):
+        return self.clip is not None
+
+# ----------------------------- ENCODE LOOP ------------------------------ #
+    def encode_loop(self):
+        """Encode the newest frame, add it to the ring and the clip"""
+        while not self.stop_event.is_set():
+            self.new_frame.wait()
+            self.new_frame.clear()
+            frame = self.frames.read()
+            if frame is None:
+                continue
+            try:
+                jpeg = self.encode(frame)
+            finally:
+                self.frames.release()
+
+            now = time.monotonic()
+            with self.lock:
+                self.ring.append((now, jpeg))
+                if self.clip is not None:
+                    self.clip.append((now, jpeg))
+                    if now >= self.clip_end:
+                        self.finish_clip()
+
+    def encode(self, frame):
+        """Encode a NumPy frame as JPEG bytes"""
+        image = Image.fromarray(frame)
+        # JPEG has no alpha channel
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        buffer = io.BytesIO()
+        image.save(buffer, 'JPEG', quality=self.quality)
+        return buffer.getvalue()
+
+# ----------------------------- FINISH CLIP ------------------------------ #
+    def finish_clip(self):
+        """Pass the clip to the writer, called with the lock held"""
+        clip = (self.clip_reason, self.clip)
+        self.clip = None
+        try:
+            self.write_queue.put_nowait(clip)
+        except queue.Full:
+            # The disk can't keep up, drop this clip instead of
+            # holding more frames in memory
+            print("Clip dropped, writer is busy")
+
+# ----------------------------- WRITE LOOP ------------------------------- #
+    def write_loop(self):
+        """Write finished clips to disk until stopped and caught up"""
+        while True:
+            try:
+                # Wake up now and then to check for stop()
+                clip = self.write_queue.get(timeout=0.5)
+            except queue.Empty:
+                if self.stop_event.is_set():
+                    break
+                continue
+            reason, frames = clip
+            if frames:
+                self.write_clip(reason, frames)
+
+    def write_clip(self, reason, frames):
+        """Write the JPEG frames one after another as an MJPEG file"""
+        os.makedirs(self.folder, exist_ok=True)
+        # Name the clip after when it was saved and why
+        name = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        filename = os.path.join(self.folder, f"{name}_{reason}.mjpeg")
+        with open(filename, 'wb') as file:
+            for _, jpeg in frames:
+                file.write(jpeg)
+        seconds = frames[-1][0] - frames[0][0]
+        self.clips_saved += 1
+        self.last_file = filename
+        print(f"Clip saved as {filename}, "
+              f"{len(frames)} frames, {seconds:.1f} seconds")
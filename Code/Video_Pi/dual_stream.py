@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    dual_stream.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Run the camera with a small preview stream and a
+    full resolution main stream at the same time
+    The preview uses the lores stream, a still image is taken from
+    the main stream of the next frame, the camera never restarts
+    Most Pi models only give lores frames as YUV420,
+    those are converted to RGB with NumPy
+"""
+import numpy as np
+
+# Size of the preview frames, matches the canvas
+PREVIEW_SIZE = (640, 480)
+# Size of still images
+STILL_SIZE = (1920, 1080)
+
+
+# --------------------------- CONFIGURE CAMERA ----------------------------- #
+def configure_camera(picam2, preview_size=PREVIEW_SIZE, still_size=STILL_SIZE):
+    """Configure main and lores streams, returns the lores format"""
+    # Try RGB preview frames first, only some Pi models support it
+    for lores_format in ("XBGR8888", "YUV420"):
+        config = picam2.create_preview_configuration(
+            main={"size": still_size, "format": "XBGR8888"},
+            lores={"size": preview_size, "format": lores_format},
+        )
+        try:
+            picam2.configure(config)
+            return lores_format
+        except RuntimeError:
+            # Lores stream must be YUV on this camera
+            continue
+    raise RuntimeError("Camera does not support a lores stream")
+
+
+# ---------------------------- PREVIEW FRAME ------------------------------- #
+def preview_frame(source, lores_format, preview_size=PREVIEW_SIZE):
+    """Preview frame as an RGB or RGBA array
+    source is the Picamera2 object or a request from capture_request()"""
+    if hasattr(source, "make_array"):
+        frame = source.make_array("lores")
+    else:
+        frame = source.capture_array("lores")
+    if lores_format == "YUV420":
+        frame = yuv420_to_rgb(frame, preview_size)
+    return frame
+
+
+# ---------------------------- YUV420 TO RGB ------------------------------- #
+def yuv420_to_rgb(frame, size):
+    """Convert a planar YUV420 frame to RGB
+    The frame is (height * 3 / 2) rows of stride bytes"""
+    width, height = size
+    stride = frame.shape[1]
+    flat = frame.reshape(-1)
+
+    y = frame[:height, :width].astype(np.int32)
+    # U and V planes are half size with half the stride
+    plane = (height // 2) * (stride // 2)
+    start = height * stride
+    u = flat[start:start + plane].reshape(height // 2, stride // 2)
+    v = flat[start + plane:start + 2 * plane].reshape(height // 2, stride // 2)
+    # Each U and V value covers 2 x 2 pixels
+    u = u[:, :width // 2].repeat(2, axis=0).repeat(2, axis=1).astype(np.int32) - 128
+    v = v[:, :width // 2].repeat(2, axis=0).repeat(2, axis=1).astype(np.int32) - 128
+
+    # BT.601 full range, coefficients times 256 to stay in integers
+    y = y << 8
+    rgb = np.empty((height, width, 3), dtype=np.uint8)
+    rgb[:, :, 0] = np.clip((y + 359 * v) >> 8, 0, 255)
+    rgb[:, :, 1] = np.clip((y - 88 * u - 183 * v) >> 8, 0, 255)
+    rgb[:, :, 2] = np.clip((y + 454 * u) >> 8, 0, 255)
+    return rgb
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    frame_pacer.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Keep a capture loop on a fixed frame rate
+    Sleeping a fixed time after each capture makes the real frame rate
+    capture time + sleep, always below the target
+    The pacer sleeps until the next deadline on the monotonic clock,
+    so the time the capture took is taken out of the sleep
+    When a capture runs past a deadline, that frame is counted as missed
+    and the pacer skips to the next deadline instead of rushing to catch up
+"""
+import time
+from collections import deque
+
+
+class FramePacer:
+    """Deadline based frame pacing with frame rate and jitter metrics"""
+
+    def __init__(self, target_fps, window=30):
+        self.target_fps = target_fps
+        self.interval = 1 / target_fps
+        # Start times of the last few frames
+        self.frame_times = deque(maxlen=window)
+        self.next_deadline = None
+        self.capture_start = None
+        # Average capture time, seconds
+        self.capture_time = 0.0
+        self.missed = 0
+        self.frames = 0
+
+# ---------------------------- START FRAME ------------------------------- #
+    def start_frame(self):
+        """Call right before capturing a frame"""
+        now = time.monotonic()
+        self.capture_start = now
+        self.frame_times.append(now)
+        self.frames += 1
+        if self.next_deadline is None:
+            self.next_deadline = now
+
+# ----------------------------- WAIT FRAME ------------------------------- #
+    def wait(self, stop_event=None):
+        """Call after the frame is captured, sleeps until the next deadline
+        Waiting on stop_event lets the loop stop right away"""
+        now = time.monotonic()
+        if self.capture_start is not None:
+            # Smoothed capture time
+            elapsed = now - self.capture_start
+            self.capture_time += (elapsed - self.capture_time) * 0.1
+
+        self.next_deadline += self.interval
+        late = now - self.next_deadline
+        if late > 0:
+            # Skip every deadline we have already missed
+            missed = int(late / self.interval) + 1
+            self.missed += missed
+            self.next_deadline += missed * self.interval
+
+        wait = self.next_deadline - now
+        if stop_event is not None:
+            stop_event.wait(wait)
+        else:
+            time.sleep(wait)
+
+# ------------------------------- RESET ---------------------------------- #
+    def reset(self):
+        """Start over, for example when the stream restarts"""
+        self.frame_times.clear()
+        self.next_deadline = None
+        self.capture_start = None
+        self.missed = 0
+        self.frames = 0
+
+# ------------------------------ METRICS --------------------------------- #
+    def real_fps(self):
+        """Frames per second over the last few frames"""
+        if len(self.frame_times) < 2:
+            return 0.0
+        span = self.frame_times[-1] - self.frame_times[0]
+        return (len(self.frame_times) - 1) / span if span > 0 else 0.0
+
+    def jitter_ms(self):
+        """Standard deviation of the frame interval in milliseconds"""
+        times = list(self.frame_times)
+        intervals = [b - a for a, b in zip(times, times[1:])]
+        if len(intervals) < 2:
+            return 0.0
+        mean = sum(intervals) / len(intervals)
+        variance = sum((i - mean) ** 2 for i in intervals) / len(intervals)
+        return variance ** 0.5 * 1000
+
+    def metrics(self):
+        """All of the pacing numbers in one dictionary"""
+        return {
+            'real_fps': self.real_fps(),
+            'target_fps': self.target_fps,
+            'jitter_ms': self.jitter_ms(),
+            'capture_ms': self.capture_time * 1000,
+            'missed': self.missed,
+        }
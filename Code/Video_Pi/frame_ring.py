@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    frame_ring.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Reusable camera frame buffers shared by two threads
+    The capture thread copies each frame into a preallocated buffer,
+    the GUI thread takes the newest one
+    Frames the GUI didn't get to in time are dropped, newest wins
+    Three buffers: one being drawn, one waiting, one being filled
+"""
+from threading import Lock
+
+import numpy as np
+
+
+class FrameRing:
+    """Preallocated frame buffers, newest frame wins"""
+
+    def __init__(self, size=3):
+        # At least one to draw, one waiting and one to fill
+        self.size = max(size, 3)
+        self.buffers = []
+        self.lock = Lock()
+        # Index of the newest frame nobody has read yet
+        self.latest = None
+        # Index of the frame the reader is using
+        self.reading = None
+        self.written = 0
+        self.dropped = 0
+
+# ------------------------------- WRITE ---------------------------------- #
+    def write(self, frame):
+        """Copy a frame into a free buffer, called by the capture thread"""
+        # Allocate once, again only if the camera changes resolution
+        if (not self.buffers or self.buffers[0].shape != frame.shape
+                or self.buffers[0].dtype != frame.dtype):
+            with self.lock:
+                self.buffers = [np.empty_like(frame)
+                                for _ in range(self.size)]
+                self.latest = None
+                self.reading = None
+
+        with self.lock:
+            busy = (self.latest, self.reading)
+        slot = next(index for index in range(self.size) if index not in busy)
+        np.copyto(self.buffers[slot], frame)
+
+        with self.lock:
+            # The reader never got to the previous frame
+            if self.latest is not None:
+                self.dropped += 1
+            self.latest = slot
+            self.written += 1
+
+# -------------------------------- READ ---------------------------------- #
+    def read(self):
+        """Take the newest frame or None if there is no new frame
+        The buffer is not reused until release() is called"""
+        with self.lock:
+            if self.latest is None:
+                return None
+            self.reading = self.latest
+            self.latest = None
+            return self.buffers[self.reading]
+
+# ------------------------------- RELEASE -------------------------------- #
+    def release(self):
+        """Give the frame from read() back to the capture thread"""
+        with self.lock:
+            self.reading = None
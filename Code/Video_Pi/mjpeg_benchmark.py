@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    mjpeg_benchmark.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Measure the MJPEG server with clients on the same computer
+    Uses a moving test pattern, so no camera is needed
+    Reports the frames per second each client received
+    and how much CPU the JPEG encoding used
+    One client reads slowly to show that it drops frames
+    instead of slowing everyone else down
+    Usage: python3 mjpeg_benchmark.py [clients] [seconds]
+"""
+import http.client
+import sys
+import time
+from threading import Thread
+
+import numpy as np
+
+from mjpeg_server import MJPEGServer
+
+WIDTH = 640
+HEIGHT = 480
+FPS = 30
+# The slow client takes this long to "display" each frame
+SLOW_CLIENT_DELAY = 0.2
+
+
+class TestPattern:
+    """Moving gradient the size of a camera frame"""
+
+    def __init__(self):
+        x = np.linspace(0, 255, WIDTH, dtype=np.float32)
+        y = np.linspace(0, 255, HEIGHT, dtype=np.float32)
+        self.base = (x[np.newaxis, :] + y[:, np.newaxis]) / 2
+        self.frame = np.empty((HEIGHT, WIDTH, 3), dtype=np.uint8)
+        self.offset = 0
+
+    def __call__(self):
+        self.offset = (self.offset + 4) % 256
+        shifted = (self.base + self.offset) % 256
+        self.frame[:, :, 0] = shifted
+        self.frame[:, :, 1] = 255 - shifted
+        self.frame[:, :, 2] = self.offset
+        return self.frame
+
+
+# ------------------------------ READ FRAMES ----------------------------- #
+def read_frames(port, seconds, delay, results, name):
+    """Read multipart frames for a number of seconds, count them"""
+    connection = http.client.HTTPConnection('127.0.0.1', port)
+    connection.request('GET', '/stream.mjpg')
+    response = connection.getresponse()
+
+    frames = 0
+    total_bytes = 0
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        # Part headers end with a blank line
+        length = 0
+        while True:
+            line = response.fp.readline()
+            if not line:
+                break
+            if line.lower().startswith(b'content-length:'):
+                length = int(line.split(b':')[1])
+            elif line == b'\r\n' and length:
+                break
+        if not length:
+            break
+        total_bytes += len(response.fp.read(length))
+        response.fp.readline()
+        frames += 1
+        if delay:
+            time.sleep(delay)
+    connection.close()
+    results[name] = (frames / seconds, total_bytes / max(frames, 1))
+
+
+def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    server = MJPEGServer(TestPattern(), port=0, fps=FPS, host='127.0.0.1')
+    server.start()
+    print(f"Target: {FPS} FPS, {clients} clients + 1 slow client, "
+          f"{seconds:.0f} seconds")
+
+    results = {}
+    threads = []
+    for number in range(clients):
+        threads.append(Thread(target=read_frames, args=(
+            server.port, seconds, 0, results, f"Client {number + 1}")))
+    threads.append(Thread(target=read_frames, args=(
+        server.port, seconds, SLOW_CLIENT_DELAY, results, "Slow client")))
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for name, (fps, frame_size) in results.items():
+        print(f"{name:12} {fps:6.1f} FPS  {frame_size / 1024:6.1f} KB/frame")
+    print(f"Frames encoded: {server.frames_encoded}")
+    metrics = server.pacer.metrics()
+    print(f"Capture FPS: {metrics['real_fps']:.1f}  "
+          f"Jitter: {metrics['jitter_ms']:.1f} ms  "
+          f"Missed: {metrics['missed']}")
+    print(f"Encode CPU: {server.encode_cpu_percent():.1f}% of one core")
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
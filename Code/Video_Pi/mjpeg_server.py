@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    mjpeg_server.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Serve camera frames as an MJPEG stream over HTTP
+    Open http://robot-ip:8000/ in any browser, no VNC needed
+    Each frame is encoded to JPEG once and shared by every client
+    A slow client skips to the newest frame instead of buffering old ones
+"""
+import io
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread, Condition, Event
+
+from PIL import Image
+
+from frame_pacer import FramePacer
+
+BOUNDARY = "FRAME"
+PAGE = """\
+<html>
+<head><title>Video Pi</title></head>
+<body style="margin:0; background:black">
+<img src="/stream.mjpg" style="display:block; margin:auto">
+</body>
+</html>
+"""
+
+
+class FrameBroadcaster:
+    """Hold the newest JPEG frame and wake up every waiting client"""
+
+    def __init__(self):
+        self.condition = Condition()
+        self.frame = None
+        # Goes up by one for every new frame
+        self.sequence = 0
+        self.clients = 0
+        self.running = True
+
+# ------------------------------- PUBLISH -------------------------------- #
+    def publish(self, jpeg):
+        """Share a new encoded frame with all clients"""
+        with self.condition:
+            self.frame = jpeg
+            self.sequence += 1
+            self.condition.notify_all()
+
+# --------------------------- WAIT FOR FRAME ----------------------------- #
+    def wait_for_frame(self, last_sequence, timeout=1.0):
+        """Wait for a frame newer than last_sequence
+        Returns (sequence, jpeg), jpeg is None on timeout or shutdown"""
+        with self.condition:
+            self.condition.wait_for(
+                lambda: self.sequence > last_sequence or not self.running,
+                timeout)
+            if self.sequence > last_sequence and self.running:
+                return self.sequence, self.frame
+            return last_sequence, None
+
+# ------------------------------- CLOSE ---------------------------------- #
+    def close(self):
+        """Wake up every client so they can disconnect"""
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+
+
+class MJPEGHandler(BaseHTTPRequestHandler):
+    """Serve the viewer page and the multipart MJPEG stream"""
+
+    def do_GET(self):
+        if self.path in ('/', '/index.html'):
+            content = PAGE.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+        elif self.path == '/stream.mjpg':
+            self.stream()
+        else:
+            self.send_error(404)
+
+    def stream(self):
+        """Send frames until the client disconnects"""
+        broadcaster = self.server.broadcaster
+        self.send_response(200)
+        self.send_header('Age', '0')
+        self.send_header('Cache-Control', 'no-cache, private')
+        self.send_header('Pragma', 'no-cache')
+        self.send_header(
+            'Content-Type', f'multipart/x-mixed-replace; boundary={BOUNDARY}')
+        self.end_headers()
+
+        with broadcaster.condition:
+            broadcaster.clients += 1
+        sequence = 0
+        try:
+            while broadcaster.running:
+                # Always jump to the newest frame, older ones are skipped
+                sequence, jpeg = broadcaster.wait_for_frame(sequence)
+                if jpeg is None:
+                    continue
+                self.wfile.write(
+                    f"--{BOUNDARY}\r\n"
+                    f"Content-Type: image/jpeg\r\n"
+                    f"Content-Length: {len(jpeg)}\r\n\r\n".encode('ascii'))
+                self.wfile.write(jpeg)
+                self.wfile.write(b'\r\n')
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away
+            pass
+        finally:
+            with broadcaster.condition:
+                broadcaster.clients -= 1
+
+    def log_message(self, format, *args):
+        # Don't print a line for every request
+        pass
+
+
+class MJPEGServer:
+    """Capture, encode once and serve frames to any number of clients"""
+
+    def __init__(self, capture_frame, port=8000, fps=15, quality=80,
+                 host=''):
+        # Function that returns the next frame as a NumPy array
+        self.capture_frame = capture_frame
+        self.fps = fps
+        self.quality = quality
+        self.broadcaster = FrameBroadcaster()
+
+        self.httpd = ThreadingHTTPServer((host, port), MJPEGHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.broadcaster = self.broadcaster
+        self.port = self.httpd.server_address[1]
+
+        self.stop_event = Event()
+        self.frames_encoded = 0
+        # CPU seconds spent encoding JPEG frames
+        self.encode_cpu = 0.0
+        self.start_time = None
+        self.pacer = FramePacer(fps)
+
+# ------------------------------- START ---------------------------------- #
+    def start(self):
+        """Start the encoder and HTTP server threads"""
+        self.start_time = time.monotonic()
+        Thread(target=self.encode_loop, daemon=True).start()
+        Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+# -------------------------------- STOP ---------------------------------- #
+    def stop(self):
+        self.stop_event.set()
+        self.broadcaster.close()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+# ------------------------------- ENCODE --------------------------------- #
+    def encode(self, frame):
+        """Encode a NumPy frame as JPEG bytes"""
+        image = Image.fromarray(frame)
+        # JPEG has no alpha channel
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        buffer = io.BytesIO()
+        image.save(buffer, 'JPEG', quality=self.quality)
+        return buffer.getvalue()
+
+# ----------------------------- ENCODE LOOP ------------------------------ #
+    def encode_loop(self):
+        """Capture and encode frames while anyone is watching"""
+        while not self.stop_event.is_set():
+            # Don't capture or encode when nobody is connected
+            if self.broadcaster.clients == 0:
+                self.stop_event.wait(0.1)
+                self.pacer.reset()
+                continue
+
+            self.pacer.start_frame()
+            frame = self.capture_frame()
+            cpu_start = time.thread_time()
+            jpeg = self.encode(frame)
+            self.encode_cpu += time.thread_time() - cpu_start
+            self.frames_encoded += 1
+            self.broadcaster.publish(jpeg)
+
+            # Running behind skips frames instead of catching up
+            self.pacer.wait(self.stop_event)
+
+# ------------------------------ ENCODE CPU ------------------------------ #
+    def encode_cpu_percent(self):
+        """Percent of one CPU core used for JPEG encoding"""
+        elapsed = time.monotonic() - self.start_time
+        return 100 * self.encode_cpu / elapsed if elapsed > 0 else 0.0
+
+# --------------------------- SERVE FOREVER ------------------------------ #
+    def serve_forever(self):
+        """Run until Ctrl+C"""
+        self.start()
+        print(f"Streaming on http://<robot-ip>:{self.port}/ (Ctrl+C to exit)")
+        try:
+            while True:
+                time.sleep(5)
+                print(f"Clients: {self.broadcaster.clients} "
+                      f"Frames: {self.frames_encoded} "
+                      f"FPS: {self.pacer.real_fps():.1f} "
+                      f"Missed: {self.pacer.missed} "
+                      f"Encode CPU: {self.encode_cpu_percent():.1f}%")
+        except KeyboardInterrupt:
+            print("\nStopping stream")
+        finally:
+            self.stop()
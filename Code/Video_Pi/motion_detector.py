@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    motion_detector.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Find motion in camera frames on a background thread
+    Each frame is shrunk to a small grayscale copy and compared to the
+    previous one, pixels that changed more than the threshold are motion
+    Changed pixels are grouped into blocks, touching blocks become boxes
+    A frame that is the same as the last one is skipped
+    Results go to subscribers as (score, boxes)
+    score is the fraction of the picture that changed, 0.0 to 1.0
+    boxes are (x1, y1, x2, y2) in full size frame pixels
+"""
+from threading import Thread, Event
+
+import numpy as np
+
+from frame_ring import FrameRing
+
+
+class MotionDetector:
+    """Frame differencing on downscaled grayscale frames"""
+
+    def __init__(self, scale=8, threshold=25, block=4, min_blocks=2):
+        # Use every scale-th pixel in each direction
+        self.scale = scale
+        # Brightness change that counts as motion, 0-255
+        self.threshold = threshold
+        # Size of a block in small frame pixels
+        self.block = block
+        # Smaller groups of blocks are noise
+        self.min_blocks = min_blocks
+        self.frames = FrameRing()
+        self.new_frame = Event()
+        self.stop_event = Event()
+        self.previous = None
+        self.subscribers = []
+        # Latest results
+        self.score = 0.0
+        self.boxes = []
+        self.frames_checked = 0
+        self.frames_skipped = 0
+
+# ------------------------------ SUBSCRIBE ------------------------------- #
+    def subscribe(self, callback):
+        """Call callback(score, boxes) after every checked frame
+        The callback runs on the detector thread,
+        don't touch Tkinter widgets from it"""
+        self.subscribers.append(callback)
+
+# ------------------------------- START ---------------------------------- #
+    def start(self):
+        """Start the detector thread"""
+        self.stop_event.clear()
+        self.previous = None
+        Thread(target=self.detect_loop, daemon=True).start()
+
+# -------------------------------- STOP ---------------------------------- #
+    def stop(self):
+        self.stop_event.set()
+        self.new_frame.set()
+
+# ------------------------------ ADD FRAME ------------------------------- #
+    def add_frame(self, frame):
+        """Hand a new camera frame to the detector, called by capture
+        If the detector is busy the frame replaces the waiting one"""
+        self.frames.write(frame)
+        self.new_frame.set()
+
+# ----------------------------- DETECT LOOP ------------------------------ #
+    def detect_loop(self):
+        while not self.stop_event.is_set():
+            self.new_frame.wait()
+            self.new_frame.clear()
+            frame = self.frames.read()
+            if frame is None:
+                continue
+            try:
+                small = self.downscale(frame)
+            finally:
+                self.frames.release()
+
+            previous = self.previous
+            self.previous = small
+            if previous is None:
+                continue
+            if np.array_equal(small, previous):
+                # Nothing changed, keep the last results
+                self.frames_skipped += 1
+                continue
+
+            self.score, self.boxes = self.detect(previous, small)
+            self.frames_checked += 1
+            for callback in self.subscribers:
+                callback(self.score, self.boxes)
+
+# ------------------------------ DOWNSCALE ------------------------------- #
+    def downscale(self, frame):
+        """Small grayscale copy of an RGB or RGBA frame"""
+        # The weighted sum reaches 65280, too big for int16
+        small = frame[::self.scale, ::self.scale, :3].astype(np.int32)
+        # Integer luma, (R*77 + G*150 + B*29) / 256
+        luma = (small[:, :, 0] * 77 + small[:, :, 1] * 150
+                + small[:, :, 2] * 29) >> 8
+        # 0-255 fits int16, and differences between frames stay signed
+        return luma.astype(np.int16)
+
+# -------------------------------- DETECT -------------------------------- #
+    def detect(self, previous, current):
+        """Compare two small frames, return (score, boxes)"""
+        changed = np.abs(current - previous) > self.threshold
+        score = float(changed.mean())
+
+        # Count changed pixels in each block
+        rows = changed.shape[0] // self.block
+        cols = changed.shape[1] // self.block
+        blocks = changed[:rows * self.block, :cols * self.block]
+        blocks = blocks.reshape(rows, self.block, cols, self.block)
+        # A block moves when a quarter of its pixels changed
+        active = blocks.sum(axis=(1, 3)) * 4 >= self.block * self.block
+
+        size = self.scale * self.block
+        boxes = [(x1 * size, y1 * size, (x2 + 1) * size, (y2 + 1) * size)
+                 for x1, y1, x2, y2 in self.group_blocks(active)]
+        return score, boxes
+
+# ---------------------------- GROUP BLOCKS ------------------------------ #
+    def group_blocks(self, active):
+        """Bounding boxes of touching active blocks, in block units"""
+        seen = np.zeros_like(active)
+        groups = []
+        for row, col in zip(*np.nonzero(active)):
+            if seen[row, col]:
+                continue
+            # Flood fill from this block
+            seen[row, col] = True
+            stack = [(row, col)]
+            count = 0
+            x1, y1, x2, y2 = col, row, col, row
+            while stack:
+                r, c = stack.pop()
+                count += 1
+                x1, y1 = min(x1, c), min(y1, r)
+                x2, y2 = max(x2, c), max(y2, r)
+                for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                    if (0 <= nr < active.shape[0] and 0 <= nc < active.shape[1]
+                            and active[nr, nc] and not seen[nr, nc]):
+                        seen[nr, nc] = True
+                        stack.append((nr, nc))
+            if count >= self.min_blocks:
+                groups.append((int(x1), int(y1), int(x2), int(y2)))
+        return groups
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+    Name:    ui_dispatcher.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Safely update Tkinter widgets from any thread
+    Tkinter is not thread safe, worker threads post their updates here
+    Once per frame an after() callback on the GUI thread runs them
+    Only the latest update for each widget is kept, so a fast sensor
+    or camera can't pile up work faster than the GUI can draw it
+"""
+from threading import Lock
+
+# About 30 updates per second
+FLUSH_INTERVAL_MS = 33
+
+
+class UIDispatcher:
+    """Coalesce widget updates from any thread into one flush per frame"""
+
+    def __init__(self, window, interval_ms=FLUSH_INTERVAL_MS):
+        self.window = window
+        self.interval_ms = interval_ms
+        # key: (function, args, kwargs), newest update wins
+        self.pending = {}
+        self.lock = Lock()
+        self.after_id = None
+        self.start()
+
+# -------------------------------- POST ---------------------------------- #
+    def post(self, key, function, *args, **kwargs):
+        """Run function(*args, **kwargs) on the GUI thread at the next flush
+        A later post with the same key replaces this one"""
+        with self.lock:
+            self.pending[key] = (function, args, kwargs)
+
+# ------------------------------ CONFIGURE ------------------------------- #
+    def configure(self, widget, **options):
+        """Thread safe widget.configure(**options)"""
+        key = (widget, tuple(sorted(options)))
+        self.post(key, widget.configure, **options)
+
+# -------------------------------- FLUSH --------------------------------- #
+    def flush(self):
+        """Run every pending update, called on the GUI thread"""
+        with self.lock:
+            pending = self.pending
+            self.pending = {}
+        try:
+            for function, args, kwargs in pending.values():
+                # One bad update must not drop the rest
+                try:
+                    function(*args, **kwargs)
+                except Exception as e:
+                    name = getattr(function, '__name__', function)
+                    print(f" UI update {name} failed: "
+                          f"{type(e).__name__}: {e}")
+        finally:
+            self.after_id = self.window.after(self.interval_ms, self.flush)
+
+# ----------------------------- START / STOP ----------------------------- #
+    def start(self):
+        """Start flushing once per frame"""
+        if self.after_id is None:
+            self.after_id = self.window.after(self.interval_ms, self.flush)
+
+    def stop(self):
+        """Stop flushing, call before the window is destroyed"""
+        if self.after_id is not None:
+            self.window.after_cancel(self.after_id)
+            self.after_id = None
@@ -6,27 +6,49 @@
     and still images from the Raspberry Pi camera using the PiCamera2 library and Tkinter.
     Raspberry Pi Buster
     sudo pip3 install pillow -U
+    Headless MJPEG streaming without Tkinter or VNC:
+    python3 video_pi.py --stream [port]
 ------------------------------------------------
 History
 ------------------------------------------------
 Author     Date           Comments
+Loring     10/18/26       Preview from lores, stills from main without restarting
+Loring     10/18/26       Optional motion detection, record a clip on motion
+Loring     10/18/26       Record clips from before and after an event
+Loring     10/18/26       Pace capture with monotonic deadlines, show jitter
+Loring     10/18/26       Add headless MJPEG over HTTP streaming mode
+Loring     10/18/26       Reuse frame buffers and one PhotoImage
+Loring     10/18/26       GUI updates from threads go through UIDispatcher
 Loring     03/22/25       Change stop start streamining threads to use Event object
 Loring     03/21/25       Added FPS to status bar   
 """
 
+import sys
 import tkinter as tk
 import tkinter.ttk as ttk
 from picamera2 import Picamera2
 from PIL import Image, ImageTk
 from datetime import datetime
 from threading import Thread, Event
-from time import time, sleep
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+from ui_dispatcher import UIDispatcher
+from frame_ring import FrameRing
+from mjpeg_server import MJPEGServer
+from frame_pacer import FramePacer
+from clip_recorder import ClipRecorder
+from motion_detector import MotionDetector
+from dual_stream import configure_camera, preview_frame
 
 # Constants
 # Frames per second (FPS) for the video stream
 # Set this lower for slower Pi's
 FPS = 15
 FRAME_INTERVAL_MS = 1000 / FPS
+# Seconds of video kept before and recorded after a clip is triggered
+CLIP_SECONDS = 5
+# Fraction of the picture that has to change to record a motion clip
+MOTION_RECORD_SCORE = 0.02
 # Button width for consistent UI
 BUTTON_WIDTH = 16
 
@@ -40,8 +62,13 @@ class PiCameraApp:
         self.window.protocol("WM_DELETE_WINDOW", self.quit)
 
         # Initialize camera and configuration
+        # The lores stream is the preview, the main stream is for stills
         self.picam2 = Picamera2()
-        self.picam2.configure(self.picam2.create_preview_configuration())
+        self.lores_format = configure_camera(self.picam2)
+        # Set to take a still from the main stream of the next frame
+        self.still_event = Event()
+        # JPEG encoding of stills runs here, not on the capture thread
+        self.encoder = ThreadPoolExecutor(max_workers=2)
 
         # Create an Event object to control start and stop of the video stream.
         # The self.stream_event is used to control whether the video stream
@@ -49,16 +76,34 @@ class PiCameraApp:
         # when it's "cleared," the stream stops.
         self.stream_event = Event()
 
-        self.frame_count = 0
-        self.start_time = time()
+        # Keeps capture on FPS no matter how long each capture takes
+        self.pacer = FramePacer(FPS)
+        self.status_time = monotonic()
         # Initialize image variable to store the captured frame
         self.image = None
-        # Flag to track if the update image thread has started
-        self.update_thread_started = False
+        # Preallocated buffers shared by the capture and GUI threads
+        self.frames = FrameRing()
+        # One PhotoImage and canvas item, updated in place every frame
+        self.photo = None
+        self.photo_mode = None
+        self.canvas_image = None
+        # Last few seconds of video, saved when record_clip() is called
+        self.recorder = ClipRecorder(FPS, CLIP_SECONDS, CLIP_SECONDS)
+        self.recorder.start()
+        # Motion detection runs on its own thread when turned on
+        self.motion = MotionDetector()
+        self.motion.subscribe(self.motion_detected)
+        self.motion.start()
+        self.motion_score = 0.0
+        self.motion_on = False
 
         # Create GUI widgets
         self.create_widgets()
 
+        # The capture thread hands frames and status text to the GUI thread
+        # Only the newest frame is drawn, once per frame interval
+        self.ui = UIDispatcher(self.window, int(FRAME_INTERVAL_MS))
+
         # Start the Tkinter main loop
         self.window.mainloop()
 
@@ -77,13 +122,12 @@ class PiCameraApp:
             self.btn_start_stop.configure(text="Stop Stream")
             self.picam2.start()
 
-            # Reset frame count and start time
-            self.frame_count = 0
-            self.start_time = time()
+            # Reset the frame pacing and its metrics
+            self.pacer.reset()
+            self.status_time = monotonic()
 
-            # Start threads for capturing frames and updating the canvas
+            # Start the thread for capturing frames
             self.start_thread(self._capture_frames)
-            self.start_update_image_thread()
 
     # ---------------------- STOP STREAM ----------------------------------- #
     def stop_stream(self):
@@ -98,10 +142,6 @@ class PiCameraApp:
             self.btn_start_stop.configure(text="Start Stream")
             self.picam2.stop()
 
-            # Reset thread state
-            self.update_thread_started = False
-            self.frame_count = 0
-
     # ---------------------- START/STOP STREAM ----------------------------- #
     def start_stop_stream(self):
         """Toggle the video stream on or off."""
@@ -117,81 +157,141 @@ class PiCameraApp:
         thread.daemon = True  # Ensure thread exits with the program
         thread.start()
 
-    # ---------------------- UPDATE IMAGE THREAD --------------------------- #
-    def start_update_image_thread(self):
-        """Start the update_image method in a separate thread."""
-        if not self.update_thread_started:
-            self.start_thread(self.update_image)
-            self.update_thread_started = True
-
     # ---------------------- FRAME CAPTURE --------------------------------- #
     def _capture_frames(self):
         """Continuously capture frames from the camera."""
         while self.stream_event.is_set():
-            self.image = self.picam2.capture_array()
-            self.frame_count += 1
-
-            # Update FPS every second
-            # Use `time` from the imported function
-            elapsed_time = time() - self.start_time
-            if elapsed_time >= 1.0:
-                fps = self.frame_count / elapsed_time
-                self.lbl_status_bar.configure(
-                    text=f" Video Stream Running . . . | FPS: {fps:.2f}"
+            self.pacer.start_frame()
+            # One request holds the lores and main images of the same frame
+            request = self.picam2.capture_request()
+            try:
+                self.image = preview_frame(request, self.lores_format)
+                if self.still_event.is_set():
+                    self.still_event.clear()
+                    # make_array copies, the request can be released
+                    still = request.make_array("main")
+                    self.encoder.submit(self._save_image, still)
+            finally:
+                request.release()
+            self.frames.write(self.image)
+            self.recorder.add_frame(self.image)
+            if self.motion_on:
+                self.motion.add_frame(self.image)
+
+            # Draw the newest frame on the GUI thread
+            self.ui.post("frame", self.update_image)
+
+            # Update the pacing metrics every second
+            if monotonic() - self.status_time >= 1.0:
+                metrics = self.pacer.metrics()
+                self.ui.configure(
+                    self.lbl_status_bar,
+                    text=f" Video Stream Running . . . | FPS: "
+                    f"{metrics['real_fps']:.2f}/{metrics['target_fps']}"
+                    f" | Jitter: {metrics['jitter_ms']:.1f} ms"
+                    f" | Capture: {metrics['capture_ms']:.1f} ms"
+                    f" | Missed: {metrics['missed']}"
+                    f" | Dropped: {self.frames.dropped}"
+                    + (f" | Motion: {self.motion_score:.1%}"
+                       if self.motion_on else "")
+                    + (" | Recording" if self.recorder.recording else "")
                 )
-                self.frame_count = 0
-                self.start_time = time()
+                self.status_time = monotonic()
 
-            # Pause the thread to maintain the desired frame rate
-            # sleep expects seconds, convert milliseconds to seconds
-            sleep(FRAME_INTERVAL_MS / 1000.0)
+            # Sleep until the next frame is due, the capture time
+            # is already taken out of the wait
+            self.pacer.wait()
 
     # ---------------------- IMAGE UPDATING -------------------------------- #
     def update_image(self):
-        """Update the Canvas widget with the latest image from the camera."""
-        while self.stream_event.is_set():
-            if self.image is not None:
-                # Convert the frame to a Tkinter-compatible image
-                image = Image.fromarray(self.image)
-                image = ImageTk.PhotoImage(image)
-
-                # Display the image on the canvas
-                self.canvas.create_image(0, 0, anchor=tk.NW, image=image)
-
-                # Prevent the image from being garbage collected
-                # by keeping a reference to it
-                self.photo = image
-
-            # Pause the thread to maintain the desired frame rate
-            # sleep expects seconds, convert milliseconds to seconds
-            sleep(FRAME_INTERVAL_MS / 1000.0)
+        """Update the Canvas widget with the newest frame, runs on the GUI thread."""
+        # The stream may have stopped since the frame was posted
+        if not self.stream_event.is_set():
+            return
+
+        frame = self.frames.read()
+        if frame is None:
+            return
+        try:
+            # fromarray shares the buffer memory instead of copying it
+            image = Image.fromarray(frame)
+
+            # Create the PhotoImage and canvas item once,
+            # again only if the frame size or mode changes
+            if (self.photo is None or self.photo.width() != image.width
+                    or self.photo.height() != image.height
+                    or self.photo_mode != image.mode):
+                self.photo = ImageTk.PhotoImage(image.mode, image.size)
+                self.photo_mode = image.mode
+                if self.canvas_image is None:
+                    self.canvas_image = self.canvas.create_image(
+                        0, 0, anchor=tk.NW, image=self.photo)
+                else:
+                    self.canvas.itemconfigure(
+                        self.canvas_image, image=self.photo)
+
+            # Copy the pixels into the existing PhotoImage
+            self.photo.paste(image)
+        finally:
+            self.frames.release()
+        # Keep the motion boxes on top of the video
+        self.canvas.tag_raise("motion")
 
     # ---------------------- CAPTURE IMAGE --------------------------------- #
     def capture_image(self):
         """Capture a still image and save it to the hard drive."""
-        self.stop_stream()
-        # Start the image capture thread if it's not already running
-        # This ensures that the image capture thread is started only once
-        if not self.stream_event.is_set():
-            self.start_thread(self._capture_image_thread)
+        # The capture thread takes the still from the next frame,
+        # the stream keeps running
         self.start_stream()
-
-    # ---------------------- CAPTURE IMAGE THREAD -------------------------- #
-    def _capture_image_thread(self):
-        """Save the current frame as an image file."""
-        if self.image is not None:
-            # Convert the frame to a PIL image and save it
-            image = Image.fromarray(self.image)
-
-            # Convert RGBA to RGB if the image has an alpha channel
-            if image.mode == 'RGBA':
-                image = image.convert('RGB')
-
-            # Save the image with a timestamped filename
-            # Use datetime to create a unique filename
-            filename = datetime.now().strftime("%Y-%m-%d_%H-%M-%S") + ".jpg"
-            image.save(filename, 'JPEG')
-            print(f"Image saved as {filename}")
+        self.still_event.set()
+
+    # ---------------------- RECORD CLIP ----------------------------------- #
+    def record_clip(self, reason="button"):
+        """Save the last CLIP_SECONDS of video and the next CLIP_SECONDS.
+        Safe to call from any thread, for example when an obstacle is found."""
+        if self.recorder.trigger(reason):
+            print(f"Recording clip: {reason}")
+
+    # ---------------------- MOTION DETECTION ------------------------------ #
+    def motion_detected(self, score, boxes):
+        """Called on the motion detector thread after every checked frame."""
+        self.motion_score = score
+        self.ui.post("motion", self.draw_motion, boxes)
+        if score >= MOTION_RECORD_SCORE:
+            self.record_clip("motion")
+
+    def draw_motion(self, boxes):
+        """Draw a rectangle around each moving area, runs on the GUI thread."""
+        self.canvas.delete("motion")
+        if not self.motion_on:
+            return
+        for x1, y1, x2, y2 in boxes:
+            self.canvas.create_rectangle(
+                x1, y1, x2, y2, outline="red", width=2, tags="motion")
+
+    def toggle_motion(self):
+        """Turn motion detection on or off."""
+        # Plain attribute, Tk variables belong to the GUI thread
+        self.motion_on = self.motion_enabled.get()
+        if not self.motion_on:
+            self.motion_score = 0.0
+            self.canvas.delete("motion")
+
+    # ---------------------- SAVE IMAGE ------------------------------------ #
+    def _save_image(self, frame):
+        """Save a full resolution frame as a JPEG, runs on the encoder pool."""
+        # Convert the frame to a PIL image and save it
+        image = Image.fromarray(frame)
+
+        # Convert RGBA to RGB if the image has an alpha channel
+        if image.mode == 'RGBA':
+            image = image.convert('RGB')
+
+        # Save the image with a timestamped filename
+        # Milliseconds keep stills taken close together apart
+        filename = datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f")[:-3] + ".jpg"
+        image.save(filename, 'JPEG')
+        print(f"Image saved as {filename}")
 
     # ---------------------- CREATE WIDGETS -------------------------------- #
     def create_widgets(self):
@@ -206,6 +306,14 @@ class PiCameraApp:
         self.btn_capture_image = ttk.Button(
             self.window, text="Capture Image", command=self.capture_image, width=BUTTON_WIDTH
         )
+        self.btn_record_clip = ttk.Button(
+            self.window, text="Record Clip", command=self.record_clip, width=BUTTON_WIDTH
+        )
+        self.motion_enabled = tk.BooleanVar(value=False)
+        self.chk_motion = ttk.Checkbutton(
+            self.window, text="Motion", variable=self.motion_enabled,
+            command=self.toggle_motion
+        )
         self.btn_quit = ttk.Button(
             self.window, text="Quit", command=self.quit, width=BUTTON_WIDTH
         )
@@ -216,11 +324,13 @@ class PiCameraApp:
         )
 
         # Arrange widgets in a grid layout
-        self.canvas.grid(row=0, column=0, columnspan=4)
+        self.canvas.grid(row=0, column=0, columnspan=5)
         self.btn_start_stop.grid(row=1, column=0)
+        self.btn_record_clip.grid(row=1, column=1)
         self.btn_capture_image.grid(row=1, column=2)
-        self.btn_quit.grid(row=1, column=3)
-        self.lbl_status_bar.grid(row=2, column=0, columnspan=4, sticky="WE")
+        self.chk_motion.grid(row=1, column=3)
+        self.btn_quit.grid(row=1, column=4)
+        self.lbl_status_bar.grid(row=2, column=0, columnspan=5, sticky="WE")
 
         # Add padding to all widgets
         for child in self.window.winfo_children():
@@ -233,12 +343,33 @@ class PiCameraApp:
     def quit(self, *args):
         """Clean up resources and exit the application."""
         self.stop_stream()
+        self.recorder.stop()
+        self.motion.stop()
+        self.encoder.shutdown(wait=True)
+        self.ui.stop()
         self.window.destroy()
 
 
+def stream(port=8000):
+    """Serve the camera as MJPEG over HTTP without a GUI."""
+    picam2 = Picamera2()
+    picam2.configure(picam2.create_preview_configuration())
+    picam2.start()
+    try:
+        MJPEGServer(picam2.capture_array, port, FPS).serve_forever()
+    finally:
+        picam2.stop()
+
+
 def main():
     """Main function to run the application."""
-    PiCameraApp()
+    if "--stream" in sys.argv:
+        # Optional port number after --stream
+        index = sys.argv.index("--stream")
+        port = int(sys.argv[index + 1]) if len(sys.argv) > index + 1 else 8000
+        stream(port)
+    else:
+        PiCameraApp()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+    Name:    check_shared_copies.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Each project folder runs on its own, so shared modules are
+    copied into every folder that uses them
+    This checks that every copy of a shared module is the same file,
+    a fix made to one copy and not the others is reported
+    Usage: python3 Code/check_shared_copies.py
+    Exits with 1 if any copies are different
+    After fixing one copy, copy it over the others
+"""
+import hashlib
+import sys
+from pathlib import Path
+
+# The repository folder, one up from Code
+ROOT = Path(__file__).resolve().parent.parent
+
+# Shared module: every folder that has a copy
+SHARED = {
+    "latency_trace.py": [
+        "Code/Examples",
+        "Code/PS4_Game_Controller",
+        "Code/Remote_Control",
+    ],
+    "motor_commands.py": [
+        "Code/PS4_Game_Controller",
+        "Code/Remote_Control",
+    ],
+    "odometry.py": [
+        "Code/Distance_Sensor",
+        "Code/Examples",
+    ],
+    "ps4_gopigo_pygame.py": [
+        "Code/PS4_Game_Controller",
+        "Code/Remote_Control",
+    ],
+    "sensor_hub.py": [
+        "Code/Lidar",
+        "Code/Remote_Control",
+        "Threading_Tutorial",
+    ],
+    "servo_motion.py": [
+        "Code/Distance_Sensor",
+        "Code/Lidar",
+    ],
+    "timeseries_store.py": [
+        "Code/Remote_Control",
+        "Code/Sensors",
+        "Sensors",
+    ],
+    "ui_dispatcher.py": [
+        "Code/Remote_Control",
+        "Code/Video_Pi",
+    ],
+    "weather_units.py": [
+        "Code/Old",
+        "Code/Remote_Control",
+        "Code/Sensors",
+        "Sensors",
+    ],
+}
+
+
+def file_hash(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def check_module(name, folders):
+    """Return a list of problems with the copies of one module"""
+    problems = []
+    # Copies grouped by their contents
+    groups = {}
+    for folder in folders:
+        path = ROOT / folder / name
+        if not path.exists():
+            problems.append(f"  {folder}/{name} is missing")
+            continue
+        groups.setdefault(file_hash(path), []).append(folder)
+
+    # Copies nobody listed, a new folder started using the module
+    for path in sorted(ROOT.rglob(name)):
+        folder = path.parent.relative_to(ROOT).as_posix()
+        if folder not in folders and ".git" not in path.parts:
+            problems.append(f"  {folder}/{name} is not in SHARED")
+
+    if len(groups) > 1:
+        problems.append(f"  {len(groups)} different versions:")
+        for number, group in enumerate(groups.values(), 1):
+            problems.append(f"    version {number}: {', '.join(group)}")
+    return problems
+
+
+def main():
+    different = 0
+    for name, folders in SHARED.items():
+        problems = check_module(name, folders)
+        if problems:
+            different += 1
+            print(f"{name}")
+            print("\n".join(problems))
+        else:
+            print(f"{name}: {len(folders)} copies match")
+    if different:
+        print(f"\n{different} shared module(s) need their copies synced")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
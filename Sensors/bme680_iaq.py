@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+    Filename: bme680_iaq.py
+    Purpose: Indoor air quality from the Bosch bme680 gas sensor
+    The gas sensor's heater has to burn in before its readings settle,
+    for burn_in seconds the gas resistance only builds the baseline
+    Clean air has a high gas resistance, the baseline follows the
+    cleanest air seen, rising in about a minute and falling over a day
+    Air quality is 0-100, 100 is best, 75% from the gas resistance
+    compared to the baseline and 25% from humidity compared to 40%
+    Every reading is worked out in the same few steps, no lists are kept,
+    so the sensor can be read as fast as it measures
+    bme680_read_3.py shows how to use it
+    Based on the Pimoroni indoor air quality example:
+    https://github.com/pimoroni/bme680-python/blob/master/examples/indoor-air-quality.py
+    !Connect to I2C bus
+"""
+import time
+from collections import namedtuple
+from math import exp
+from threading import Thread, Event
+
+from weather_units import celsius_to_fahrenheit, hpa_to_pascals, \
+    sea_level_inhg
+
+# sudo pip3 install bme680
+import bme680
+
+# One published reading, iaq is None during burn-in
+# pressure_pa is the sensor's own station pressure, for saving
+Reading = namedtuple(
+    'Reading',
+    'time temp_f humidity pressure_inhg pressure_pa gas_resistance iaq '
+    'burning_in')
+
+
+def setup_sensor(sensor, heater_temp=320, heater_ms=150):
+    """Turn on the gas heater, oversampling settings from Pimoroni"""
+    sensor.set_humidity_oversample(bme680.OS_2X)
+    sensor.set_pressure_oversample(bme680.OS_4X)
+    sensor.set_temperature_oversample(bme680.OS_8X)
+    sensor.set_filter(bme680.FILTER_SIZE_3)
+    sensor.set_gas_status(bme680.ENABLE_GAS_MEAS)
+    sensor.set_gas_heater_temperature(heater_temp)
+    sensor.set_gas_heater_duration(heater_ms)
+    sensor.select_gas_heater_profile(0)
+
+
+class IAQPipeline:
+    """Read the bme680 and publish air quality with every reading"""
+
+    def __init__(self, sensor, burn_in=300, burn_in_every=None,
+                 hum_baseline=40.0, hum_weighting=0.25,
+                 rise_seconds=60, fall_seconds=86400):
+        self.sensor = sensor
+        # Seconds of heater burn-in, and again every burn_in_every seconds
+        # for example after moving to another room
+        self.burn_in = burn_in
+        self.burn_in_every = burn_in_every
+        self.hum_baseline = hum_baseline
+        self.hum_weighting = hum_weighting
+        # How fast the baseline follows cleaner and dirtier air
+        self.rise_seconds = rise_seconds
+        self.fall_seconds = fall_seconds
+
+        self.subscribers = []
+        self.stop_event = Event()
+        self.thread = None
+        self.latest = None
+        self.baseline = None
+        # Average gas resistance while burning in
+        self.burn_in_average = None
+        self.burn_in_end = None
+        self.next_burn_in = None
+        self.last_time = None
+
+    def subscribe(self, callback):
+        """callback(reading) is called with every Reading,
+        on the pipeline thread when start() is used"""
+        self.subscribers.append(callback)
+
+# ------------------------------- START ---------------------------------- #
+    def start(self):
+        """Read the sensor on a background thread"""
+        self.stop_event.clear()
+        self.thread = Thread(target=self.run_loop, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=2)
+
+# ------------------------------ RUN LOOP -------------------------------- #
+    def run_loop(self):
+        """Read as fast as the sensor measures until stop()"""
+        sensor = self.sensor
+        while not self.stop_event.is_set():
+            # Waits for the measurement and the heater
+            if not sensor.get_sensor_data():
+                continue
+            data = sensor.data
+            self.update(time.monotonic(), data.temperature, data.humidity,
+                        data.pressure, data.gas_resistance, data.heat_stable)
+
+# ------------------------------- UPDATE --------------------------------- #
+    def update(self, now, temp_c, humidity, pressure_hpa, gas, heat_stable):
+        """Work in one reading and publish it"""
+        if self.burn_in_end is None:
+            self.start_burn_in(now)
+        dt = 0.0 if self.last_time is None else now - self.last_time
+        self.last_time = now
+
+        burning_in = now < self.burn_in_end
+        iaq = None
+        if not heat_stable:
+            # The heater didn't reach its temperature, gas is not valid
+            gas = None
+            burning_in = burning_in or self.baseline is None
+        elif burning_in:
+            self.add_burn_in(gas, dt)
+        else:
+            if self.burn_in_average is not None:
+                self.finish_burn_in()
+            elif self.baseline is None:
+                # The heater never settled while burning in
+                self.baseline = gas
+            self.update_baseline(gas, dt)
+            iaq = self.air_quality(gas, humidity)
+
+        if (self.next_burn_in is not None and now >= self.next_burn_in
+                and not burning_in):
+            self.start_burn_in(now)
+
+        # Sensor output is celsius and hPa
+        pressure_pa = hpa_to_pascals(pressure_hpa)
+        self.latest = Reading(
+            time.time(), celsius_to_fahrenheit(temp_c), humidity,
+            sea_level_inhg(pressure_pa), pressure_pa, gas, iaq, burning_in)
+        for callback in self.subscribers:
+            callback(self.latest)
+
+# ------------------------------ BURN IN --------------------------------- #
+    def start_burn_in(self, now):
+        self.burn_in_end = now + self.burn_in
+        self.burn_in_average = None
+        if self.burn_in_every is not None:
+            self.next_burn_in = self.burn_in_end + self.burn_in_every
+
+    def add_burn_in(self, gas, dt):
+        """Average of about the last sixth of the burn-in,
+        the resistance climbs for minutes while the heater settles"""
+        if self.burn_in_average is None:
+            self.burn_in_average = gas
+        else:
+            weight = 1 - exp(-dt * 6 / self.burn_in)
+            self.burn_in_average += (gas - self.burn_in_average) * weight
+
+    def finish_burn_in(self):
+        """Start the baseline from the burn-in, a later burn-in
+        only raises it, dirty air must not become the new normal"""
+        if self.baseline is None:
+            self.baseline = self.burn_in_average
+        else:
+            self.baseline = max(self.baseline, self.burn_in_average)
+        self.burn_in_average = None
+
+# ------------------------------ BASELINE -------------------------------- #
+    def update_baseline(self, gas, dt):
+        """Follow cleaner air quickly and dirtier air slowly"""
+        seconds = self.rise_seconds if gas > self.baseline \
+            else self.fall_seconds
+        self.baseline += (gas - self.baseline) * (1 - exp(-dt / seconds))
+
+# ---------------------------- AIR QUALITY ------------------------------- #
+    def air_quality(self, gas, humidity):
+        """0-100, 100 is best"""
+        hum_max = self.hum_weighting * 100
+        hum_offset = humidity - self.hum_baseline
+        if hum_offset > 0:
+            hum_score = ((100 - self.hum_baseline - hum_offset)
+                         / (100 - self.hum_baseline) * hum_max)
+        else:
+            hum_score = (self.hum_baseline + hum_offset) \
+                / self.hum_baseline * hum_max
+
+        gas_max = 100 - hum_max
+        if gas < self.baseline:
+            gas_score = gas / self.baseline * gas_max
+        else:
+            gas_score = gas_max
+        return max(0.0, hum_score + gas_score)
+
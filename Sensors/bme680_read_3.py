@@ -2,51 +2,91 @@
 """
     Filename: bme680_read_3.py
    Purpose: Use Pimoroni library to read
-    temperature, pressure, and humidity from Bosch bme680 sensor
+    temperature, pressure, humidity, and air quality
+    from Bosch bme680 sensor
+    The sensor is read as fast as it measures by IAQPipeline,
+    the readings are printed every 5 seconds
+    Air quality shows after the 5 minute gas heater burn-in
+    A reading every second is saved in sensor_history,
+    see timeseries_store.py
     !Connect to I2C bus
     Press Ctrl+C to exit
 """
 from sys import exit
-from time import sleep
 
 # sudo pip3 install bme680
 import bme680
+# Gas heater burn-in and air quality
+from bme680_iaq import IAQPipeline, setup_sensor
+# Compressed history of the readings
+from timeseries_store import TimeSeriesStore
+
+# Seconds between printed readings
+PRINT_EVERY = 5
+# Seconds between saved readings
+SAVE_EVERY = 1
 
 # Initialize sensor object, make connection to sensor over I2C
 sensor = bme680.BME680(bme680.I2C_ADDR_PRIMARY)
+# Turn on the gas heater
+setup_sensor(sensor)
+pipeline = IAQPipeline(sensor)
+history = TimeSeriesStore()
+last_print = 0
+last_save = 0
 
-print(" BME680 Read temperature, pressure, and humidity")
-print(" Press CTRL+C to Exit")
 
-try:
-    while True:
-        # Can the sensor data can be retrieved successfully?
-        if sensor.get_sensor_data():
-            # If sensor data retrieval is successful,
-            # retrieve and display the data
+def save_reading(reading):
+    """Called with every reading, saves every SAVE_EVERY seconds"""
+    global last_save
+    if reading.time - last_save < SAVE_EVERY:
+        return
+    last_save = reading.time
+
+    # The sensor's own values, pressure in pascals
+    readings = {
+        "temperature": reading.temp_f,
+        "humidity": reading.humidity,
+        "pressure": reading.pressure_pa,
+    }
+    # No gas reading until the heater is stable
+    if reading.gas_resistance is not None:
+        readings["gas_resistance"] = reading.gas_resistance
+    history.append_many(readings, reading.time)
 
-            # Sensor output in celsius
-            temp_c = sensor.data.temperature
-            # Convert celsius to fahrenheit
-            temp_f = ((temp_c * 9.0) / 5.0) + 32
 
-            # Relative humidity in %
-            humidity = sensor.data.humidity
+def show_reading(reading):
+    """Called with every reading, prints every PRINT_EVERY seconds"""
+    global last_print
+    if reading.time - last_print < PRINT_EVERY:
+        return
+    last_print = reading.time
 
-            # Sensor output in hectoPascals (hPa), also called millibars
-            pressure_hpa = sensor.data.pressure
-            # Convert hPa hectopascals to inHg Inches of Mercury
-            pressure_inhg = pressure_hpa / 33.863886666667
-            # Compensate for 3960' altitude 4.04
-            # Scottsbluff, NE, Heilig Field, 4.04
-            pressure_inhg = pressure_inhg + 4.04
+    if reading.burning_in:
+        air_quality = "Burning in"
+    elif reading.iaq is None:
+        air_quality = "Heater not ready"
+    else:
+        air_quality = f"Air quality {reading.iaq:.0f}%"
+    gas = "" if reading.gas_resistance is None \
+        else f" | {reading.gas_resistance:.0f} Ω"
 
-            print(f" {temp_f:.1f} °F | {humidity:.1f}% | {
-                  pressure_inhg:.2f} inHg")
+    print(f" {reading.temp_f:.1f} °F | {reading.humidity:.1f}% | "
+          f"{reading.pressure_inhg:.2f} inHg{gas} | {air_quality}")
 
-            sleep(5)
 
+print(" BME680 Read temperature, pressure, humidity, and air quality")
+print(" Press CTRL+C to Exit")
+
+pipeline.subscribe(show_reading)
+pipeline.subscribe(save_reading)
+
+try:
+    # Read the sensor until Ctrl+C
+    pipeline.run_loop()
 
 except KeyboardInterrupt:
+    # Write the readings still in memory
+    history.close()
     print("Bye!")
     exit(0)
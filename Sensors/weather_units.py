@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+    Name:    weather_units.py
+    Author:  William A Loring
+    Created: 10/18/2026 Revised:
+    Purpose: Pressure and temperature conversions used by the
+    BME280 and BME680 programs, one copy of the numbers
+    A barometer reads the pressure where it is, station pressure,
+    weather reports give the pressure at sea level
+    sea_level_pressure() works out sea level pressure from the altitude
+    with the standard atmosphere, or the hypsometric formula
+    when the outside temperature is known
+    Set GOPIGO_ALTITUDE_FT to your altitude in feet,
+    the default is Scottsbluff, NE, Heilig Field
+    Every function takes one reading or a NumPy array of readings,
+    one reading is plain float math, fast enough for every sensor read,
+    an array goes through NumPy ufuncs so a whole history converts at once
+"""
+import os
+
+import numpy as np
+
+# Pascals in 1 inHg at 0°C
+PA_PER_INHG = 3386.389
+PA_PER_HPA = 100
+FEET_PER_METER = 3.28084
+
+# Altitude of the robot in feet
+ALTITUDE_FT = float(os.environ.get("GOPIGO_ALTITUDE_FT", 3960))
+
+# Standard atmosphere: temperature drop per meter, sea level temperature
+LAPSE_RATE = 0.0065
+SEA_LEVEL_K = 288.15
+# g * M / (R * L), the exponent of the barometric formula
+BAROMETRIC_EXPONENT = 5.25588
+
+# A sensor on the robot reads high from the Raspberry Pi's heat
+# (CPU temperature °C, °F to subtract), in between is interpolated
+# Starting values, not measured, check them against a thermometer
+# beside your robot and adjust
+SELF_HEATING = (
+    (35, 1.5),
+    (45, 2.5),
+    (55, 3.5),
+    (65, 4.5),
+    (75, 6.0),
+)
+# °F to subtract when the CPU temperature can't be read
+SELF_HEATING_DEFAULT = 4.0
+CPU_TEMPERATURE_FILE = "/sys/class/thermal/thermal_zone0/temp"
+
+
+# --------------------------- TEMPERATURE --------------------------------- #
+def celsius_to_fahrenheit(celsius):
+    return celsius * 9 / 5 + 32
+
+
+def fahrenheit_to_celsius(fahrenheit):
+    return (fahrenheit - 32) * 5 / 9
+
+
+# ----------------------------- PRESSURE ---------------------------------- #
+def pascals_to_inhg(pascals):
+    return pascals / PA_PER_INHG
+
+
+def hpa_to_pascals(hpa):
+    """hPa is the same as millibars"""
+    return hpa * PA_PER_HPA
+
+
+def sea_level_pressure(pascals, altitude_ft=None, outside_c=None):
+    """Sea level pressure in pascals from station pressure
+    outside_c is the outside temperature at the robot's altitude,
+    the standard atmosphere is used without it"""
+    if altitude_ft is None:
+        altitude_ft = ALTITUDE_FT
+    drop = LAPSE_RATE * altitude_ft / FEET_PER_METER
+    if outside_c is None:
+        # Standard atmosphere barometric formula
+        ratio = 1 - drop / SEA_LEVEL_K
+    else:
+        # Hypsometric formula with the outside temperature
+        ratio = 1 - drop / (outside_c + drop + 273.15)
+    return pascals * ratio ** -BAROMETRIC_EXPONENT
+
+
+def sea_level_inhg(pascals, altitude_ft=None, outside_c=None):
+    """Sea level pressure in inHg from a BME280 reading in pascals"""
+    return pascals_to_inhg(sea_level_pressure(pascals, altitude_ft, outside_c))
+
+
+# ---------------------------- SELF HEATING ------------------------------- #
+def cpu_temperature():
+    """Raspberry Pi CPU temperature in °C, None if it can't be read"""
+    try:
+        with open(CPU_TEMPERATURE_FILE) as file:
+            return int(file.read()) / 1000
+    except (OSError, ValueError):
+        return None
+
+
+def self_heating(cpu_c):
+    """°F the sensor reads high at this CPU temperature"""
+    if cpu_c is None:
+        return SELF_HEATING_DEFAULT
+    if isinstance(cpu_c, np.ndarray):
+        cpu, correction = zip(*SELF_HEATING)
+        return np.interp(cpu_c, cpu, correction)
+    # One reading, same as np.interp: flat past either end of the table
+    if cpu_c <= SELF_HEATING[0][0]:
+        return SELF_HEATING[0][1]
+    for (cpu_low, low), (cpu_high, high) in zip(SELF_HEATING,
+                                                 SELF_HEATING[1:]):
+        if cpu_c <= cpu_high:
+            fraction = (cpu_c - cpu_low) / (cpu_high - cpu_low)
+            return low + (high - low) * fraction
+    return SELF_HEATING[-1][1]
+
+
+def compensate_fahrenheit(fahrenheit, cpu_c=None):
+    """Take out the Raspberry Pi's heat from a temperature reading
+    Reads the CPU temperature now, or give cpu_c for saved readings"""
+    if cpu_c is None:
+        cpu_c = cpu_temperature()
+    return fahrenheit - self_heating(cpu_c)